@@ -0,0 +1,127 @@
+import sys
+import json
+import calculator
+import profiler
+from typing import Any, Dict, List, Optional, TextIO
+
+# JOB_SEPARATOR: the line that separates 2 jobs in a line-based job file
+JOB_SEPARATOR = "---"
+
+# MATRIX_START: the line that starts a new matrix in a line-based job file
+MATRIX_START = "matrix"
+
+# COMMENT_START: lines in a line-based job file that start with this are ignored
+COMMENT_START = "#"
+
+
+# read_jobs(text) Reads all the jobs from the text of a job file
+# note: the text is read as JSON if it starts with '[' or '{', otherwise
+#         it is read as a line-based job file
+#       a JSON job file is either a list of jobs or an object with the
+#         list of jobs under "jobs"
+def read_jobs(text: str) -> List[Dict[str, Any]]:
+  stripped = text.lstrip()
+
+  if (stripped.startswith("[") or stripped.startswith("{")):
+    jobs = json.loads(text)
+    if (isinstance(jobs, dict)):
+      jobs = jobs.get("jobs", [])
+    return jobs
+  else:
+    return read_line_jobs(text)
+
+
+# read_line_jobs(text) Reads all the jobs from a line-based job file
+# note: each job is written as
+#
+#         field: r
+#         operation: inv
+#         augmented: n
+#         matrix
+#         1, 2/3
+#         3, 4
+#
+#       where each "matrix" line starts a new matrix, the rows of an augumented
+#         matrix are written as "a, b | answer", as in 'calculator.row_entries',
+#         and jobs are separated by "---"
+#       lines that are not a "key: value" pair are the rows of the current matrix
+def read_line_jobs(text: str) -> List[Dict[str, Any]]:
+  jobs = []
+  job = {}
+  current_matrix = None
+
+  for line in text.splitlines():
+    line = line.strip()
+
+    if ((not line) or line.startswith(COMMENT_START)):
+      continue
+    elif (line == JOB_SEPARATOR):
+      if (job):
+        jobs.append(job)
+      job = {}
+      current_matrix = None
+    elif (line.lower() == MATRIX_START):
+      current_matrix = []
+      job.setdefault("matrices", []).append(current_matrix)
+    elif (":" in line):
+      key, value = line.split(":", 1)
+      job[key.strip().lower()] = value.strip()
+    elif (current_matrix is None):
+      current_matrix = [line]
+      job.setdefault("matrices", []).append(current_matrix)
+    else:
+      current_matrix.append(line)
+
+  if (job):
+    jobs.append(job)
+
+  return jobs
+
+
+# write_results(jobs, out, workers, profile) Runs every job in 'jobs' and writes each result
+#   as a single line of JSON to 'out'
+# effects: writes to 'out'
+# note: returns the number of jobs that could not be completed
+#       a job with an invalid input, whose calculation cannot be done or that
+#         stops with any other error fails without stopping the other jobs,
+#         as in 'calculator.Calculator.handle'
+#       if 'profile' is True, each result also has the report of 'profiler'
+#         for its job under "profile"
+def write_results(jobs: List[Dict[str, Any]], out: TextIO, workers: int = 1, profile: bool = False) -> int:
+  calc = calculator.Calculator(workers)
+
+  for i in range(len(jobs)):
+    if (profile):
+      with profiler.profiling():
+        result = calc.handle(jobs[i], i)
+      result["profile"] = profiler.report()
+    else:
+      result = calc.handle(jobs[i], i)
+
+    out.write(json.dumps(result) + "\n")
+
+  return calc.jobs_failed
+
+
+# run_batch(job_path, output_path, workers, profile) Runs every job in the job file at
+#   'job_path' and writes the results to the file at 'output_path'
+# effects: reads and writes files
+#          prints output
+# note: the results are written to standard output if no 'output_path' is given
+#       returns 0 if every job was completed and 1 otherwise
+def run_batch(job_path: str, output_path: Optional[str] = None, workers: int = 1, profile: bool = False) -> int:
+  try:
+    with open(job_path) as f:
+      jobs = read_jobs(f.read())
+  except (OSError, ValueError) as e:
+    print(f"\nERROR:\nThe job file ({job_path}) could not be read: {e}", file = sys.stderr)
+    return 1
+
+  if (output_path is None):
+    failed = write_results(jobs, sys.stdout, workers, profile)
+  else:
+    with open(output_path, "w") as out:
+      failed = write_results(jobs, out, workers, profile)
+
+  print(f"Completed {len(jobs) - failed} of {len(jobs)} jobs", file = sys.stderr)
+  return int(bool(failed))
@@ -0,0 +1,313 @@
+import io
+import sys
+import copy
+import json
+import time
+import random
+import platform
+import argparse
+import statistics
+import contextlib
+import tracemalloc
+import fraction as frac
+import matrix
+import modular
+import errors
+from typing import Any, Callable, Dict, List, Tuple
+
+# DEFAULT_SIZES: the number of rows and columns of the matrices benchmarked
+DEFAULT_SIZES = [4, 8, 16]
+
+# DEFAULT_DENSITIES: the share of the entries of each matrix that are not 0
+DEFAULT_DENSITIES = [0.25, 1.0]
+
+# DEFAULT_BITS: the number of bits in the numerators and denominators of
+#   the entries
+DEFAULT_BITS = [4, 32]
+
+# DEFAULT_REPEAT: the number of times each case is timed
+DEFAULT_REPEAT = 5
+
+# IND_MAX_SIZE: the biggest matrix that 'get_lin_indep_combo' is benchmarked on,
+#   since the number of independent sets grows exponentially with the size
+IND_MAX_SIZE = 10
+
+# KERNEL_CALLS: the number of calls timed at once for each scalar kernel
+KERNEL_CALLS = 1000
+
+# SINGULAR_TRIES: the number of random matrices tried before giving up on
+#   finding one that is invertible
+SINGULAR_TRIES = 20
+
+
+# random_entry(rng, field, bits) Makes a random fraction from 'field' whose
+#   numerators and denominators have at most 'bits' bits
+def random_entry(rng: random.Random, field: str, bits: int):
+  def part() -> Tuple[int, int]:
+    num = rng.getrandbits(bits) * rng.choice((-1, 1))
+    return (num, rng.getrandbits(bits) or 1)
+
+  if (field == frac.NumberType.RealNum.value):
+    return frac.RealFraction(*part())
+
+  real_num, real_denom = part()
+  im_num, im_denom = part()
+  return frac.reduce_complex(real_num * im_denom, im_num * real_denom, real_denom * im_denom)
+
+
+# random_matrix(rng, field, size, density, bits, augumented, invertible) Makes a
+#   random 'size' by 'size' matrix from 'field'
+# note: each entry is not 0 with a chance of 'density', except for the
+#         diagonal which is never 0
+#       if 'invertible' is True, matrices are made until one is invertible
+def random_matrix(rng: random.Random, field: str, size: int, density: float, bits: int,
+                  augumented: bool = False, invertible: bool = False) -> matrix.Matrix:
+  zero = frac.r_get_zero if (field == frac.NumberType.RealNum.value) else frac.c_get_zero
+
+  for _ in range(SINGULAR_TRIES):
+    rows = []
+    for i in range(size):
+      row = [random_entry(rng, field, bits) if (i == j or rng.random() < density) else zero()
+             for j in range(size)]
+      rows.append([e if (i != j or not e.is_zero()) else random_entry(rng, field, bits) for j, e in enumerate(row)])
+
+    m = matrix.from_rows(rows, field, augumented)
+    if (augumented):
+      for e in m.equations:
+        e.answer = random_entry(rng, field, bits)
+
+    if ((not invertible) or modular.modular_rank(rows, field) == size):
+      return m
+
+  return m
+
+
+# run_quietly(fn, args) Calls 'fn' with 'args' without showing what it prints
+# note: returns the result of 'fn', or None if it raised an 'errors.CalculatorError'
+def run_quietly(fn: Callable, args: tuple) -> Any:
+  with contextlib.redirect_stdout(io.StringIO()):
+    try:
+      return fn(*args)
+    except errors.CalculatorError:
+      return None
+
+
+# matrix_case(operation, rng, field, size, density, bits) Prepares the benchmark
+#   of 'operation' for a single case
+# note: returns the function to time and a function that makes a fresh copy
+#         of its arguments for each run, since some operations change them
+def matrix_case(operation: str, rng: random.Random, field: str, size: int, density: float,
+                bits: int) -> Tuple[Callable, Callable[[], tuple]]:
+  if (operation == "det"):
+    m = random_matrix(rng, field, size, density, bits)
+    return (matrix.det, lambda: (m,))
+
+  elif (operation == "gauss_jordan"):
+    m = random_matrix(rng, field, size, density, bits, True, True)
+    return (lambda a: a.gauss_jordan(False, False), lambda: (copy.deepcopy(m),))
+
+  elif (operation == "inverse"):
+    m = random_matrix(rng, field, size, density, bits, False, True)
+    return (lambda a: a.gauss_jordan(True, False), lambda: (copy.deepcopy(m),))
+
+  elif (operation == "m_multiply"):
+    a = random_matrix(rng, field, size, density, bits)
+    b = random_matrix(rng, field, size, density, bits)
+    return (matrix.m_multiply, lambda: (a, b))
+
+  elif (operation == "m_add"):
+    a = random_matrix(rng, field, size, density, bits)
+    b = random_matrix(rng, field, size, density, bits)
+    return (matrix.m_add, lambda: (a, b, "+"))
+
+  elif (operation == "get_cob_matrix"):
+    a = random_matrix(rng, field, size, density, bits, False, True)
+    b = random_matrix(rng, field, size, density, bits, False, True)
+
+    # every run factors the basis again instead of using the cached factorization
+    def prepare() -> tuple:
+      matrix.BASIS_REGISTRY.clear()
+      return (a, b)
+
+    return (matrix.get_cob_matrix, prepare)
+
+  elif (operation == "get_lin_indep_combo"):
+    m = random_matrix(rng, field, min(size, IND_MAX_SIZE), density, bits)
+    return (matrix.get_lin_indep_combo, lambda: (m, []))
+
+
+# MATRIX_OPERATIONS: the matrix operations that can be benchmarked
+MATRIX_OPERATIONS = ["det", "gauss_jordan", "inverse", "m_multiply", "m_add",
+                     "get_cob_matrix", "get_lin_indep_combo"]
+
+# KERNELS: the scalar kernels from 'fraction' that can be benchmarked, with the
+#   number of fractions each one takes
+KERNELS = {"add": 2, "multiply": 2, "divide": 2, "sub_product": 3}
+
+
+# kernel_case(kernel, rng, field, bits) Prepares the benchmark of a scalar
+#   kernel from 'fraction', which runs it 'KERNEL_CALLS' times
+def kernel_case(kernel: str, rng: random.Random, field: str, bits: int) -> Tuple[Callable, Callable[[], tuple]]:
+  prefix = "rf_" if (field == frac.NumberType.RealNum.value) else "cf_"
+  fn = getattr(frac, prefix + kernel)
+  count = KERNELS[kernel]
+
+  args = []
+  for _ in range(KERNEL_CALLS):
+    entries = [random_entry(rng, field, bits) for _ in range(count)]
+    # no division by 0
+    while (entries[-1].is_zero()):
+      entries[-1] = random_entry(rng, field, bits)
+    if (kernel == "add"):
+      entries.append("+")
+    args.append(tuple(entries))
+
+  def run_all(lo_args: list):
+    for a in lo_args:
+      fn(*a)
+
+  return (run_all, lambda: (args,))
+
+
+# time_case(fn, prepare, repeat) Times 'repeat' runs of 'fn' and measures the
+#   most memory used by a single run
+# note: the memory is measured on a separate run, since tracing the memory
+#         slows down every allocation
+def time_case(fn: Callable, prepare: Callable[[], tuple], repeat: int) -> Dict[str, Any]:
+  times = []
+  completed = True
+
+  for _ in range(repeat):
+    args = prepare()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+      try:
+        fn(*args)
+      except errors.CalculatorError:
+        completed = False
+    times.append(time.perf_counter() - start)
+
+  args = prepare()
+  tracemalloc.start()
+  run_quietly(fn, args)
+  peak = tracemalloc.get_traced_memory()[1]
+  tracemalloc.stop()
+
+  median = statistics.median(times)
+  return {"median_seconds": median, "min_seconds": min(times),
+          "ops_per_sec": (1 / median) if median else None, "peak_bytes": peak,
+          "repeat": repeat, "completed": completed}
+
+
+# run_benchmarks(operations, fields, sizes, densities, bits, repeat, seed) Runs
+#   every combination of the cases given
+# effects: prints output
+# note: the scalar kernels are named "kernel:<name>" in 'operations' and are
+#         only run once for each field and number of bits, and their
+#         'ops_per_sec' counts single calls
+def run_benchmarks(operations: List[str], fields: List[str], sizes: List[int], densities: List[float],
+                   bits: List[int], repeat: int = DEFAULT_REPEAT, seed: int = 0) -> List[Dict[str, Any]]:
+  results = []
+
+  for operation in operations:
+    for field in fields:
+      for b in bits:
+        if (operation.startswith("kernel:")):
+          cases = [(None, None)]
+        else:
+          cases = [(size, density) for size in sizes for density in densities]
+
+        for size, density in cases:
+          rng = random.Random(f"{seed}-{operation}-{field}-{b}-{size}-{density}")
+          if (size is None):
+            fn, prepare = kernel_case(operation.split(":", 1)[1], rng, field, b)
+          else:
+            fn, prepare = matrix_case(operation, rng, field, size, density, b)
+
+          result = {"operation": operation, "field": field, "size": size, "density": density, "bits": b}
+          result.update(time_case(fn, prepare, repeat))
+          if (size is None and result["ops_per_sec"] is not None):
+            result["ops_per_sec"] *= KERNEL_CALLS
+
+          print(f"{case_key(result)}: {result['ops_per_sec']:.6g} ops/sec, "
+                f"peak {result['peak_bytes'] / 1024:.1f} KiB", file = sys.stderr)
+          results.append(result)
+
+  return results
+
+
+# case_key(result) Gets the name of the case a result is for
+def case_key(result: Dict[str, Any]) -> str:
+  key = f"{result['operation']} {result['field']} bits={result['bits']}"
+  if (result["size"] is not None):
+    key += f" n={result['size']} density={result['density']}"
+  return key
+
+
+# compare_results(old, new, out) Writes the speedup of each case in 'new' over
+#   the same case in 'old'
+# effects: writes to 'out'
+def compare_results(old: Dict[str, Any], new: Dict[str, Any], out = sys.stdout):
+  old_results = {case_key(r): r for r in old["results"]}
+
+  out.write(f"{'case':<60} {'old ops/s':>12} {'new ops/s':>12} {'speedup':>8} {'memory':>8}\n")
+  for r in new["results"]:
+    key = case_key(r)
+    before = old_results.get(key)
+    if (before is None or not before["ops_per_sec"] or not r["ops_per_sec"]):
+      continue
+
+    speedup = r["ops_per_sec"] / before["ops_per_sec"]
+    memory = (r["peak_bytes"] / before["peak_bytes"]) if before["peak_bytes"] else 0
+    out.write(f"{key:<60} {before['ops_per_sec']:>12.4g} {r['ops_per_sec']:>12.4g} "
+              f"{speedup:>7.2f}x {memory:>7.2f}x\n")
+
+
+# parse_list(text, cast) Reads a comma separated list
+def parse_list(text: str, cast: Callable[[str], Any]) -> list:
+  return [cast(x.strip()) for x in text.split(",") if x.strip()]
+
+
+if __name__ == "__main__":
+  all_operations = MATRIX_OPERATIONS + [f"kernel:{k}" for k in KERNELS]
+
+  parser = argparse.ArgumentParser(description = "Benchmarks the core operations of the matrix calculator")
+  parser.add_argument("--operations", default = ",".join(all_operations),
+                      help = f"comma separated operations to run (default: {','.join(all_operations)})")
+  parser.add_argument("--fields", default = "r,c", help = "comma separated fields (default: r,c)")
+  parser.add_argument("--sizes", default = ",".join(map(str, DEFAULT_SIZES)),
+                      help = "comma separated matrix sizes (default: %(default)s)")
+  parser.add_argument("--densities", default = ",".join(map(str, DEFAULT_DENSITIES)),
+                      help = "comma separated shares of non-zero entries (default: %(default)s)")
+  parser.add_argument("--bits", default = ",".join(map(str, DEFAULT_BITS)),
+                      help = "comma separated bit lengths of the entries (default: %(default)s)")
+  parser.add_argument("--repeat", type = int, default = DEFAULT_REPEAT,
+                      help = "number of times each case is timed (default: %(default)s)")
+  parser.add_argument("--seed", type = int, default = 0, help = "seed of the random matrices (default: 0)")
+  parser.add_argument("--label", default = "", help = "name stored with the results, such as a version")
+  parser.add_argument("--output", metavar = "OUT", help = "file the results are written to as JSON")
+  parser.add_argument("--compare", metavar = "OLD", help = "JSON results of an earlier run to compare with")
+  args = parser.parse_args()
+
+  operations = parse_list(args.operations, str)
+  unknown = [op for op in operations if op not in all_operations]
+  if (unknown):
+    parser.error(f"unknown operations: {', '.join(unknown)}")
+
+  results = run_benchmarks(operations, parse_list(args.fields, str), parse_list(args.sizes, int),
+                           parse_list(args.densities, float), parse_list(args.bits, int),
+                           max(1, args.repeat), args.seed)
+  report = {"label": args.label, "python": platform.python_version(), "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"), "seed": args.seed, "results": results}
+
+  if (args.output):
+    with open(args.output, "w") as f:
+      json.dump(report, f, indent = 2)
+  else:
+    json.dump(report, sys.stdout, indent = 2)
+    print()
+
+  # the comparison goes to standard error when the results are on standard output
+  if (args.compare):
+    with open(args.compare) as f:
+      compare_results(json.load(f), report, sys.stdout if args.output else sys.stderr)
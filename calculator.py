@@ -0,0 +1,287 @@
+import json
+import matrix
+import validate
+import numeric
+import parsing
+import operations
+import errors
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple
+
+JOB_ERR_CODE = 5
+
+# INTERNAL_ERROR: the type of a failed job whose error is not an
+#   'errors.CalculatorError'
+INTERNAL_ERROR = "InternalError"
+
+# ANSWER_SEPARATOR: separates the coefficients of a row from its answer
+ANSWER_SEPARATOR = "|"
+
+
+# job_value(job, key, job_id) Gets the value of 'key' from 'job'
+# effects: raises an 'errors.InputError' if 'job' does not have 'key'
+def job_value(job: Dict[str, Any], key: str, job_id: Any) -> Any:
+  if (key not in job):
+    validate.validation_error(JOB_ERR_CODE, job = str(job_id), value = f"a {key}")
+
+  return job[key]
+
+
+# flag_value(value) Reads a yes or no value from a job
+# effects: may raise an 'errors.InputError' if the value given is not valid
+def flag_value(value: Any) -> bool:
+  if (isinstance(value, bool)):
+    return value
+
+  value = validate.validate_str(str(value).strip().lower(), parsing.YES_NO_VALS)
+  return (value == parsing.YES_NO_VALS[0])
+
+
+# job_is_augumented(job) Determines if the matrices of 'job' are augumented
+# effects: may raise an 'errors.InputError' if the value given is not valid
+def job_is_augumented(job: Dict[str, Any]) -> bool:
+  return flag_value(job.get("augmented", job.get("augumented", False)))
+
+
+# find_sets(operation, m, limit, maximal) Lazily finds the bases or independent sets
+#   of 'm', stopping after 'limit' sets and only finding the sets that are not part
+#   of a bigger set if 'maximal' is True
+def find_sets(operation: str, m: matrix.Matrix, limit: Optional[int] = None,
+              maximal: bool = False) -> Iterator[List[int]]:
+  if (operation == matrix.OperationSym.Basis.value):
+    return matrix.iter_lin_indep(m, m.rows, limit)
+  else:
+    return matrix.iter_lin_indep_combo(m, limit, maximal)
+
+
+# row_entries(row, answer) Splits a row into the text of its coefficients and
+#   its answer
+# effects: may raise an 'errors.InputError' if 'row' is not a row
+# note: a row is either a list of entries or a single line of comma separated
+#         entries, where the answer may be given after a '|'
+def row_entries(row: Any, answer: Any = None) -> Tuple[List[str], Optional[str]]:
+  if (not isinstance(row, (str, list))):
+    validate.validation_error(1, input = json.dumps(row), type_article = "a", type = "row of entries")
+
+  if (isinstance(row, str)):
+    row_pts = row.split(ANSWER_SEPARATOR)
+    lo_coefficients = [c.strip() for c in row_pts[0].split(",")]
+    if (len(row_pts) > 1):
+      answer = row_pts[1]
+  else:
+    lo_coefficients = [str(c).strip() for c in row]
+
+  if (answer is not None):
+    answer = str(answer).strip()
+
+  return (lo_coefficients, answer)
+
+
+# read_matrix(rows, field, is_augumented, answers, job_id) Makes a matrix from
+#   'field' with the rows in 'rows'
+# requires: 'field' is one of the values in 'parsing.FIELD_VALS'
+# effects: may raise an 'errors.InputError' if there is an invalid input
+# note: each row is given as in 'row_entries', and the answers of an augumented
+#         matrix may also be given in 'answers' instead
+def read_matrix(rows: List[Any], field: str, is_augumented: bool = False,
+                answers: Optional[List[Any]] = None, job_id: Any = 1):
+  if (not isinstance(rows, list) or not rows):
+    validate.validation_error(JOB_ERR_CODE, job = str(job_id), value = "a list of rows for each matrix")
+
+  if (answers is None):
+    answers = [None] * len(rows)
+  elif (not isinstance(answers, list) or len(answers) != len(rows)):
+    validate.validation_error(JOB_ERR_CODE, job = str(job_id), value = "an answer for each equation")
+
+  lo_coefficients = []
+  lo_answers = []
+  for row, answer in zip(rows, answers):
+    temp_co, temp_ans = row_entries(row, answer)
+    if (is_augumented and temp_ans is None):
+      validate.validation_error(JOB_ERR_CODE, job = str(job_id), value = "an answer for each equation")
+
+    lo_coefficients.append(temp_co)
+    lo_answers.append(temp_ans)
+
+  return parsing.make_matrix(lo_coefficients, lo_answers, field, is_augumented)
+
+
+# job_matrix(entry, field, is_augumented, job_id) Makes a matrix from an entry
+#   in the "matrices" of a job
+# note: 'entry' is either a list of rows or an object with its rows under "rows"
+#         and, for augumented matrices, its answers under "answers"
+# effects: may raise an 'errors.InputError' if there is an invalid input
+def job_matrix(entry: Any, field: str, is_augumented: bool, job_id: Any):
+  if (isinstance(entry, dict)):
+    return read_matrix(job_value(entry, "rows", job_id), field, is_augumented, entry.get("answers"), job_id)
+  else:
+    return read_matrix(entry, field, is_augumented, None, job_id)
+
+
+# entry_str(n, field) Formats a single entry from 'field'
+def entry_str(n: Any, field: str) -> str:
+  if (numeric.is_numeric(field)):
+    return numeric.num_str(n)
+  else:
+    return n.frac_str()
+
+
+# matrix_result(m, field, with_inverse) Formats the entries of the matrix 'm'
+#   and of its inverse if 'with_inverse' is True
+def matrix_result(m: Any, field: str, with_inverse: bool = False) -> Dict[str, Any]:
+  if (isinstance(m, numeric.NumericMatrix)):
+    rows = m.values
+    answers = m.answers
+    inverse = m.inverse
+  else:
+    rows = [e.coefficients for e in m.equations]
+    answers = [e.answer for e in m.equations]
+    inverse = [e.coefficients for e in m.inv_equations]
+
+  result = {"rows": [[entry_str(n, field) for n in r] for r in rows]}
+  if (m.augumented):
+    result["answers"] = [entry_str(n, field) for n in answers]
+  if (with_inverse):
+    result["inverse"] = [[entry_str(n, field) for n in r] for r in inverse]
+
+  return result
+
+
+# format_result(operation, lo_matrices, result, field) Formats the result of
+#   'operation' given by 'operations.run_operation'
+def format_result(operation: str, lo_matrices: list, result: Any, field: str) -> Any:
+  if (operation == matrix.OperationSym.Determinant.value):
+    return entry_str(result, field)
+  elif (operation == matrix.OperationSym.Basis.value or
+        operation == matrix.OperationSym.Independent.value):
+    return result
+  else:
+    return matrix_result(result, field, operation == matrix.OperationSym.Inverse.value)
+
+
+# calculate(operation, lo_rows, field, is_augumented, constant, limit, maximal, workers,
+#   job_id) Does 'operation' on the matrices whose rows are given in 'lo_rows'
+# effects: may raise an 'errors.CalculatorError' if there is an invalid input
+#            or if the operation cannot be done
+# note: each matrix is given as in 'job_matrix', and the result is formatted
+#         as in 'format_result', so it can be written as JSON
+#       nothing is printed and no input is changed, so it can be called many
+#         times from the same process
+#       'constant' is only used for scalar multiplication, and 'limit' and
+#         'maximal' are only used for bases and independent sets, as in 'find_sets',
+#         where the sets are found lazily if either one is given
+#       'workers' is the number of processes used to search for bases and
+#         independent sets
+#       'job_id' is the job named in the messages of the errors raised
+def calculate(operation: str, lo_rows: List[Any], field: str = "r", is_augumented: bool = False,
+              constant: Any = None, limit: Optional[int] = None, maximal: Optional[bool] = None,
+              workers: int = 1, job_id: Any = 1) -> Any:
+  field = validate.validate_str(str(field).strip().lower(), parsing.FIELD_VALS)
+  if (numeric.is_numeric(field)):
+    numeric.require_numpy()
+
+  if (not isinstance(lo_rows, list)):
+    validate.validation_error(JOB_ERR_CODE, job = str(job_id), value = "a list of matrices")
+
+  lo_matrices = [job_matrix(m, field, is_augumented, job_id) for m in lo_rows]
+
+  valid_operations = operations.get_valid_operations(len(lo_matrices), is_augumented, field)
+  operation = validate.validate_str(str(operation).strip().lower(), valid_operations)
+
+  if (operation == matrix.OperationSym.ScalarMultiply.value):
+    if (constant is None):
+      validate.validation_error(JOB_ERR_CODE, job = str(job_id), value = "a constant")
+    constant = parsing.entry_input(str(constant).strip(), field)
+
+  if (operation in operations.EXACT_OPERATIONS and (limit is not None or maximal is not None)):
+    if (limit is not None):
+      limit = validate.validate_nat(limit)
+    result = list(find_sets(operation, lo_matrices[0], limit, bool(maximal)))
+  else:
+    result = operations.run_operation(operation, lo_matrices, constant, False, workers)
+
+  return format_result(operation, lo_matrices, result, field)
+
+
+# Calculator: A calculator that is kept running to do many jobs, so that each
+#   job does not need to start the program again
+# note: a job is an object with the "field", "operation" and "matrices" of the
+#         calculation, as in a JSON job file, and may also have its "id",
+#         "augmented", "constant", "limit" and "maximal"
+#       the bases used for changes of basis stay cached between jobs
+class Calculator:
+  def __init__(self, workers: int = 1):
+    self.workers = validate.validate_nat(workers)
+    self.jobs_done = 0
+    self.jobs_failed = 0
+
+
+  # run_job(job, job_id) Does the calculation of 'job'
+  # effects: may raise an 'errors.CalculatorError' if there is an invalid input
+  #            or if the calculation cannot be done
+  # note: returns the operation done and its formatted result
+  def run_job(self, job: Dict[str, Any], job_id: Any = 1) -> Tuple[str, Any]:
+    field = job_value(job, "field", job_id)
+    is_augumented = job_is_augumented(job)
+    lo_rows = job_value(job, "matrices", job_id)
+    operation = str(job_value(job, "operation", job_id)).strip().lower()
+    maximal = flag_value(job["maximal"]) if ("maximal" in job) else None
+
+    result = calculate(operation, lo_rows, field, is_augumented, job.get("constant"), job.get("limit"),
+                       maximal, self.workers, job_id)
+    return (operation, result)
+
+
+  # handle(job, index) Does the calculation of the 'index'th job, 'job', and
+  #   gets its result as an object that can be written as JSON
+  # effects: modifies 'self.jobs_done' and 'self.jobs_failed'
+  # note: the job fails, instead of raising an error, if there is an invalid input
+  #         or if the calculation cannot be done
+  #       any other error, which is a bug, also only fails the job, with the
+  #         type 'INTERNAL_ERROR', so the jobs after it are still done
+  def handle(self, job: Any, index: int = 0) -> Dict[str, Any]:
+    job_id = job.get("id", index + 1) if isinstance(job, dict) else index + 1
+    self.jobs_done += 1
+
+    try:
+      if (not isinstance(job, dict)):
+        raise errors.InputError(f"ERROR:\nThe job ({job_id}) is not an object")
+
+      operation, result = self.run_job(job, job_id)
+    except errors.CalculatorError as e:
+      self.jobs_failed += 1
+      return {"id": job_id, "status": "error", "error": e.summary(),
+              "type": type(e).__name__}
+    except Exception as e:
+      self.jobs_failed += 1
+      return {"id": job_id, "status": "error", "error": f"ERROR: {type(e).__name__}: {e}",
+              "type": INTERNAL_ERROR}
+
+    return {"id": job_id, "status": "ok", "operation": operation, "result": result}
+
+
+  # serve(jobs_in, results_out) Does each job read from 'jobs_in', with one JSON
+  #   job on each line, until 'jobs_in' ends
+  # effects: reads from 'jobs_in'
+  #          writes to 'results_out'
+  # note: the result of each job is written, as a single line of JSON, as soon
+  #         as the job is done
+  #       lines that are not valid JSON give a failed result instead of stopping
+  def serve(self, jobs_in: TextIO, results_out: TextIO):
+    index = 0
+    for line in jobs_in:
+      if (not line.strip()):
+        continue
+
+      try:
+        job = json.loads(line)
+      except ValueError as e:
+        self.jobs_done += 1
+        self.jobs_failed += 1
+        result = {"id": index + 1, "status": "error", "type": errors.InputError.__name__,
+                  "error": f"ERROR: The job could not be read: {e}"}
+      else:
+        result = self.handle(job, index)
+
+      results_out.write(json.dumps(result) + "\n")
+      results_out.flush()
+      index += 1
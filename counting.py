@@ -1,26 +1,97 @@
-from typing import List, Any
+import math
+from typing import Iterator, List, Any, Optional
 
-# combination(arr, n, r, result) Stores all combinations from 'arr'
-#   with 'r'  elements in 'result'
+# combination(arr, n, r) Gets all combinations from 'arr'
+#   with 'r' elements, in lexicographic order
+# note: the combinations are made by 'iter_combinations', which can be used
+#         instead to go through them without keeping all of them
 def combination(arr: List[Any], n: int, r: int) -> List[List[Any]]:
-  result = []
-  data = [0]*r; 
-  result = combinationUtil(arr, data, 0, n - 1, 0, r, result); 
-  return result
-
-
-# combinationUtil(arr, data, start, end, index,r, result) Stores 
-#   current combination into 'result'
-def combinationUtil(arr: List[Any], data: List[Any], start: int, end: int, index: int, r: int, result: List[Any]) -> List[List[Any]]:         
-  if (index == r):  
-    new_data = data.copy()
-    result.append(new_data)
-    return result; 
-  
-  i = start;  
-  while(i <= end and end - i + 1 >= r - index): 
-    data[index] = arr[i]; 
-    result = combinationUtil(arr, data, i + 1, end, index + 1, r, result);
-    i += 1; 
-
-  return result
+  return [[arr[i] for i in c] for c in iter_combinations(n, r)]
+
+
+# combination_count(n, r) Gets the number of combinations of 'r'
+#   elements from 'n' elements
+def combination_count(n: int, r: int) -> int:
+  if (r < 0 or r > n):
+    return 0
+
+  return math.comb(n, r)
+
+
+# next_combination(combo, n) Changes 'combo' to the next combination of
+#   indices from 0 to n - 1 in lexicographic order
+# requires: 'combo' is increasing and every index is smaller than 'n'
+# effects: modifies 'combo'
+# note: returns False, without changing 'combo', if 'combo' is the last
+#         combination
+#       takes O(1) steps on average over all the combinations
+def next_combination(combo: List[int], n: int) -> bool:
+  r = len(combo)
+  i = r - 1
+
+  while (i >= 0 and combo[i] == n - r + i):
+    i -= 1
+
+  if (i < 0):
+    return False
+
+  combo[i] += 1
+  for j in range(i + 1, r):
+    combo[j] = combo[j - 1] + 1
+
+  return True
+
+
+# rank_combination(combo, n) Gets the position of 'combo' among all the
+#   combinations of indices from 0 to n - 1 with len(combo) indices, in
+#   lexicographic order
+# requires: 'combo' is increasing and every index is smaller than 'n'
+def rank_combination(combo: List[int], n: int) -> int:
+  r = len(combo)
+  rank = combination_count(n, r) - 1
+
+  for i in range(r):
+    rank -= combination_count(n - 1 - combo[i], r - i)
+
+  return rank
+
+
+# unrank_combination(rank, n, r) Gets the combination at position 'rank'
+#   among all the combinations of 'r' indices from 0 to n - 1, in
+#   lexicographic order
+# requires: 0 <= rank < combination_count(n, r)
+def unrank_combination(rank: int, n: int, r: int) -> List[int]:
+  combo = []
+  current = 0
+
+  for i in range(r):
+    while (True):
+      count = combination_count(n - 1 - current, r - 1 - i)
+      if (rank < count):
+        break
+
+      rank -= count
+      current += 1
+
+    combo.append(current)
+    current += 1
+
+  return combo
+
+
+# iter_combinations(n, r, start, stop) Lazily goes through the combinations
+#   of 'r' indices from 0 to n - 1 in lexicographic order, starting from the
+#   combination at position 'start' and stopping before position 'stop'
+# note: each combination is given as a new list
+def iter_combinations(n: int, r: int, start: int = 0, stop: Optional[int] = None) -> Iterator[List[int]]:
+  total = combination_count(n, r)
+  if (stop is None or stop > total):
+    stop = total
+
+  if (start >= stop):
+    return
+
+  combo = unrank_combination(start, n, r)
+  for _ in range(stop - start):
+    yield combo.copy()
+    next_combination(combo, n)
@@ -0,0 +1,490 @@
+import math
+import fraction as frac
+import errors
+from typing import Iterator, List, Tuple, Union
+
+
+# r_reduce(num, denom) Reduces the fraction num/denom to its lowest form
+#   with the negative sign on the numerator
+# requires: 'denom' is not 0
+def r_reduce(num: int, denom: int) -> Tuple[int, int]:
+  if (denom < 0):
+    num = -num
+    denom = -denom
+
+  gcd_val = math.gcd(num, denom)
+  if (gcd_val != 1):
+    num //= gcd_val
+    denom //= gcd_val
+
+  return (num, denom)
+
+
+# r_add(a_num, a_denom, b_num, b_denom) Computes a + b for the fractions
+#   a_num/a_denom and b_num/b_denom
+def r_add(a_num: int, a_denom: int, b_num: int, b_denom: int) -> Tuple[int, int]:
+  if (not b_num):
+    return (a_num, a_denom)
+  elif (not a_num):
+    return (b_num, b_denom)
+  elif (a_denom == b_denom):
+    return r_reduce(a_num + b_num, a_denom)
+  else:
+    return r_reduce(a_num * b_denom + b_num * a_denom, a_denom * b_denom)
+
+
+# r_multiply(a_num, a_denom, b_num, b_denom) Computes a * b for the fractions
+#   a_num/a_denom and b_num/b_denom
+def r_multiply(a_num: int, a_denom: int, b_num: int, b_denom: int) -> Tuple[int, int]:
+  if ((not a_num) or (not b_num)):
+    return (0, 1)
+
+  gcd_1 = math.gcd(a_num, b_denom)
+  gcd_2 = math.gcd(b_num, a_denom)
+  return ((a_num // gcd_1) * (b_num // gcd_2), (a_denom // gcd_2) * (b_denom // gcd_1))
+
+
+# r_sub_product(a_num, a_denom, f_num, f_denom, b_num, b_denom) Computes
+#   a - f * b for the fractions a, f and b
+def r_sub_product(a_num: int, a_denom: int, f_num: int, f_denom: int,
+                  b_num: int, b_denom: int) -> Tuple[int, int]:
+  if ((not f_num) or (not b_num)):
+    return (a_num, a_denom)
+
+  product_num = f_num * b_num
+  product_denom = f_denom * b_denom
+  return r_reduce(a_num * product_denom - product_num * a_denom, a_denom * product_denom)
+
+
+# c_multiply(a, b) Computes a * b for the complex fractions 'a' and 'b'
+# note: a complex fraction is stored as the tuple
+#         (real num, real denom, imaginary num, imaginary denom)
+def c_multiply(a: Tuple[int, int, int, int], b: Tuple[int, int, int, int]) -> Tuple[int, int, int, int]:
+  real_part = r_add(*r_multiply(a[0], a[1], b[0], b[1]), *r_multiply(-a[2], a[3], b[2], b[3]))
+  imaginary_part = r_add(*r_multiply(a[0], a[1], b[2], b[3]), *r_multiply(a[2], a[3], b[0], b[1]))
+  return (real_part[0], real_part[1], imaginary_part[0], imaginary_part[1])
+
+
+# c_reciprocal(a) Computes 1 / a for the complex fraction 'a'
+# requires: 'a' is not 0
+def c_reciprocal(a: Tuple[int, int, int, int]) -> Tuple[int, int, int, int]:
+  norm = r_add(*r_multiply(a[0], a[1], a[0], a[1]), *r_multiply(a[2], a[3], a[2], a[3]))
+  real_part = r_reduce(a[0] * norm[1], a[1] * norm[0])
+  imaginary_part = r_reduce(-a[2] * norm[1], a[3] * norm[0])
+  return (real_part[0], real_part[1], imaginary_part[0], imaginary_part[1])
+
+
+# DenseView: A view of a row, a column or the augumented column of a
+#   DenseMatrix that reads and writes directly into its storage
+class DenseView:
+  def __init__(self, matrix: "DenseMatrix", start: int, step: int, length: int):
+    self.matrix = matrix
+    self.start = start
+    self.step = step
+    self.length = length
+
+
+  def __len__(self) -> int:
+    return self.length
+
+
+  def __getitem__(self, index: int) -> Union[frac.RealFraction, frac.ComplexFraction]:
+    return self.matrix.get_at(self.position(index))
+
+
+  def __setitem__(self, index: int, value: Union[frac.RealFraction, frac.ComplexFraction]):
+    self.matrix.set_at(self.position(index), value)
+
+
+  def __iter__(self) -> Iterator[Union[frac.RealFraction, frac.ComplexFraction]]:
+    for i in range(self.length):
+      yield self.matrix.get_at(self.start + i * self.step)
+
+
+  # position(index) Gets the position in the storage of the 'index'th
+  #   entry in the view
+  # requires: -len(self) <= index < len(self)
+  def position(self, index: int) -> int:
+    if (index < 0):
+      index += self.length
+
+    if (index < 0 or index >= self.length):
+      raise IndexError("DenseView index out of range")
+
+    return self.start + index * self.step
+
+
+
+# DenseMatrix: A matrix whose entries are stored as integer numerators and
+#   denominators in contiguous row-major arrays
+# note: each row holds 'cols' coefficients followed by its answer, so
+#         the row-major stride is 'cols' + 1
+#       complex matrices keep the imaginary parts in 'im_nums' and 'im_denoms'
+class DenseMatrix:
+  def __init__(self, rows: int, cols: int, num_type: frac.NumberType, augumented: bool = True):
+    self.rows = rows
+    self.cols = cols
+    self.stride = cols + 1
+    self.num_type = num_type
+    self.augumented = augumented
+    self.pivots = 0
+    self.pivot_vects = []
+
+    size = rows * self.stride
+    self.nums = [0] * size
+    self.denoms = [1] * size
+    self.im_nums = []
+    self.im_denoms = []
+
+    if (num_type == frac.NumberType.ComplexNum.value):
+      self.im_nums = [0] * size
+      self.im_denoms = [1] * size
+
+
+  # is_square() Determines if the matrix is a square matrix
+  def is_square(self) -> bool:
+    return (self.rows == self.cols)
+
+
+  # is_complex() Determines if the entries of the matrix are complex fractions
+  def is_complex(self) -> bool:
+    return (self.num_type == frac.NumberType.ComplexNum.value)
+
+
+  # get_at(pos) Gets the entry stored at position 'pos'
+  # requires: 0 <= pos < len(self.nums)
+  def get_at(self, pos: int) -> Union[frac.RealFraction, frac.ComplexFraction]:
+    real_part = frac.make_real(self.nums[pos], self.denoms[pos])
+
+    if (self.is_complex()):
+      return frac.ComplexFraction(real_part, frac.make_real(self.im_nums[pos], self.im_denoms[pos]), True)
+    else:
+      return real_part
+
+
+  # set_at(pos, value) Stores 'value' at position 'pos'
+  # requires: 0 <= pos < len(self.nums)
+  # effects: modifies the storage of the matrix
+  def set_at(self, pos: int, value: Union[frac.RealFraction, frac.ComplexFraction]):
+    if (self.is_complex()):
+      self.nums[pos] = value.r.num
+      self.denoms[pos] = value.r.denom
+      self.im_nums[pos] = value.i.num
+      self.im_denoms[pos] = value.i.denom
+    else:
+      self.nums[pos] = value.num
+      self.denoms[pos] = value.denom
+
+
+  # entry(row, col) Gets the entry at 'row' and 'col'
+  # requires: 0 <= row < self.rows
+  #           0 <= col <= self.cols, where col = self.cols is the answer
+  def entry(self, row: int, col: int) -> Union[frac.RealFraction, frac.ComplexFraction]:
+    return self.get_at(row * self.stride + col)
+
+
+  # get_row(row) Gets a view of the coefficients in 'row'
+  # requires: 0 <= row < self.rows
+  def get_row(self, row: int) -> DenseView:
+    return DenseView(self, row * self.stride, 1, self.cols)
+
+
+  # get_column(col) Gets a view of the entries in column 'col'
+  # requires: 0 <= col < self.cols
+  def get_column(self, col: int) -> DenseView:
+    return DenseView(self, col, self.stride, self.rows)
+
+
+  # get_answers() Gets a view of the augumented column
+  def get_answers(self) -> DenseView:
+    return DenseView(self, self.cols, self.stride, self.rows)
+
+
+  # tuple_at(pos) Gets the entry stored at position 'pos' as integers
+  def tuple_at(self, pos: int) -> Tuple[int, ...]:
+    if (self.is_complex()):
+      return (self.nums[pos], self.denoms[pos], self.im_nums[pos], self.im_denoms[pos])
+    else:
+      return (self.nums[pos], self.denoms[pos])
+
+
+  # is_zero_at(pos) Determines if the entry stored at 'pos' is 0
+  def is_zero_at(self, pos: int) -> bool:
+    return (not self.nums[pos]) and ((not self.im_nums) or (not self.im_nums[pos]))
+
+
+  # swap_rows(row_1, row_2) Swaps 2 rows, including their answers
+  # effects: modifies the storage of the matrix
+  def swap_rows(self, row_1: int, row_2: int):
+    stride = self.stride
+    a = slice(row_1 * stride, (row_1 + 1) * stride)
+    b = slice(row_2 * stride, (row_2 + 1) * stride)
+
+    arrays = [self.nums, self.denoms]
+    if (self.is_complex()):
+      arrays += [self.im_nums, self.im_denoms]
+
+    for arr in arrays:
+      arr[a], arr[b] = arr[b], arr[a]
+
+
+  # scale_row(row, factor) Multiplies every entry in 'row' by 'factor'
+  # requires: 'factor' is a tuple given by 'tuple_at'
+  # effects: modifies the storage of the matrix
+  def scale_row(self, row: int, factor: Tuple[int, ...]):
+    nums = self.nums
+    denoms = self.denoms
+    positions = range(row * self.stride, (row + 1) * self.stride)
+
+    if (self.is_complex()):
+      for pos in positions:
+        nums[pos], denoms[pos], self.im_nums[pos], self.im_denoms[pos] = c_multiply(factor, self.tuple_at(pos))
+    else:
+      f_num, f_denom = factor
+      for pos in positions:
+        if (nums[pos]):
+          nums[pos], denoms[pos] = r_multiply(f_num, f_denom, nums[pos], denoms[pos])
+
+
+  # subtract_row(row, factor, pivot_row) Computes row - factor * pivot_row
+  #   and stores the result in 'row'
+  # requires: 'factor' is a tuple given by 'tuple_at'
+  # effects: modifies the storage of the matrix
+  def subtract_row(self, row: int, factor: Tuple[int, ...], pivot_row: int):
+    nums = self.nums
+    denoms = self.denoms
+    offset = (pivot_row - row) * self.stride
+    positions = range(row * self.stride, (row + 1) * self.stride)
+
+    if (self.is_complex()):
+      im_nums = self.im_nums
+      im_denoms = self.im_denoms
+      for pos in positions:
+        src = pos + offset
+        if (self.is_zero_at(src)):
+          continue
+
+        product = c_multiply(factor, self.tuple_at(src))
+        nums[pos], denoms[pos] = r_add(nums[pos], denoms[pos], -product[0], product[1])
+        im_nums[pos], im_denoms[pos] = r_add(im_nums[pos], im_denoms[pos], -product[2], product[3])
+    else:
+      f_num, f_denom = factor
+      for pos in positions:
+        src_num = nums[pos + offset]
+        if (src_num):
+          nums[pos], denoms[pos] = r_sub_product(nums[pos], denoms[pos], f_num, f_denom,
+                                                 src_num, denoms[pos + offset])
+
+
+  # row_is_trivial(row, check_right) Determines whether all the coefficients
+  #   of 'row' are 0
+  def row_is_trivial(self, row: int, check_right: bool = False) -> bool:
+    start = row * self.stride
+    end = start + self.stride if check_right else start + self.cols
+
+    for pos in range(start, end):
+      if (not self.is_zero_at(pos)):
+        return False
+
+    return True
+
+
+  # dense_err(err_code) error message about the dense matrix
+  # requires: 1 <= err_code <= 3
+  # effects: raises an 'errors.MatrixError'
+  def dense_err(self, err_code: int, row: int = 0):
+    message = "ERROR: "
+    if (err_code == 1):
+      message += f"Equation {row + 1} is not consistent"
+    elif (err_code == 2):
+      message += "The Following Matrix is not a square matrix"
+    elif (err_code == 3):
+      message += "The Following Matrix is Singular (Not Invertible)"
+
+    raise errors.MATRIX_ERRORS[err_code](f"{message}\n{errors.printed(self.print_matrix)}", err_code)
+
+
+  # gauss_jordan(get_inv, verbose, companion) Reduces the matrix to its reduced
+  #   row echelon form directly on its storage
+  # requires: 'companion' has the same number of rows as the matrix
+  # effects: modifies the storage of the matrix and of 'companion'
+  #          may print output
+  # note: every row operation is also applied to 'companion', which starts as
+  #         the identity matrix when 'get_inv' is True and none is given, so
+  #         that the inverse is returned
+  def gauss_jordan(self, get_inv: bool = False, verbose: bool = True,
+                   companion: "DenseMatrix" = None) -> "DenseMatrix":
+    inverse = companion
+    if (get_inv):
+      if (not self.is_square() or self.augumented):
+        self.dense_err(2)
+      if (inverse is None):
+        inverse = identity(self.rows, self.num_type)
+
+    if (verbose):
+      print("\n------- Gauss-Jordan (Dense) ---------\n")
+      self.print_matrix()
+
+    self.pivots = 0
+    self.pivot_vects = []
+    pivot_row = 0
+
+    for col in range(self.cols):
+      if (pivot_row >= self.rows):
+        break
+
+      found_row = None
+      for i in range(pivot_row, self.rows):
+        if (not self.is_zero_at(i * self.stride + col)):
+          found_row = i
+          break
+
+      if (found_row is None):
+        continue
+
+      if (found_row != pivot_row):
+        self.swap_rows(found_row, pivot_row)
+        if (inverse is not None):
+          inverse.swap_rows(found_row, pivot_row)
+
+      pivot = self.tuple_at(pivot_row * self.stride + col)
+      if (self.is_complex()):
+        factor = c_reciprocal(pivot)
+      else:
+        factor = r_reduce(pivot[1], pivot[0])
+
+      self.scale_row(pivot_row, factor)
+      if (inverse is not None):
+        inverse.scale_row(pivot_row, factor)
+
+      for i in range(self.rows):
+        pos = i * self.stride + col
+        if (i != pivot_row and not self.is_zero_at(pos)):
+          factor = self.tuple_at(pos)
+          self.subtract_row(i, factor, pivot_row)
+          if (inverse is not None):
+            inverse.subtract_row(i, factor, pivot_row)
+
+      self.pivots += 1
+      self.pivot_vects.append(col)
+      pivot_row += 1
+
+    for i in range(pivot_row, self.rows):
+      if (not self.row_is_trivial(i, True)):
+        self.dense_err(1, i)
+
+    if (get_inv and self.pivots != self.rows):
+      self.dense_err(3)
+
+    if (verbose):
+      print()
+      self.print_matrix()
+
+    return inverse
+
+
+  # print_matrix() Prints out the matrix
+  # effects: prints output
+  def print_matrix(self):
+    for i in range(self.rows):
+      for j in range(self.cols):
+        self.entry(i, j).print_frac()
+        if (j < self.cols - 1):
+          print(" , ", end="")
+
+      if (self.augumented):
+        print("\t|\t", end="")
+        self.entry(i, self.cols).print_frac()
+      print("")
+
+
+
+# identity(size, num_type) Makes the dense identity matrix with 'size' rows
+def identity(size: int, num_type: frac.NumberType) -> DenseMatrix:
+  result = DenseMatrix(size, size, num_type, False)
+  for i in range(size):
+    result.nums[i * result.stride + i] = 1
+
+  return result
+
+
+# from_rows(rows, answers, num_type, augumented) Makes a DenseMatrix from the
+#   lists of coefficients in 'rows' and the answers in 'answers'
+# requires: 'rows' is not empty and every row has the same length
+def from_rows(rows: Union[List[List[frac.RealFraction]], List[List[frac.ComplexFraction]]],
+              answers: List[Union[frac.RealFraction, frac.ComplexFraction]],
+              num_type: frac.NumberType, augumented: bool = True) -> DenseMatrix:
+  result = DenseMatrix(len(rows), len(rows[0]), num_type, augumented)
+
+  for i in range(len(rows)):
+    start = i * result.stride
+    for j in range(len(rows[i])):
+      result.set_at(start + j, rows[i][j])
+
+    if (augumented and answers):
+      result.set_at(start + result.cols, answers[i])
+
+  return result
+
+
+# d_add(a, b, op) Adds or subtracts 2 dense matrices
+# requires: 'op' is either "+" or "-"
+#           'a' and 'b' have the same size
+def d_add(a: DenseMatrix, b: DenseMatrix, op: str) -> DenseMatrix:
+  result = DenseMatrix(a.rows, a.cols, a.num_type, a.augumented)
+  sign = -1 if (op == "-") else 1
+
+  for pos in range(len(a.nums)):
+    result.nums[pos], result.denoms[pos] = r_add(a.nums[pos], a.denoms[pos], sign * b.nums[pos], b.denoms[pos])
+
+    if (a.is_complex()):
+      result.im_nums[pos], result.im_denoms[pos] = r_add(a.im_nums[pos], a.im_denoms[pos],
+                                                         sign * b.im_nums[pos], b.im_denoms[pos])
+
+  return result
+
+
+# accumulate(acc_num, acc_denom, num, denom) Adds num/denom to the running
+#   sum acc_num/acc_denom without reducing it
+# note: the running denominator only grows when 'denom' does not divide it
+def accumulate(acc_num: int, acc_denom: int, num: int, denom: int) -> Tuple[int, int]:
+  if (not num):
+    return (acc_num, acc_denom)
+  elif (not (acc_denom % denom)):
+    return (acc_num + num * (acc_denom // denom), acc_denom)
+  else:
+    return (acc_num * denom + num * acc_denom, acc_denom * denom)
+
+
+# d_multiply(a, b) Computes matrix multiplication of ab for dense matrices
+# requires: a.cols = b.rows
+# note: each dot product is accumulated over a running common denominator
+#         and only reduced once at the end
+def d_multiply(a: DenseMatrix, b: DenseMatrix) -> DenseMatrix:
+  result = DenseMatrix(a.rows, b.cols, a.num_type, a.augumented)
+  is_complex = a.is_complex()
+
+  for i in range(a.rows):
+    a_start = i * a.stride
+    for j in range(b.cols):
+      real_num, real_denom = 0, 1
+      im_num, im_denom = 0, 1
+
+      for k in range(a.cols):
+        a_pos = a_start + k
+        b_pos = k * b.stride + j
+
+        if (is_complex):
+          product = c_multiply(a.tuple_at(a_pos), b.tuple_at(b_pos))
+          real_num, real_denom = accumulate(real_num, real_denom, product[0], product[1])
+          im_num, im_denom = accumulate(im_num, im_denom, product[2], product[3])
+        elif (a.nums[a_pos] and b.nums[b_pos]):
+          real_num, real_denom = accumulate(real_num, real_denom, a.nums[a_pos] * b.nums[b_pos],
+                                            a.denoms[a_pos] * b.denoms[b_pos])
+
+      pos = i * result.stride + j
+      result.nums[pos], result.denoms[pos] = r_reduce(real_num, real_denom)
+      if (is_complex):
+        result.im_nums[pos], result.im_denoms[pos] = r_reduce(im_num, im_denom)
+
+  return result
@@ -0,0 +1,158 @@
+import enum
+import number_theory as nt
+import fraction as frac
+from typing import List, Tuple, Union
+
+
+# DetMethod: Available algorithms for computing the determinant
+class DetMethod(enum.Enum):
+  Bareiss = "bareiss"
+  Modular = "modular"
+  Cofactor = "cofactor"
+  Sparse = "sparse"
+
+
+# gi_multiply(a, b) Computes the product of the gaussian integers 'a' and 'b'
+# note: a gaussian integer is stored as the tuple (real part, imaginary part)
+def gi_multiply(a: Tuple[int, int], b: Tuple[int, int]) -> Tuple[int, int]:
+  return (a[0] * b[0] - a[1] * b[1], a[0] * b[1] + a[1] * b[0])
+
+
+# gi_subtract(a, b) Computes a - b for the gaussian integers 'a' and 'b'
+def gi_subtract(a: Tuple[int, int], b: Tuple[int, int]) -> Tuple[int, int]:
+  return (a[0] - b[0], a[1] - b[1])
+
+
+# gi_exact_divide(a, b) Computes a / b for the gaussian integers 'a' and 'b'
+# requires: 'b' is not 0
+#           'b' divides 'a' exactly
+def gi_exact_divide(a: Tuple[int, int], b: Tuple[int, int]) -> Tuple[int, int]:
+  norm = b[0] * b[0] + b[1] * b[1]
+  num = gi_multiply(a, (b[0], -b[1]))
+  return (num[0] // norm, num[1] // norm)
+
+
+# real_int_rows(rows) Clears the denominators of each row in 'rows'
+#   so that every entry becomes an integer
+# note: returns the integer rows and the product of all the factors
+#         used to scale the rows
+def real_int_rows(rows: List[List[frac.RealFraction]]) -> Tuple[List[List[int]], int]:
+  int_rows = []
+  scale = 1
+
+  for r in rows:
+    row_lcm = nt.lcm_all(entry.denom for entry in r)
+
+    int_rows.append([entry.num * (row_lcm // entry.denom) for entry in r])
+    scale *= row_lcm
+
+  return (int_rows, scale)
+
+
+# complex_int_rows(rows) Clears the denominators of each row in 'rows'
+#   so that every entry becomes a gaussian integer
+# note: returns the gaussian integer rows and the product of all the
+#         factors used to scale the rows
+def complex_int_rows(rows: List[List[frac.ComplexFraction]]) -> Tuple[List[List[Tuple[int, int]]], int]:
+  int_rows = []
+  scale = 1
+
+  for r in rows:
+    row_lcm = nt.lcm_all(entry.denom for entry in r)
+
+    int_rows.append([(entry.re_num * (row_lcm // entry.denom),
+                      entry.im_num * (row_lcm // entry.denom)) for entry in r])
+    scale *= row_lcm
+
+  return (int_rows, scale)
+
+
+# bareiss_int(rows) Computes the determinant of the square integer matrix
+#   represented by 'rows' using fraction-free (Bareiss) elimination
+# requires: 'rows' is not empty and every row has len(rows) entries
+# effects: modifies 'rows'
+# note: every division performed is exact, so each intermediate entry is
+#         a minor of the original matrix and stays bounded in size
+def bareiss_int(rows: List[List[int]]) -> int:
+  size = len(rows)
+  sign = 1
+  prev_pivot = 1
+
+  for k in range(size - 1):
+    if (not rows[k][k]):
+      swap_row = None
+      for i in range(k + 1, size):
+        if (rows[i][k]):
+          swap_row = i
+          break
+
+      if (swap_row is None):
+        return 0
+
+      rows[k], rows[swap_row] = rows[swap_row], rows[k]
+      sign *= -1
+
+    pivot = rows[k][k]
+    pivot_row = rows[k]
+    for i in range(k + 1, size):
+      current_row = rows[i]
+      lead = current_row[k]
+      for j in range(k + 1, size):
+        current_row[j] = (current_row[j] * pivot - lead * pivot_row[j]) // prev_pivot
+
+    prev_pivot = pivot
+
+  return sign * rows[size - 1][size - 1]
+
+
+# bareiss_gi(rows) Computes the determinant of the square gaussian integer
+#   matrix represented by 'rows' using fraction-free (Bareiss) elimination
+# requires: 'rows' is not empty and every row has len(rows) entries
+# effects: modifies 'rows'
+def bareiss_gi(rows: List[List[Tuple[int, int]]]) -> Tuple[int, int]:
+  size = len(rows)
+  sign = 1
+  prev_pivot = (1, 0)
+
+  for k in range(size - 1):
+    if (rows[k][k] == (0, 0)):
+      swap_row = None
+      for i in range(k + 1, size):
+        if (rows[i][k] != (0, 0)):
+          swap_row = i
+          break
+
+      if (swap_row is None):
+        return (0, 0)
+
+      rows[k], rows[swap_row] = rows[swap_row], rows[k]
+      sign *= -1
+
+    pivot = rows[k][k]
+    pivot_row = rows[k]
+    for i in range(k + 1, size):
+      current_row = rows[i]
+      lead = current_row[k]
+      for j in range(k + 1, size):
+        temp = gi_subtract(gi_multiply(current_row[j], pivot), gi_multiply(lead, pivot_row[j]))
+        current_row[j] = gi_exact_divide(temp, prev_pivot)
+
+    prev_pivot = pivot
+
+  result = rows[size - 1][size - 1]
+  return (sign * result[0], sign * result[1])
+
+
+# bareiss_det(rows, num_type) Computes the determinant of the square matrix
+#   whose rows are 'rows' in O(n^3) exact operations
+# requires: 'rows' is not empty and every row has len(rows) entries
+def bareiss_det(rows: Union[List[List[frac.RealFraction]], List[List[frac.ComplexFraction]]],
+                num_type: frac.NumberType) -> Union[frac.RealFraction, frac.ComplexFraction]:
+  if (num_type == frac.NumberType.RealNum.value):
+    int_rows, scale = real_int_rows(rows)
+    return frac.reduce_real(bareiss_int(int_rows), scale)
+
+  elif (num_type == frac.NumberType.ComplexNum.value):
+    int_rows, scale = complex_int_rows(rows)
+    result = bareiss_gi(int_rows)
+    return frac.reduce_complex(result[0], result[1], scale)
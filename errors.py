@@ -0,0 +1,81 @@
+import io
+import contextlib
+from typing import Callable
+
+
+# CalculatorError: An error raised by a calculation that cannot be done
+# note: 'message' is the full message shown to the client, which may show the
+#         matrix that caused the error over several lines
+#       'code' is the number of the error from the module that raised it
+class CalculatorError(Exception):
+  def __init__(self, message: str, code: int = 0):
+    super().__init__(message)
+    self.message = message
+    self.code = code
+
+
+  # summary() Gets the message of the error on a single line
+  def summary(self) -> str:
+    return " ".join(self.message.split())
+
+
+# InputError: An input that is not valid, such as an entry that is not a
+#   number or a job that is missing a value
+class InputError(CalculatorError):
+  pass
+
+
+# ZeroDenominatorError: A fraction whose denominator is 0
+class ZeroDenominatorError(InputError):
+  pass
+
+
+# MissingDependencyError: An optional package needed for the calculation,
+#   such as NumPy, that is not installed
+class MissingDependencyError(CalculatorError):
+  pass
+
+
+# SizeMismatchError: Matrices or vectors whose sizes do not fit the operation
+class SizeMismatchError(CalculatorError):
+  pass
+
+
+# MatrixError: A matrix that the operation cannot be done on
+class MatrixError(CalculatorError):
+  pass
+
+
+# InconsistentError: A system of equations that has no solution
+class InconsistentError(MatrixError):
+  pass
+
+
+# NotSquareError: A matrix that needs to be square but is not
+class NotSquareError(MatrixError):
+  pass
+
+
+# SingularError: A matrix that needs to be invertible but is not
+class SingularError(MatrixError):
+  pass
+
+
+# AugumentedError: An augumented matrix given to an operation that only
+#   works on matrices that are not augumented
+class AugumentedError(MatrixError):
+  pass
+
+
+# MATRIX_ERRORS: the error raised for each code of the 'err' methods of the
+#   matrix types, such as 'matrix.Matrix.matrix_err'
+MATRIX_ERRORS = {1: InconsistentError, 2: NotSquareError, 3: SingularError, 4: AugumentedError}
+
+
+# printed(print_fn) Gets the text printed by 'print_fn', so that it can be
+#   part of the message of an error
+def printed(print_fn: Callable[[], None]) -> str:
+  output = io.StringIO()
+  with contextlib.redirect_stdout(output):
+    print_fn()
+  return output.getvalue()
@@ -1,9 +1,6 @@
 import enum
 import math
-import copy
 import complex
-import lcm
-import gcd
 import validate
 from typing import Union
 
@@ -17,257 +14,468 @@ class NumberType(enum.Enum):
    ComplexNum = "c"
 
 
+# SMALL_INT_MIN, SMALL_INT_MAX: the range of the integers whose fractions are
+#   interned, so that making them never allocates
+SMALL_INT_MIN = -256
+SMALL_INT_MAX = 256
+
+
 # RealFractions: Fractions where the numerator and denominator
-#   are both real numbers
+#   are both integers
+# note: the fraction is always kept in its lowest form with the
+#         negative sign on the numerator
+#       fractions are immutable values, so they can be shared between
+#         matrices and used as dict keys
+#       the integers from SMALL_INT_MIN to SMALL_INT_MAX are interned
 class RealFraction:
-  def __init__(self, num: int, denom: int):
-    self.num = num;
-    if (denom):
-      self.denom = denom
-      self.normalize()
-    else:
+  __slots__ = ("num", "denom")
+
+  def __new__(cls, num: int, denom: int):
+    if (not denom):
       validate.validation_error(DENOM_0_ERR, fraction_type = "Real")
 
+    return reduce_real(num, denom)
+
+
+  def __setattr__(self, name: str, value):
+    raise AttributeError(f"RealFraction is immutable, cannot set '{name}'")
+
+
+  def __delattr__(self, name: str):
+    raise AttributeError(f"RealFraction is immutable, cannot delete '{name}'")
+
+
+  def __eq__(self, other) -> bool:
+    if (type(other) is not RealFraction):
+      return NotImplemented
+    return (self.num == other.num and self.denom == other.denom)
+
+
+  def __hash__(self) -> int:
+    return hash((self.num, self.denom))
 
-  # simplify() Simplifies a fraction to its lowest form
-  # effects: modifies 'self.num' and 'self.denom'
-  def simplify(self):
-    if (self.num):
-      gcd_val = gcd.eucli_algo(self.denom, self.num)
-      self.num /= gcd_val
-      self.denom /= gcd_val
-      self.normalize()
 
+  def __repr__(self) -> str:
+    return f"RealFraction({self.num}, {self.denom})"
 
-  # is_neg_zero(n) Checks if n is a negative zero
-  # required: n = 0
-  def is_neg_zero(self, n: int) -> float:
-    return math.copysign(1, n)
 
+  def __reduce__(self):
+    return (make_real, (self.num, self.denom))
 
-  # normalize() Sets all negatives to the numerator
-  # effects: modifies 'self.num' and 'self.denom'
-  def normalize(self):
-    if (self.denom < 0):
-      self.denom *= -1
-      self.num*= -1
+
+  def __copy__(self) -> "RealFraction":
+    return self
+
+
+  def __deepcopy__(self, memo) -> "RealFraction":
+    return self
 
 
   # reciprocal() Computes the reciprocal of the fraction
-  # effects: modifies 'self.num' and 'self.denom'
-  def reciprocal(self):
-    temp_num = self.num
-    self.num = self.denom
-    self.denom = temp_num
-    self.normalize()
+  # effects: may raise an 'errors.ZeroDenominatorError' if the fraction is 0
+  def reciprocal(self) -> "RealFraction":
+    if (not self.num):
+      validate.validation_error(DENOM_0_ERR, fraction_type = "Real")
+
+    if (self.num < 0):
+      return make_real(-self.denom, -self.num)
+    return make_real(self.denom, self.num)
 
 
   # is_zero() Determines if the fraction is 0
   def is_zero(self) -> bool:
-    if (self.num):
-      return False
-    else:
-      return True
+    return not self.num
 
 
   # is_one() Determines if the fraction is 1
   def is_one(self) -> bool:
-    if (self.num == self.denom):
-      return True
+    return (self.num == 1 and self.denom == 1)
+
+
+  # frac_str() Formats the fraction
+  def frac_str(self) -> str:
+    if (self.denom == 1):
+      return f"({self.num})"
     else:
-      return False
+      return f"({self.num}/{self.denom})"
 
 
   # print_frac() prints the fraction
   # effects: prints output
   def print_frac(self):
-    print("(", end="")
-    if ((not self.num) or (self.denom == 1)):
-      if (not self.num and self.is_neg_zero(self.num) == -1):
-        self.num *= -1
-
-      print(self.num, end="")
-    elif (self.denom == -1):
-      self.num *= -1
-      print(self.num, end="")
-    else:
-      print(f"{self.num}/{self.denom}", end="")
-    print(")", end="")
+    print(self.frac_str(), end="")
+
+
+# RealFractionBuilder: A RealFraction that can still be changed
+# note: a new fraction is filled in as a builder and then frozen by
+#         changing its class to RealFraction, which is cheaper than going
+#         around 'RealFraction.__setattr__'
+class RealFractionBuilder(RealFraction):
+  __slots__ = ()
+  __setattr__ = object.__setattr__
+  __delattr__ = object.__delattr__
+
+
+# alloc_real(num, denom) Allocates a new RealFraction num/denom
+# requires: 'num' and 'denom' are integers that share no common factors
+#           'denom' > 0
+def alloc_real(num: int, denom: int) -> RealFraction:
+  result = object.__new__(RealFractionBuilder)
+  result.num = num
+  result.denom = denom
+  result.__class__ = RealFraction
+  return result
+
+
+SMALL_REALS = [alloc_real(n, 1) for n in range(SMALL_INT_MIN, SMALL_INT_MAX + 1)]
+
+
+# make_real(num, denom) Makes the RealFraction num/denom without
+#   simplifying it
+# requires: 'num' and 'denom' are integers that share no common factors
+#           'denom' > 0
+# note: small integers give the interned fraction instead of a new one
+def make_real(num: int, denom: int) -> RealFraction:
+  if (denom == 1 and SMALL_INT_MIN <= num <= SMALL_INT_MAX):
+    return SMALL_REALS[num - SMALL_INT_MIN]
+
+  return alloc_real(num, denom)
+
+
+# reduce_real(num, denom) Makes the RealFraction num/denom in its lowest form
+# requires: 'denom' is not 0
+def reduce_real(num: int, denom: int) -> RealFraction:
+  if (denom < 0):
+    num = -num
+    denom = -denom
+
+  gcd_val = math.gcd(num, denom)
+  if (gcd_val != 1):
+    return make_real(num // gcd_val, denom // gcd_val)
+
+  return make_real(num, denom)
+
+
+R_ZERO = make_real(0, 1)
+R_ONE = make_real(1, 1)
+R_NEG_ONE = make_real(-1, 1)
 
 
 
 # ComplexFraction: A complex number where the real and
 #   imaginary parts are both fractions
+# note: the number is stored as (re_num + im_num i) / denom with a single
+#         positive denominator shared by both parts, and is always kept in
+#         its lowest form, where re_num, im_num and denom share no common factor
+#       'r' and 'i' give the real and the imaginary parts as RealFractions
+#       like RealFractions, complex fractions are immutable values and the
+#         real integers from SMALL_INT_MIN to SMALL_INT_MAX are interned
 class ComplexFraction:
-  def __init__(self, num: Union[complex.Complex_Num, RealFraction], 
+  __slots__ = ("re_num", "im_num", "denom")
+
+  def __new__(cls, num: Union[complex.Complex_Num, RealFraction],
               denom: Union[complex.Complex_Num, RealFraction], divided: bool = False):
-    if (not divided):
-      if ((not denom.r) and (not denom.i)):
-        validate.validation_error(DENOM_0_ERR, fraction_type = "Complex")
-      else:
-        result = complex.complex_divide(num, denom)
-        self.r = RealFraction(result[0].r, result[1])
-        self.i = RealFraction(result[0].i, result[1])
-        self.simplify()
-        self.normalize()
-    else:
-      self.r = num
-      self.i = denom
-      self.simplify()
-      self.normalize()
+    if (divided):
+      return complex_from_parts(num, denom)
+
+    if ((not denom.r) and (not denom.i)):
+      validate.validation_error(DENOM_0_ERR, fraction_type = "Complex")
+
+    # (a + bi) / (c + di) = (a + bi)(c - di) / (c^2 + d^2)
+    return reduce_complex(num.r * denom.r + num.i * denom.i, num.i * denom.r - num.r * denom.i,
+                          denom.r * denom.r + denom.i * denom.i)
+
+
+  def __setattr__(self, name: str, value):
+    raise AttributeError(f"ComplexFraction is immutable, cannot set '{name}'")
+
+
+  def __delattr__(self, name: str):
+    raise AttributeError(f"ComplexFraction is immutable, cannot delete '{name}'")
+
+
+  def __eq__(self, other) -> bool:
+    if (type(other) is not ComplexFraction):
+      return NotImplemented
+    return (self.re_num == other.re_num and self.im_num == other.im_num and self.denom == other.denom)
+
+
+  def __hash__(self) -> int:
+    return hash((self.re_num, self.im_num, self.denom))
+
+
+  def __repr__(self) -> str:
+    return f"ComplexFraction({self.re_num}, {self.im_num}, {self.denom})"
 
 
-  # simplify() Simplifies the fraction to its lowest form
-  # effects: modifies 'self.r' and 'self.i'
-  def simplify(self):
-    self.r.simplify()
-    self.i.simplify()
-    self.normalize()
+  def __reduce__(self):
+    return (make_complex, (self.re_num, self.im_num, self.denom))
 
 
-  # normalize() Sets the negative for the fractions only on the numerator
-  # effects: modifies 'self.r' and 'self.i'
-  def normalize(self):
-    self.i.normalize()
-    self.r.normalize()
+  def __copy__(self) -> "ComplexFraction":
+    return self
+
+
+  def __deepcopy__(self, memo) -> "ComplexFraction":
+    return self
+
+
+  # r: the real part of the complex fraction
+  @property
+  def r(self) -> RealFraction:
+    return RealFraction(self.re_num, self.denom)
+
+
+  # i: the imaginary part of the complex fraction
+  @property
+  def i(self) -> RealFraction:
+    return RealFraction(self.im_num, self.denom)
 
 
   # conjugate() Computes the conjugate of the Complex fraction
-  # effects: modifies 'self.i'
-  def conjugate(self):
-    self.i.num *= -1
+  def conjugate(self) -> "ComplexFraction":
+    return cf_conjugate(self)
 
 
   # is_zero() Determines if the complex fraction has the value of 0
   def is_zero(self) -> bool:
-    if (self.i.is_zero() and self.r.is_zero()):
-      return True
-    else:
-      return False
+    return (not self.re_num) and (not self.im_num)
 
 
   # is_one() Determines if the complex fraction has the value of 1
   def is_one(self) -> bool:
-    if (self.i.is_zero() and self.r.is_one()):
-      return True
+    return (self.re_num == 1 and self.denom == 1 and not self.im_num)
+
+
+  # frac_str() Formats the fraction
+  def frac_str(self) -> str:
+    if (self.im_num):
+      return f"({self.r.frac_str()} + {self.i.frac_str()}i)"
     else:
-      return False
+      return self.r.frac_str()
 
 
   # print_frac() prints the fraction
   # effects: prints output
   def print_frac(self):
+    print(self.frac_str(), end="")
+
+
+# ComplexFractionBuilder: A ComplexFraction that can still be changed
+# note: used like RealFractionBuilder
+class ComplexFractionBuilder(ComplexFraction):
+  __slots__ = ()
+  __setattr__ = object.__setattr__
+  __delattr__ = object.__delattr__
+
+
+# alloc_complex(re_num, im_num, denom) Allocates a new ComplexFraction
+#   (re_num + im_num i) / denom
+# requires: 're_num', 'im_num' and 'denom' are integers that share no common factor
+#           'denom' > 0
+def alloc_complex(re_num: int, im_num: int, denom: int) -> ComplexFraction:
+  result = object.__new__(ComplexFractionBuilder)
+  result.re_num = re_num
+  result.im_num = im_num
+  result.denom = denom
+  result.__class__ = ComplexFraction
+  return result
 
-    if (self.i.num):
-      print("(", end="")
 
-    self.r.print_frac()
-    if (self.i.num):
-      print(" + ", end="")
-      self.i.print_frac()
-      print("i", end="")
+SMALL_COMPLEXES = [alloc_complex(n, 0, 1) for n in range(SMALL_INT_MIN, SMALL_INT_MAX + 1)]
 
-    if (self.i.num):
-      print(")", end="")
 
+# make_complex(re_num, im_num, denom) Makes the ComplexFraction
+#   (re_num + im_num i) / denom without simplifying it
+# requires: 're_num', 'im_num' and 'denom' are integers that share no common factor
+#           'denom' > 0
+# note: small real integers give the interned fraction instead of a new one
+def make_complex(re_num: int, im_num: int, denom: int) -> ComplexFraction:
+  if (denom == 1 and not im_num and SMALL_INT_MIN <= re_num <= SMALL_INT_MAX):
+    return SMALL_COMPLEXES[re_num - SMALL_INT_MIN]
 
+  return alloc_complex(re_num, im_num, denom)
 
-# rf_add(a, b) Computes the operation of a + b or a - b for real fractions
-# requires: 'sign' is either "+" or "-"
-def rf_add(a: RealFraction, b: RealFraction, sign: str) -> RealFraction:
-  if ((not a.num) and (not b.num)):
-    lcm_denom = 1
 
-  elif (not a.num):
-    lcm_denom = b.denom
+C_ZERO = make_complex(0, 0, 1)
+C_ONE = make_complex(1, 0, 1)
+C_NEG_ONE = make_complex(-1, 0, 1)
 
-  elif ((not b.num) or (a.denom == b.denom)):
-    lcm_denom = a.denom
 
-  elif (a.denom != b.denom):
-    lcm_denom = lcm.lcm(a.denom, b.denom)
-    a_factor = lcm_denom / a.denom
-    b_factor = lcm_denom / b.denom
+# reduce_complex(re_num, im_num, denom) Makes the ComplexFraction
+#   (re_num + im_num i) / denom in its lowest form
+# requires: 'denom' is not 0
+def reduce_complex(re_num: int, im_num: int, denom: int) -> ComplexFraction:
+  if (denom < 0):
+    re_num = -re_num
+    im_num = -im_num
+    denom = -denom
 
-    a.num *= a_factor
-    b.num *= b_factor
+  gcd_val = math.gcd(re_num, im_num, denom)
+  if (gcd_val != 1):
+    return make_complex(re_num // gcd_val, im_num // gcd_val, denom // gcd_val)
 
-  if (sign == "+"):
-    result = RealFraction(a.num + b.num, lcm_denom)
-  elif(sign == "-"):
-    result = RealFraction(a.num - b.num, lcm_denom)
+  return make_complex(re_num, im_num, denom)
+
+
+# complex_from_parts(real_part, imaginary_part) Makes the ComplexFraction
+#   real_part + imaginary_part i
+def complex_from_parts(real_part: RealFraction, imaginary_part: RealFraction) -> ComplexFraction:
+  if (real_part.denom == imaginary_part.denom):
+    return reduce_complex(real_part.num, imaginary_part.num, real_part.denom)
+
+  return reduce_complex(real_part.num * imaginary_part.denom, imaginary_part.num * real_part.denom,
+                        real_part.denom * imaginary_part.denom)
 
-  result.simplify() 
-  return result
+
+
+# rf_add(a, b) Computes the operation of a + b or a - b for real fractions
+# requires: 'sign' is either "+" or "-"
+def rf_add(a: RealFraction, b: RealFraction, sign: str) -> RealFraction:
+  b_num = b.num
+  if (sign == "-"):
+    b_num = -b_num
+
+  if (not b_num):
+    return a
+  elif (not a.num):
+    return make_real(b_num, b.denom)
+  elif (a.denom == b.denom):
+    return reduce_real(a.num + b_num, a.denom)
+  else:
+    return reduce_real(a.num * b.denom + b_num * a.denom, a.denom * b.denom)
 
 
 # cf_add(a, b. sign) Computes the operation of a + b or a - b for complex fractions
 # requires: 'sign' is either "+" or "-"
 def cf_add(a: ComplexFraction, b: ComplexFraction, sign: str) -> ComplexFraction:
-  result = ComplexFraction(rf_add(a.r, b.r, sign), rf_add(a.i, b.i, sign), True)
-  result.simplify()
-  return result
+  b_re, b_im = b.re_num, b.im_num
+  if (sign == "-"):
+    b_re, b_im = -b_re, -b_im
+
+  if ((not b_re) and (not b_im)):
+    return a
+  elif ((not a.re_num) and (not a.im_num)):
+    return make_complex(b_re, b_im, b.denom)
+  elif (a.denom == b.denom):
+    return reduce_complex(a.re_num + b_re, a.im_num + b_im, a.denom)
+  else:
+    return reduce_complex(a.re_num * b.denom + b_re * a.denom, a.im_num * b.denom + b_im * a.denom,
+                          a.denom * b.denom)
 
 
 # rf_multiply(a, b) Computes the operation of a * b for real fractions
+# note: factors shared between a numerator and the other denominator are
+#         cancelled first so that the product is already in lowest form
 def rf_multiply(a: RealFraction, b: RealFraction) -> RealFraction:
-  result = RealFraction(a.num * b.num, a.denom * b.denom)
-  result.simplify()
-  return result
+  if ((not a.num) or (not b.num)):
+    return R_ZERO
+
+  gcd_1 = math.gcd(a.num, b.denom)
+  gcd_2 = math.gcd(b.num, a.denom)
+  return make_real((a.num // gcd_1) * (b.num // gcd_2), (a.denom // gcd_2) * (b.denom // gcd_1))
 
 
-#cf_multiply(a, b) Computes the operation of a * b for complex fractions
+# cf_multiply(a, b) Computes the operation of a * b for complex fractions
+# note: both parts share the denominator a.denom * b.denom, so the product
+#         is reduced with a single gcd
 def cf_multiply(a: ComplexFraction, b: ComplexFraction) -> ComplexFraction:
-  real_part = rf_add(rf_multiply(a.r, b.r), rf_multiply(a.i, b.i), "-")
-  imaginary_part = rf_add(rf_multiply(a.r, b.i), rf_multiply(a.i, b.r), "+")
-  result = ComplexFraction(real_part, imaginary_part, True)
-  result.simplify()
-  return result
+  return reduce_complex(a.re_num * b.re_num - a.im_num * b.im_num,
+                        a.re_num * b.im_num + a.im_num * b.re_num, a.denom * b.denom)
 
 
-# rf_multiply(a, b) Computes the operation of a / b for real fractions
-# effects: may modify 'b'
+# rf_divide(a, b) Computes the operation of a / b for real fractions
+# effects: may raise an 'errors.ZeroDenominatorError' if 'b' is 0
 def rf_divide(a: RealFraction, b: RealFraction) -> RealFraction:
-  b.reciprocal()
-  return rf_multiply(a, b)
+  if (not b.num):
+    validate.validation_error(DENOM_0_ERR, fraction_type = "Real")
+  elif (not a.num):
+    return R_ZERO
+
+  gcd_1 = math.gcd(a.num, b.num)
+  gcd_2 = math.gcd(b.denom, a.denom)
+  num = (a.num // gcd_1) * (b.denom // gcd_2)
+  denom = (a.denom // gcd_2) * (b.num // gcd_1)
+
+  if (denom < 0):
+    num = -num
+    denom = -denom
 
+  return make_real(num, denom)
 
-# cf_multiply(a, b) Computes the operation of a / b for complex fractions
-# effects: may modify 'b'
+
+# cf_divide(a, b) Computes the operation of a / b for complex fractions
+# effects: may raise an 'errors.ZeroDenominatorError' if 'b' is 0
+# note: a / b = a * conj(b) * b.denom / (a.denom * |b.denom * b|^2), so 'b'
+#         is never copied or changed
 def cf_divide(a: ComplexFraction, b: ComplexFraction) -> ComplexFraction:
-  temp_b = copy.deepcopy(b)
-  b.conjugate()
-  num_result = cf_multiply(a, b)
-  denom_result = cf_multiply(temp_b, b)
-  result_r = rf_divide(num_result.r, denom_result.r)
-  denom_result.r.reciprocal()
-  result_i = rf_divide(num_result.i, denom_result.r)
-  b.conjugate()
-  return ComplexFraction(result_r, result_i, True)
-
-
-# r_get_zero() Makes the RealFraction with value 0
+  norm = b.re_num * b.re_num + b.im_num * b.im_num
+  if (not norm):
+    validate.validation_error(DENOM_0_ERR, fraction_type = "Complex")
+  elif ((not a.re_num) and (not a.im_num)):
+    return C_ZERO
+
+  return reduce_complex((a.re_num * b.re_num + a.im_num * b.im_num) * b.denom,
+                        (a.im_num * b.re_num - a.re_num * b.im_num) * b.denom, a.denom * norm)
+
+
+# cf_conjugate(a) Computes the conjugate of the complex fraction 'a'
+def cf_conjugate(a: ComplexFraction) -> ComplexFraction:
+  if (not a.im_num):
+    return a
+  return make_complex(a.re_num, -a.im_num, a.denom)
+
+
+# rf_sub_product(a, factor, b) Computes the operation of a - factor * b for
+#   real fractions with a single fraction allocation
+# note: returns 'a' itself when 'factor' or 'b' is 0
+def rf_sub_product(a: RealFraction, factor: RealFraction, b: RealFraction) -> RealFraction:
+  if ((not factor.num) or (not b.num)):
+    return a
+
+  product_num = factor.num * b.num
+  product_denom = factor.denom * b.denom
+
+  if (not a.num):
+    return reduce_real(-product_num, product_denom)
+  else:
+    return reduce_real(a.num * product_denom - product_num * a.denom, a.denom * product_denom)
+
+
+# cf_sub_product(a, factor, b) Computes the operation of a - factor * b for
+#   complex fractions with a single gcd
+# note: returns 'a' itself when 'factor' or 'b' is 0
+def cf_sub_product(a: ComplexFraction, factor: ComplexFraction, b: ComplexFraction) -> ComplexFraction:
+  if (factor.is_zero() or b.is_zero()):
+    return a
+
+  product_re = factor.re_num * b.re_num - factor.im_num * b.im_num
+  product_im = factor.re_num * b.im_num + factor.im_num * b.re_num
+  product_denom = factor.denom * b.denom
+
+  if (a.is_zero()):
+    return reduce_complex(-product_re, -product_im, product_denom)
+  else:
+    return reduce_complex(a.re_num * product_denom - product_re * a.denom,
+                          a.im_num * product_denom - product_im * a.denom, a.denom * product_denom)
+
+
+# r_get_zero() Gets the RealFraction with value 0
+# note: the fraction is interned, so no allocation is made
 def r_get_zero() -> RealFraction:
-  real_f_0 = RealFraction(0, 1)
-  return real_f_0
+  return R_ZERO
 
 
-# r_get_one() Makes the RealFraction with value 1
+# r_get_one() Gets the RealFraction with value 1
 def r_get_one() -> RealFraction:
-  real_f_1 = RealFraction(1, 1)
-  return real_f_1
+  return R_ONE
 
 
-# c_get_zero() Makes the ComplexFraction with value 0
+# c_get_zero() Gets the ComplexFraction with value 0
 def c_get_zero() -> ComplexFraction:
-  complex_1 = complex.Complex_Num(1, 0)
-  complex_0 = complex.Complex_Num(0, 0)
-  complex_f_0 = ComplexFraction(complex_0, complex_1)
-  return complex_f_0
+  return C_ZERO
 
 
-# c_get_one() Makes the ComplexFraction with value 1
+# c_get_one() Gets the ComplexFraction with value 1
 def c_get_one() -> ComplexFraction:
-  complex_1 = complex.Complex_Num(1, 0)
-  complex_f_1 = ComplexFraction(complex_1, complex_1)
-  return complex_f_1
+  return C_ONE
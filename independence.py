@@ -0,0 +1,313 @@
+import math
+import itertools
+import concurrent.futures
+import counting as count
+import determinant as determ
+import fraction as frac
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+# IntVector: a vector whose entries are integers or gaussian integers, stored as
+#   the tuple (real part, imaginary part)
+IntVector = Union[List[int], List[Tuple[int, int]]]
+
+# RANGES_PER_WORKER: the number of ranges of sets each worker process gets
+#   when searching for sets of a single size
+RANGES_PER_WORKER = 4
+
+
+# int_vectors(vects, num_type) Clears the denominators of each vector in 'vects'
+#   so that every entry becomes an integer or a gaussian integer
+# note: scaling a vector does not change which sets of vectors are independent
+def int_vectors(vects: Union[List[List[frac.RealFraction]], List[List[frac.ComplexFraction]]],
+                num_type: frac.NumberType) -> List[IntVector]:
+  if (num_type == frac.NumberType.RealNum.value):
+    return determ.real_int_rows(vects)[0]
+  else:
+    return determ.complex_int_rows(vects)[0]
+
+
+# is_zero_vect(v, is_complex) Determines if every entry of 'v' is 0
+def is_zero_vect(v: IntVector, is_complex: bool) -> bool:
+  if (is_complex):
+    return not any(x[0] or x[1] for x in v)
+  else:
+    return not any(v)
+
+
+# pivot_index(v, is_complex) Gets the position of the first non-zero entry of 'v'
+# requires: 'v' is not the zero vector
+def pivot_index(v: IntVector, is_complex: bool) -> int:
+  for i in range(len(v)):
+    if ((is_complex and (v[i][0] or v[i][1])) or ((not is_complex) and v[i])):
+      return i
+
+
+# eliminate(v, pivot_vect, pivot, is_complex) Removes the entry at 'pivot' from 'v'
+#   using 'pivot_vect'
+# requires: 'pivot_vect' is non-zero at 'pivot'
+# note: computes pivot_vect[pivot] * v - v[pivot] * pivot_vect and divides out
+#         the integer gcd of the result, so every division is exact
+def eliminate(v: IntVector, pivot_vect: IntVector, pivot: int, is_complex: bool) -> IntVector:
+  lead = v[pivot]
+  scale = pivot_vect[pivot]
+
+  if (is_complex):
+    if (lead == (0, 0)):
+      return v
+
+    result = [determ.gi_subtract(determ.gi_multiply(scale, x), determ.gi_multiply(lead, y))
+              for x, y in zip(v, pivot_vect)]
+    content = math.gcd(*[part for x in result for part in x])
+    if (content > 1):
+      result = [(x[0] // content, x[1] // content) for x in result]
+
+  else:
+    if (not lead):
+      return v
+
+    result = [scale * x - lead * y for x, y in zip(v, pivot_vect)]
+    content = math.gcd(*result)
+    if (content > 1):
+      result = [x // content for x in result]
+
+  return result
+
+
+# vect_rank(vects, is_complex) Computes the rank of the integer vectors in 'vects'
+def vect_rank(vects: List[IntVector], is_complex: bool) -> int:
+  candidates = [v for v in vects if not is_zero_vect(v, is_complex)]
+  rank = 0
+
+  while (candidates):
+    pivot_vect = candidates[0]
+    pivot = pivot_index(pivot_vect, is_complex)
+    rank += 1
+
+    candidates = [eliminate(v, pivot_vect, pivot, is_complex) for v in candidates[1:]]
+    candidates = [v for v in candidates if not is_zero_vect(v, is_complex)]
+
+  return rank
+
+
+# set_bounds(current_set, n, size) Gets the first and the last set, in lexicographic
+#   order, of the sets of 'size' vectors from 'n' vectors that start with 'current_set'
+# note: returns None if no such set exists
+def set_bounds(current_set: List[int], n: int, size: int) -> Optional[Tuple[List[int], List[int]]]:
+  rest = size - len(current_set)
+  last = current_set[-1]
+  if (last + rest >= n):
+    return None
+
+  return (current_set + list(range(last + 1, last + 1 + rest)), current_set + list(range(n - rest, n)))
+
+
+# range_bounds(n, size, start, stop) Gets the first and the last set of the sets of
+#   'size' vectors from 'n' vectors whose position in lexicographic order is in
+#   between 'start' and 'stop' - 1, as the bounds used by 'extend_set'
+# requires: 0 <= start < stop <= count.combination_count(n, size)
+# note: the sets are found by 'counting.unrank_combination', so the search only
+#         compares sets instead of finding the position of every set it extends
+def range_bounds(n: int, size: int, start: int, stop: int) -> Tuple[List[int], List[int]]:
+  return (count.unrank_combination(start, n, size), count.unrank_combination(stop - 1, n, size))
+
+
+# extend_set(current_set, candidates, k, is_complex, min_size, max_size, bounds) Adds
+#   the 'k'th vector in 'candidates' to 'current_set'
+# note: 'candidates' are the vectors that may extend 'current_set', already reduced
+#         against it
+#       if 'bounds' is given as (n, first, last), only the sets of 'max_size' vectors
+#         from 'n' vectors in between the sets 'first' and 'last', in lexicographic
+#         order, are searched (see 'range_bounds')
+#       returns the new set, or None if it is not one of the sets searched for,
+#         together with the vectors that may extend it, or None if no bigger set
+#         needs to be searched
+def extend_set(current_set: List[int], candidates: List[Tuple[int, IntVector]], k: int, is_complex: bool,
+               min_size: int, max_size: int, bounds: Optional[Tuple[int, List[int], List[int]]] = None):
+  index, pivot_vect = candidates[k]
+  new_set = current_set + [index]
+  size = len(new_set)
+
+  if (bounds is not None):
+    sets = set_bounds(new_set, bounds[0], max_size)
+    if (sets is None or sets[1] < bounds[1] or sets[0] > bounds[2]):
+      return (None, None)
+
+  found = new_set if (size >= min_size) else None
+
+  # not enough vectors remain to reach 'min_size'
+  if (size >= max_size or size + len(candidates) - k - 1 < min_size):
+    return (found, None)
+
+  pivot = pivot_index(pivot_vect, is_complex)
+  new_candidates = []
+  for j, v in candidates[k + 1:]:
+    reduced = eliminate(v, pivot_vect, pivot, is_complex)
+    if (not is_zero_vect(reduced, is_complex)):
+      new_candidates.append((j, reduced))
+
+  if (not new_candidates):
+    return (found, None)
+
+  return (found, (new_set, new_candidates))
+
+
+# search(stack, is_complex, min_size, max_size, bounds) Lazily finds all the independent
+#   sets that contain one of the sets in 'stack'
+# effects: modifies 'stack'
+# note: each entry of 'stack' is a set with the reduced vectors that may extend it
+#       'bounds' limits the sets searched, as in 'extend_set'
+#       each set is given as soon as it is found, and the sets of each size are
+#         given in lexicographic order
+#       only the sets being extended are kept, so the memory used does not depend
+#         on the number of sets found
+def search(stack: list, is_complex: bool, min_size: int, max_size: int,
+           bounds: Optional[Tuple[int, List[int], List[int]]] = None) -> Iterator[List[int]]:
+  while (stack):
+    current_set, candidates = stack.pop()
+    children = []
+
+    for k in range(len(candidates)):
+      found, child = extend_set(current_set, candidates, k, is_complex, min_size, max_size, bounds)
+      if (found is not None):
+        yield found
+      if (child is not None):
+        children.append(child)
+
+    # visit the children in lexicographic order
+    stack.extend(reversed(children))
+
+
+# search_branch(candidates, is_complex, min_size, max_size) Finds all the independent
+#   sets whose smallest vector is the first vector in 'candidates'
+# note: runs on its own so that each branch can be searched by a different process
+def search_branch(candidates: List[Tuple[int, IntVector]], is_complex: bool,
+                  min_size: int, max_size: int) -> Dict[int, List[List[int]]]:
+  found = {size: [] for size in range(min_size, max_size + 1)}
+
+  first, child = extend_set([], candidates, 0, is_complex, min_size, max_size)
+  if (first is not None):
+    found[len(first)].append(first)
+
+  if (child is not None):
+    for s in search([child], is_complex, min_size, max_size):
+      found[len(s)].append(s)
+
+  return found
+
+
+# search_range(candidates, is_complex, size, bounds) Finds all the independent sets
+#   of 'size' vectors limited by 'bounds', as in 'extend_set'
+# note: runs on its own so that each range can be searched by a different process
+def search_range(candidates: List[Tuple[int, IntVector]], is_complex: bool, size: int,
+                 bounds: Tuple[int, List[int], List[int]]) -> List[List[int]]:
+  return list(search([([], candidates)], is_complex, size, size, bounds))
+
+
+# split_ranges(total, parts) Splits the positions from 0 to total - 1 into at most
+#   'parts' ranges of about the same length
+def split_ranges(total: int, parts: int) -> List[Tuple[int, int]]:
+  parts = max(1, min(parts, total))
+  return [(total * i // parts, total * (i + 1) // parts) for i in range(parts)]
+
+
+# independent_sets(vects, num_type, min_size, max_size, workers, start, stop) Finds all the
+#   linearly independent sets of vectors from 'vects' with between 'min_size' and 'max_size' vectors
+# note: returns the sets, as lists of indices into 'vects', grouped by their size
+#         and ordered lexicographically for each size
+#       the sets are extended one vector at a time in lexicographic order, so each
+#         vector that could still extend the current set is kept already reduced
+#         against the current set and extending the set takes only one elimination
+#         for each of them
+#       a vector that becomes 0 is dependent on the current set, so it is never
+#         tried again for any bigger set that contains the current set
+#       if 'min_size' = 'max_size', only the sets whose position among all the
+#         sets of that size, in lexicographic order, is in between 'start' and
+#         'stop' - 1 are searched (see 'counting.unrank_combination')
+#       if 'workers' is bigger than 1, the search is split into ranges of sets
+#         that are searched in a pool of 'workers' processes and merged back in order
+def independent_sets(vects: Union[List[List[frac.RealFraction]], List[List[frac.ComplexFraction]]],
+                     num_type: frac.NumberType, min_size: int, max_size: int,
+                     workers: int = 1, start: int = 0, stop: Optional[int] = None) -> Dict[int, List[List[int]]]:
+  is_complex = (num_type == frac.NumberType.ComplexNum.value)
+  int_vects = int_vectors(vects, num_type)
+
+  found = {size: [] for size in range(min_size, max_size + 1)}
+
+  # sizes above the rank never have an independent set
+  max_size = min(max_size, vect_rank(int_vects, is_complex))
+  if (max_size < min_size):
+    return found
+
+  candidates = [(i, v) for i, v in enumerate(int_vects) if not is_zero_vect(v, is_complex)]
+
+  if (min_size == max_size):
+    n = len(vects)
+    total = count.combination_count(n, max_size)
+    if (stop is None or stop > total):
+      stop = total
+
+    start = max(start, 0)
+    if (start >= stop):
+      return found
+
+    if (workers <= 1):
+      # the whole range needs no bounds to be checked
+      bounds = None if (start == 0 and stop == total) else (n, *range_bounds(n, max_size, start, stop))
+      found[max_size].extend(search([([], candidates)], is_complex, min_size, max_size, bounds))
+      return found
+
+    ranges = split_ranges(stop - start, workers * RANGES_PER_WORKER)
+    with concurrent.futures.ProcessPoolExecutor(max_workers = workers) as executor:
+      range_results = executor.map(search_range, itertools.repeat(candidates), itertools.repeat(is_complex),
+                                   itertools.repeat(max_size),
+                                   [(n, *range_bounds(n, max_size, start + a, start + b)) for a, b in ranges])
+
+      for range_found in range_results:
+        found[max_size].extend(range_found)
+
+    return found
+
+  if (workers <= 1 or len(candidates) <= 1):
+    for s in search([([], candidates)], is_complex, min_size, max_size):
+      found[len(s)].append(s)
+    return found
+
+  branches = [candidates[k:] for k in range(len(candidates))]
+  with concurrent.futures.ProcessPoolExecutor(max_workers = workers) as executor:
+    branch_results = executor.map(search_branch, branches, itertools.repeat(is_complex),
+                                  itertools.repeat(min_size), itertools.repeat(max_size))
+
+    for branch_found in branch_results:
+      for size in branch_found:
+        found[size].extend(branch_found[size])
+
+  return found
+
+
+# iter_independent_sets(vects, num_type, min_size, max_size, maximal_only) Lazily finds
+#   all the linearly independent sets of vectors from 'vects' with between 'min_size'
+#   and 'max_size' vectors
+# note: each set is given, as a list of indices into 'vects', as soon as it is found
+#       the sets of each size are given in lexicographic order, but the sets of
+#         different sizes are mixed together
+#       if 'maximal_only' is True, only the sets that cannot be extended are given,
+#         which are the sets with as many vectors as the rank of 'vects'
+def iter_independent_sets(vects: Union[List[List[frac.RealFraction]], List[List[frac.ComplexFraction]]],
+                          num_type: frac.NumberType, min_size: int, max_size: int,
+                          maximal_only: bool = False) -> Iterator[List[int]]:
+  is_complex = (num_type == frac.NumberType.ComplexNum.value)
+  int_vects = int_vectors(vects, num_type)
+  rank = vect_rank(int_vects, is_complex)
+
+  if (maximal_only):
+    if (rank < min_size or rank > max_size):
+      return
+    min_size = rank
+
+  # sizes above the rank never have an independent set
+  max_size = min(max_size, rank)
+  if (max_size < min_size or max_size <= 0):
+    return
+
+  candidates = [(i, v) for i, v in enumerate(int_vects) if not is_zero_vect(v, is_complex)]
+  yield from search([([], candidates)], is_complex, min_size, max_size)
@@ -0,0 +1,200 @@
+import sys
+import json
+import time
+import random
+import asyncio
+import argparse
+import server
+import operations as ops
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_REQUESTS = 200
+DEFAULT_CONCURRENCY = 8
+DEFAULT_SIZE = 6
+
+# ENTRY_RANGE: the entries of the random matrices are integers from
+#   -ENTRY_RANGE to ENTRY_RANGE
+ENTRY_RANGE = 9
+
+# COMPLEX_FIELDS: the fields whose entries have an imaginary part
+COMPLEX_FIELDS = ["c", "nc"]
+
+# PERCENTILES: the percentiles of the latency that are reported
+PERCENTILES = [50, 90, 99]
+
+
+# random_entry(rng, field) Makes a random entry from 'field'
+# note: the entries of the complex fields are written as 'a+bi'
+def random_entry(rng: random.Random, field: str) -> str:
+  entry = str(rng.randint(-ENTRY_RANGE, ENTRY_RANGE))
+  if (field in COMPLEX_FIELDS):
+    entry += f"+{rng.randint(-ENTRY_RANGE, ENTRY_RANGE)}i"
+
+  return entry
+
+
+# random_rows(rng, field, size) Makes the rows of a random 'size' by 'size'
+#   matrix from 'field'
+def random_rows(rng: random.Random, field: str, size: int) -> List[str]:
+  return [", ".join(random_entry(rng, field) for _ in range(size)) for _ in range(size)]
+
+
+# make_params(rng, operation, field, size, timeout) Makes the params of a request
+#   for 'operation' on random matrices
+# note: each operation is given as many matrices as it needs, and operations on
+#         any number of matrices, such as "x", are given 2 matrices
+def make_params(rng: random.Random, operation: str, field: str, size: int,
+                timeout: Optional[float]) -> Dict[str, Any]:
+  if (operation in ops.SINGLE_MATRIX_OPERATIONS):
+    count = 1
+  elif (operation in ops.TRIP_MATRIX_OPERATIONS):
+    count = 3
+  elif (operation in ops.QUINT_MATRIX_OPERATIONS):
+    count = 5
+  else:
+    count = 2
+  params = {"field": field, "matrices": [random_rows(rng, field, size) for _ in range(count)]}
+
+  if (operation == "*"):
+    params["constant"] = random_entry(rng, field)
+  if (timeout is not None):
+    params["timeout"] = timeout
+
+  return params
+
+
+# open_connection(host, port, unix_path) Connects to the server on 'unix_path',
+#   if it is given, or on 'host' and 'port'
+async def open_connection(host: str, port: int,
+                          unix_path: Optional[str]) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+  if (unix_path is not None):
+    return await asyncio.open_unix_connection(unix_path, limit = server.LINE_LIMIT)
+
+  return await asyncio.open_connection(host, port, limit = server.LINE_LIMIT)
+
+
+# client(requests, host, port, unix_path, latencies, outcomes) Sends each request in
+#   'requests' over a single connection, waiting for each response before sending
+#   the next request
+# effects: modifies 'latencies' and 'outcomes'
+async def client(requests: List[Dict[str, Any]], host: str, port: int, unix_path: Optional[str],
+                 latencies: List[float], outcomes: Dict[str, int]):
+  reader, writer = await open_connection(host, port, unix_path)
+
+  try:
+    for request in requests:
+      start = time.perf_counter()
+      writer.write(json.dumps(request).encode() + b"\n")
+      await writer.drain()
+
+      line = await reader.readline()
+      latencies.append(time.perf_counter() - start)
+
+      if (not line):
+        outcomes["disconnected"] = outcomes.get("disconnected", 0) + 1
+        return
+
+      response = json.loads(line)
+      if ("error" in response):
+        key = f"error {response['error']['code']}"
+      else:
+        key = "ok"
+      outcomes[key] = outcomes.get(key, 0) + 1
+
+  finally:
+    writer.close()
+    await writer.wait_closed()
+
+
+# percentile(values, p) Gets the 'p'th percentile of 'values', by the nearest rank
+# requires: 'values' is sorted and is not empty
+def percentile(values: List[float], p: float) -> float:
+  rank = max(1, -(-len(values) * p // 100))
+  return values[int(rank) - 1]
+
+
+# run_load(host, port, unix_path, operations, field, size, requests, concurrency,
+#   timeout, seed) Sends 'requests' requests from 'concurrency' clients at once
+# note: the operations of the requests take turns through 'operations'
+#       returns the throughput, the latencies in milliseconds and the number of
+#         responses of each kind
+async def run_load(host: str, port: int, unix_path: Optional[str], operations: List[str], field: str,
+                   size: int, requests: int, concurrency: int, timeout: Optional[float],
+                   seed: int) -> Dict[str, Any]:
+  rng = random.Random(seed)
+  lo_requests = [{"jsonrpc": server.JSONRPC_VERSION, "id": i, "method": operations[i % len(operations)],
+                  "params": make_params(rng, operations[i % len(operations)], field, size, timeout)}
+                 for i in range(requests)]
+
+  latencies = []
+  outcomes = {}
+  start = time.perf_counter()
+  await asyncio.gather(*[client(lo_requests[c::concurrency], host, port, unix_path, latencies, outcomes)
+                         for c in range(concurrency)])
+  elapsed = time.perf_counter() - start
+
+  latencies.sort()
+  result = {"operations": operations, "field": field, "size": size, "requests": requests,
+            "concurrency": concurrency, "seconds": elapsed, "requests_per_sec": len(latencies) / elapsed,
+            "outcomes": outcomes}
+
+  if (latencies):
+    result["latency_ms"] = {f"p{p}": percentile(latencies, p) * 1000 for p in PERCENTILES}
+    result["latency_ms"]["max"] = latencies[-1] * 1000
+    result["latency_ms"]["mean"] = sum(latencies) / len(latencies) * 1000
+
+  return result
+
+
+# report_str(result) Formats a result from 'run_load'
+def report_str(result: Dict[str, Any]) -> str:
+  lines = [f"{result['requests']} requests ({', '.join(result['operations'])}, {result['field']}, "
+           f"{result['size']}x{result['size']}) from {result['concurrency']} clients in {result['seconds']:.3f}s",
+           f"throughput: {result['requests_per_sec']:.1f} requests/s"]
+
+  if ("latency_ms" in result):
+    lines.append("latency (ms): " + ", ".join(f"{k} {v:.2f}" for k, v in result["latency_ms"].items()))
+
+  lines.append("responses: " + ", ".join(f"{k}: {v}" for k, v in sorted(result["outcomes"].items())))
+  return "\n".join(lines)
+
+
+
+if __name__ == "__main__":
+  parser = argparse.ArgumentParser(description = "Measures the throughput and the latency of the calculator server")
+  parser.add_argument("--host", default = server.DEFAULT_HOST, help = f"address of the server (default: {server.DEFAULT_HOST})")
+  parser.add_argument("--port", type = int, default = server.DEFAULT_PORT,
+                      help = f"port of the server (default: {server.DEFAULT_PORT})")
+  parser.add_argument("--unix", metavar = "PATH", help = "connect to the Unix socket PATH instead of a port")
+  parser.add_argument("--operations", default = "det",
+                      help = "comma separated operations that the requests take turns through (default: det)")
+  parser.add_argument("--field", default = "r", help = "field of the matrices (default: r)")
+  parser.add_argument("--size", type = int, default = DEFAULT_SIZE,
+                      help = f"number of rows and columns of the matrices (default: {DEFAULT_SIZE})")
+  parser.add_argument("--requests", type = int, default = DEFAULT_REQUESTS,
+                      help = f"number of requests sent (default: {DEFAULT_REQUESTS})")
+  parser.add_argument("--concurrency", type = int, default = DEFAULT_CONCURRENCY,
+                      help = f"number of clients sending requests at once (default: {DEFAULT_CONCURRENCY})")
+  parser.add_argument("--timeout", type = float, help = "seconds each request may take on the server")
+  parser.add_argument("--seed", type = int, default = 0, help = "seed of the random matrices (default: 0)")
+  parser.add_argument("--json", action = "store_true", help = "print the results as JSON")
+  args = parser.parse_args()
+
+  operations = [o.strip() for o in args.operations.split(",") if o.strip()]
+  unknown = [o for o in operations if o not in server.OPERATIONS]
+  if (unknown or not operations):
+    parser.error(f"unknown operations: {', '.join(unknown)}")
+  if (min(args.size, args.requests, args.concurrency) < 1):
+    parser.error("the size, the number of requests and the concurrency need to be at least 1")
+
+  try:
+    result = asyncio.run(run_load(args.host, args.port, args.unix, operations, args.field, args.size,
+                                  args.requests, args.concurrency, args.timeout, args.seed))
+  except (ConnectionError, FileNotFoundError) as e:
+    print(f"ERROR: could not connect to the server: {e}", file = sys.stderr)
+    sys.exit(1)
+
+  if (args.json):
+    print(json.dumps(result, indent = 2))
+  else:
+    print(report_str(result))
@@ -0,0 +1,167 @@
+import copy
+import errors
+import fraction as frac
+from typing import List, Union
+
+Entry = Union[frac.RealFraction, frac.ComplexFraction]
+
+
+# LU_ERRORS: the error raised for each code of 'lu_err'
+LU_ERRORS = {1: errors.NotSquareError, 2: errors.SingularError, 3: errors.SizeMismatchError}
+
+
+# lu_err(err_code) error message about a factorization
+# requires: 1 <= err_code <= 3
+# effects: raises an 'errors.CalculatorError'
+def lu_err(err_code: int):
+  message = "ERROR: "
+  if (err_code == 1):
+    message += "The Factored Matrix is not a square matrix"
+  elif (err_code == 2):
+    message += "The Factored Matrix is Singular (Not Invertible)"
+  elif (err_code == 3):
+    message += "The Number of Entries Does not Match the Size of the Factored Matrix"
+
+  raise LU_ERRORS[err_code](message, err_code)
+
+
+# LUFactorization: The factorization PA = LU of a square matrix A, where P
+#   is a permutation matrix, L is lower triangular with 1s on its diagonal
+#   and U is upper triangular
+# requires: 'rows' is not empty and every row has len(rows) entries
+# note: the factorization is computed once, in O(n^3) exact operations, and
+#         each right-hand side is then solved in O(n^2) operations
+#       L and U are kept in the same rows, with the entries of L below the
+#         diagonal and the entries of U on and above the diagonal
+class LUFactorization:
+  def __init__(self, rows: List[List[Entry]], num_type: frac.NumberType):
+    self.size = len(rows)
+    self.num_type = num_type
+
+    if (any(len(r) != self.size for r in rows)):
+      lu_err(1)
+
+    if (num_type == frac.NumberType.RealNum.value):
+      self.sub_product = frac.rf_sub_product
+      self.divide = frac.rf_divide
+      self.multiply = frac.rf_multiply
+      self.get_zero = frac.r_get_zero
+      self.get_one = frac.r_get_one
+    else:
+      self.sub_product = frac.cf_sub_product
+      self.divide = frac.cf_divide
+      self.multiply = frac.cf_multiply
+      self.get_zero = frac.c_get_zero
+      self.get_one = frac.c_get_one
+
+    # perm[i]: the row of A that became row i of PA
+    self.perm = list(range(self.size))
+    self.swaps = 0
+    self.singular = False
+    self.lu = copy.deepcopy(rows)
+    self.factor()
+
+
+  # factor() Computes L and U by gaussian elimination, swapping in the first
+  #   row with a non-zero pivot when needed
+  # effects: modifies 'self.lu', 'self.perm', 'self.swaps' and 'self.singular'
+  def factor(self):
+    lu = self.lu
+    size = self.size
+
+    for k in range(size):
+      pivot_row = None
+      for i in range(k, size):
+        if (not lu[i][k].is_zero()):
+          pivot_row = i
+          break
+
+      # every entry left in the column is already 0
+      if (pivot_row is None):
+        self.singular = True
+        continue
+
+      if (pivot_row != k):
+        lu[k], lu[pivot_row] = lu[pivot_row], lu[k]
+        self.perm[k], self.perm[pivot_row] = self.perm[pivot_row], self.perm[k]
+        self.swaps += 1
+
+      pivot = lu[k][k]
+      current_row = lu[k]
+      for i in range(k + 1, size):
+        if (lu[i][k].is_zero()):
+          continue
+
+        target = lu[i]
+        factor = self.divide(target[k], pivot)
+        target[k] = factor
+        for j in range(k + 1, size):
+          target[j] = self.sub_product(target[j], factor, current_row[j])
+
+
+  # is_singular() Determines if the factored matrix is singular
+  def is_singular(self) -> bool:
+    return self.singular
+
+
+  # det() Computes the determinant of the factored matrix
+  def det(self) -> Entry:
+    result = self.get_one()
+    if (self.swaps % 2):
+      result = self.sub_product(self.get_zero(), result, self.get_one())
+
+    for i in range(self.size):
+      result = self.multiply(result, self.lu[i][i])
+
+    return result
+
+
+  # solve(b) Solves Ax = b for x, where A is the factored matrix
+  # requires: 'b' has an entry for each row of A
+  # effects: raises an 'errors.SingularError' if A is singular
+  def solve(self, b: List[Entry]) -> List[Entry]:
+    if (self.singular):
+      lu_err(2)
+    elif (len(b) != self.size):
+      lu_err(3)
+
+    lu = self.lu
+    size = self.size
+
+    # forward substitution for Ly = Pb
+    y = [b[p] for p in self.perm]
+    for i in range(size):
+      current_row = lu[i]
+      for j in range(i):
+        y[i] = self.sub_product(y[i], current_row[j], y[j])
+
+    # back substitution for Ux = y
+    x = y
+    for i in range(size - 1, -1, -1):
+      current_row = lu[i]
+      for j in range(i + 1, size):
+        x[i] = self.sub_product(x[i], current_row[j], x[j])
+      x[i] = self.divide(x[i], current_row[i])
+
+    return x
+
+
+  # solve_many(b_rows) Solves AX = B for X, where A is the factored matrix and
+  #   'b_rows' are the rows of B
+  # requires: 'b_rows' has a row for each row of A
+  # effects: raises an 'errors.SingularError' if A is singular
+  # note: returns the rows of X
+  def solve_many(self, b_rows: List[List[Entry]]) -> List[List[Entry]]:
+    if (len(b_rows) != self.size):
+      lu_err(3)
+
+    solutions = [self.solve(list(col)) for col in zip(*b_rows)]
+    return [list(r) for r in zip(*solutions)]
+
+
+  # inverse() Computes the rows of the inverse of the factored matrix
+  # effects: raises an 'errors.SingularError' if the factored matrix is singular
+  def inverse(self) -> List[List[Entry]]:
+    identity = [[self.get_one() if i == j else self.get_zero() for j in range(self.size)]
+                for i in range(self.size)]
+    return self.solve_many(identity)
@@ -1,11 +1,18 @@
-import copy
-import complex
+import itertools
 import fraction as frac
-import sys
+import errors
 import enum
 import vector as vect
-import counting as count
-from typing import Union, List, Dict, Callable, Optional
+import determinant as determ
+import dense
+import sparse
+import numeric
+import modular
+import independence as indep
+import multiply as mult
+import lu
+import minors
+from typing import Union, List, Dict, Callable, Optional, Iterator, Tuple
 
 # OperationSym: Current Available Operations
 class OperationSym(enum.Enum):
@@ -50,6 +57,23 @@ class LinearEquation:
         self.coefficients[i] = frac.cf_multiply(factor, self.coefficients[i])
 
 
+  # subtract_scaled(other, factor) Subtracts 'other' scaled by 'factor' from
+  #   the equation, writing each result directly into the equation
+  # effects: modifies 'self.answer' and 'self.coefficients'
+  def subtract_scaled(self, other: "LinearEquation", factor: Union[frac.RealFraction, frac.ComplexFraction]):
+    if (self.num_type == frac.NumberType.RealNum.value):
+      sub_product = frac.rf_sub_product
+    elif (self.num_type == frac.NumberType.ComplexNum.value):
+      sub_product = frac.cf_sub_product
+
+    coefficients = self.coefficients
+    other_coefficients = other.coefficients
+    for i in range(len(coefficients)):
+      coefficients[i] = sub_product(coefficients[i], factor, other_coefficients[i])
+
+    self.answer = sub_product(self.answer, factor, other.answer)
+
+
   #is_trivial(check_right) Determines whether the equation is trivial
   def is_trivial(self, check_right: bool = True) -> bool:
     co_all_zero = True
@@ -117,44 +141,40 @@ class Matrix:
 
   # get_identity() Gets the identity Matrix
   # effects: modifies 'self.inv_equations'
+  # note: the entries are the interned 0 and 1, which are shared since
+  #         fractions are immutable
   def get_identity(self):
     if (self.is_square() and not self.augumented):
       len_m = len(self.equations)
       num_type = self.num_type
-      real_num = frac.NumberType.RealNum.value
-      complex_num = frac.NumberType.ComplexNum.value
       equation_arr = []
 
-      real_f_0 = frac.r_get_zero()
-      real_f_1 = frac.r_get_one()
-
-      complex_f_0 = frac.c_get_zero()
-      complex_f_1 = frac.c_get_one()
+      if (num_type == frac.NumberType.RealNum.value):
+        zero, one = frac.R_ZERO, frac.R_ONE
+      else:
+        zero, one = frac.C_ZERO, frac.C_ONE
 
       for i in range(len_m):
-        ans = None
-        temp_coeff = [];
-
-        if (self.num_type == real_num):
-          temp_coeff = [copy.deepcopy(real_f_0)] * len_m
-          temp_coeff[i] = copy.deepcopy(real_f_1)
-          ans = copy.deepcopy(real_f_0)
-
-        elif (self.num_type == complex_num):
-          temp_coeff = [copy.deepcopy(complex_f_0)] * len_m
-          temp_coeff[i] = copy.deepcopy(complex_f_1)
-          ans = copy.deepcopy(complex_f_0)
-
-        equation_arr.append(LinearEquation(temp_coeff, ans, num_type))
+        temp_coeff = [zero] * len_m
+        temp_coeff[i] = one
+        equation_arr.append(LinearEquation(temp_coeff, zero, num_type))
 
-      self.inv_equations = copy.deepcopy(equation_arr)
+      self.inv_equations = equation_arr
 
     else:
       self.matrix_err(2)
 
 
-  # get_rank() Gets the rank of the matrix
-  def get_rank(self) -> int:
+  # get_rank(use_modular, use_sparse) Gets the rank of the matrix
+  # note: without 'use_modular' or 'use_sparse', the rank is only correct once the
+  #         matrix is in row echelon form, while the modular rank and the sparse
+  #         rank can be found at any time
+  def get_rank(self, use_modular: bool = False, use_sparse: bool = False) -> int:
+    if (use_modular):
+      return modular.modular_rank([e.coefficients for e in self.equations], self.num_type)
+    elif (use_sparse):
+      return self.to_sparse().rank()
+
     rank = 0
     for e in self.equations:
       if (not e.is_trivial(False)):
@@ -166,7 +186,7 @@ class Matrix:
   # matrix_err(err_code, pivot_row) error message about a specific matrix
   # requires: 0 <= row < len(self.equations)
   #           1 <= err_code <= 4
-  # effects: ends the program after displaying the error message
+  # effects: raises an 'errors.MatrixError'
   def matrix_err(self, err_code: int, row: int = 0):
     message = "ERROR: "
     after_message = ""
@@ -182,20 +202,15 @@ class Matrix:
     elif (err_code == 4):
       message += "The Following Matrix, where\n"
       after_message += "\n\nis an Augumented Matrix"
-    
-    print(message)
 
     if (err_code == 1):
-      self.equations[row].print_eq(True)
+      shown = errors.printed(lambda: self.equations[row].print_eq(True))
     elif (err_code == 2 or err_code == 4):
-      self.print_matrix()
+      shown = errors.printed(self.print_matrix)
     elif (err_code == 3):
-      self.print_inverse()
+      shown = errors.printed(self.print_inverse)
 
-    after_message += "Ending Program..."
-    print(after_message)
-
-    sys.exit()
+    raise errors.MATRIX_ERRORS[err_code](f"{message}\n{shown}{after_message}", err_code)
 
 
   # get_column(col) Gets all the entries from column 'col' in the
@@ -242,9 +257,7 @@ class Matrix:
   # effects: modifies 'equations'
   #          may print output
   def swap_eq(self, equations: List[LinearEquation], current_i: int, i_to_swap: int, verbose: bool = True):
-    temp_eq = copy.deepcopy(equations[current_i])
-    equations[current_i] = copy.deepcopy(equations[i_to_swap])
-    equations[i_to_swap] = copy.deepcopy(temp_eq)
+    equations[current_i], equations[i_to_swap] = equations[i_to_swap], equations[current_i]
 
     if (verbose):
       print(f"ERO Type I: R{current_i + 1} <--> R{i_to_swap + 1}")
@@ -268,7 +281,7 @@ class Matrix:
 
 
   # difference(equations, i_i, i_2, factor_2, verbose) Computes the difference between equation i_1 and 
-  #   equation i_2 that is scaled by 'factor_2'
+  #   equation i_2 that is scaled by 'factor_2' in place, without copying equation i_2
   # requires: 'equations' is not empty
   #           0 <= i_1 < len(equations)
   #           0 <= i_2 < len(equations)
@@ -277,20 +290,7 @@ class Matrix:
   def difference(self, equations: List[LinearEquation], i_1: int, i_2: int, 
                  factor_2: Union[frac.RealFraction, frac.ComplexFraction], verbose: bool = True):
     if (not factor_2.is_zero()):
-      scaled_subtrahend = copy.deepcopy(equations[i_2])
-      scaled_subtrahend.scale_eq(factor_2)
-
-      if (self.num_type == frac.NumberType.RealNum.value):
-        equations[i_1].answer = frac.rf_add(equations[i_1].answer, scaled_subtrahend.answer, "-")
-
-        for i in range(len(scaled_subtrahend.coefficients)):
-          equations[i_1].coefficients[i] = frac.rf_add(equations[i_1].coefficients[i], scaled_subtrahend.coefficients[i], "-")
-
-      elif (self.num_type == frac.NumberType.ComplexNum.value):
-        equations[i_1].answer = frac.cf_add(equations[i_1].answer, scaled_subtrahend.answer, "-")
-
-        for i in range(len(scaled_subtrahend.coefficients)):
-          equations[i_1].coefficients[i] = frac.cf_add(equations[i_1].coefficients[i], scaled_subtrahend.coefficients[i], "-")
+      equations[i_1].subtract_scaled(equations[i_2], factor_2)
 
       if (verbose):
         print(f"ERO Type III: R{i_1 + 1} --> R{i_1 + 1} - ", end="")
@@ -305,11 +305,9 @@ class Matrix:
   #          may print output
   def normalize(self, index: int, pivot: int, verbose: bool = True):
     if (self.num_type == frac.NumberType.RealNum.value):
-      factor = copy.deepcopy(self.equations[index].coefficients[pivot])
-      factor.reciprocal()
+      factor = frac.rf_divide(frac.r_get_one(), self.equations[index].coefficients[pivot])
     elif (self.num_type == frac.NumberType.ComplexNum.value):
-      num = frac.ComplexFraction(complex.Complex_Num(1, 0), complex.Complex_Num(1, 0))
-      factor = frac.cf_divide(num, self.equations[index].coefficients[pivot])
+      factor = frac.cf_divide(frac.c_get_one(), self.equations[index].coefficients[pivot])
 
     kwargs = {"index": index, "factor": factor, "verbose": verbose}
     self.do_ero(2, **kwargs)
@@ -492,10 +490,22 @@ class Matrix:
     self.pivot_vects.insert(0, 0)
 
 
-  # gauss_jordan(get_inv, verbose) computes the gauss-jordan algorithm
+  # gauss_jordan(get_inv, verbose, dense_storage, sparse_storage) computes the
+  #   gauss-jordan algorithm
   # effects: may print output
   #          modifies 'self.equations' and 'self.inv_equations'
-  def gauss_jordan(self, get_inv = False, verbose = True):
+  # note: if 'dense_storage' is True, the elimination runs on a dense array
+  #         copy of the matrix and the results are written back
+  #       if 'sparse_storage' is True, the elimination runs on a copy of the
+  #         matrix that only stores its non-zero entries
+  def gauss_jordan(self, get_inv = False, verbose = True, dense_storage = False, sparse_storage = False):
+    if (dense_storage):
+      self.dense_gauss_jordan(get_inv, verbose)
+      return
+    elif (sparse_storage):
+      self.sparse_gauss_jordan(get_inv, verbose)
+      return
+
     if (verbose):
       print("\n------- Gaussian Elimination ---------")
     self.gaussian_elimination(get_inv, verbose)
@@ -523,6 +533,70 @@ class Matrix:
         self.print_inverse()
 
 
+  # dense_gauss_jordan(get_inv, verbose) computes the gauss-jordan algorithm
+  #   on the dense array storage
+  # effects: may print output
+  #          modifies 'self.equations' and 'self.inv_equations'
+  def dense_gauss_jordan(self, get_inv: bool = False, verbose: bool = True):
+    dense_m = self.to_dense()
+    companion = None
+
+    if (self.inv_equations):
+      inv_m = Matrix(self.inv_equations, self.num_type, False)
+      companion = inv_m.to_dense()
+
+    companion = dense_m.gauss_jordan(get_inv, verbose, companion)
+
+    self.equations = from_dense(dense_m).equations
+    self.pivots = dense_m.pivots
+    self.pivot_vects = dense_m.pivot_vects
+    if (companion is not None):
+      self.inv_equations = from_dense(companion).equations
+
+
+  # sparse_gauss_jordan(get_inv, verbose) computes the gauss-jordan algorithm
+  #   on the sparse storage
+  # effects: may print output
+  #          modifies 'self.equations' and 'self.inv_equations'
+  def sparse_gauss_jordan(self, get_inv: bool = False, verbose: bool = True):
+    sparse_m = self.to_sparse()
+    companion = None
+
+    if (self.inv_equations):
+      inv_m = Matrix(self.inv_equations, self.num_type, False)
+      companion = inv_m.to_sparse()
+
+    companion = sparse_m.gauss_jordan(get_inv, verbose, companion)
+
+    self.equations = from_sparse(sparse_m).equations
+    self.pivots = sparse_m.pivots
+    self.pivot_vects = sparse_m.pivot_vects
+    if (companion is not None):
+      self.inv_equations = from_sparse(companion).equations
+
+
+  # to_sparse() Makes a copy of the matrix that only stores its non-zero entries
+  def to_sparse(self) -> sparse.SparseMatrix:
+    return sparse.from_rows([e.coefficients for e in self.equations],
+                            [e.answer for e in self.equations], self.num_type, self.augumented)
+
+
+  # to_dense() Makes a copy of the matrix that uses the dense array storage
+  def to_dense(self) -> dense.DenseMatrix:
+    return dense.from_rows([e.coefficients for e in self.equations],
+                           [e.answer for e in self.equations], self.num_type, self.augumented)
+
+
+  # lu_factor() Computes the LU factorization of the coefficients of the matrix,
+  #   which can then solve the matrix against any number of answers
+  # effects: may raise an 'errors.CalculatorError'
+  def lu_factor(self) -> lu.LUFactorization:
+    if (not self.is_square()):
+      self.matrix_err(2)
+
+    return lu.LUFactorization([e.coefficients for e in self.equations], self.num_type)
+
+
   # print_matrix() Prints out the matrix
   # effects: prints output
   def print_matrix(self):
@@ -546,8 +620,7 @@ class Matrix:
 
 
 # m_error(signal) Error messages for operations between matrices
-# effects: prints output
-#          ends the program after displaying error message
+# effects: raises an 'errors.SizeMismatchError'
 def m_error(signal: int):
   message = "ERROR "
 
@@ -562,18 +635,17 @@ def m_error(signal: int):
   elif (signal == 5):
     message += "The size of the vectors do not match"
 
-  print(f"\n\n{message}\n\n\n\nEnding Program...")
-  sys.exit()
+  raise errors.SizeMismatchError(message, signal)
 
 
 # check(a, b, check_type) Error check for matrix arithmetic
 # requires: 'check_type' is either "col", "row", "size" or "col-row"
-# effects: may end the program
+# effects: may raise an 'errors.CalculatorError'
 def check(a: Matrix, b: Matrix, check_type: str):
-  a_col = len(a.equations[0].coefficients)
-  b_col = len(b.equations[0].coefficients)
-  a_row = len(a.equations)
-  b_row = len(b.equations)
+  a_col = a.cols
+  b_col = b.cols
+  a_row = a.rows
+  b_row = b.rows
 
   row_check = a_row != b_row
   col_check = a_col != b_col
@@ -590,7 +662,7 @@ def check(a: Matrix, b: Matrix, check_type: str):
 
 # m_arith(op, a, b, check_type) Checks if performing 'op' is valid
 #   for matrix 'a' and 'b'
-# effects: may end the program
+# effects: may raise an 'errors.CalculatorError'
 def m_arith(op: Callable[[Matrix, Matrix, Optional[str]], Matrix], a: Matrix, b: Matrix, 
             check_type: str, adding: bool = False, sign: str = "+") -> Matrix:
   check(a, b, check_type)
@@ -601,9 +673,28 @@ def m_arith(op: Callable[[Matrix, Matrix, Optional[str]], Matrix], a: Matrix, b:
     return op(a, b, sign)
 
 
+# dense_pair(a, b) Gets 'a' and 'b' with the dense array storage if either
+#   one of them already uses it
+# note: the matrix that does not use the dense storage is copied by 'to_dense'
+def dense_pair(a: Union[Matrix, dense.DenseMatrix],
+               b: Union[Matrix, dense.DenseMatrix]) -> Tuple[dense.DenseMatrix, dense.DenseMatrix]:
+  if (not isinstance(a, dense.DenseMatrix)):
+    a = a.to_dense()
+  if (not isinstance(b, dense.DenseMatrix)):
+    b = b.to_dense()
+
+  return (a, b)
+
+
 # m_add(a, b, op) Adds or subtracts 2 matrices
 # requires: 'op' is either "+" or "-"
-def m_add(a: Matrix, b: Matrix, op: str) -> Matrix:
+# note: the result uses the dense array storage if either 'a' or 'b' does
+def m_add(a: Union[Matrix, dense.DenseMatrix], b: Union[Matrix, dense.DenseMatrix], op: str) -> Union[Matrix, dense.DenseMatrix]:
+  if (isinstance(a, dense.DenseMatrix) or isinstance(b, dense.DenseMatrix)):
+    return dense.d_add(*dense_pair(a, b), op)
+  elif (isinstance(a, numeric.NumericMatrix)):
+    return numeric.n_add(a, b, op)
+
   equations = []
   augumented = a.augumented
   num_type = a.num_type
@@ -641,143 +732,189 @@ def m_add(a: Matrix, b: Matrix, op: str) -> Matrix:
         
 
 # m_multiply(a, b) Computes matrix multiplication of ab
-def m_multiply(a: Matrix, b: Matrix) -> Matrix:
+# note: each entry is a dot product that is only reduced once at the end
+#       larger products are computed on integers by 'multiply.exact_multiply',
+#         using blocking and the Strassen-Winograd recursion
+#       the result uses the dense array storage if either 'a' or 'b' does
+def m_multiply(a: Union[Matrix, dense.DenseMatrix], b: Union[Matrix, dense.DenseMatrix]) -> Union[Matrix, dense.DenseMatrix]:
+  if (isinstance(a, dense.DenseMatrix) or isinstance(b, dense.DenseMatrix)):
+    return dense.d_multiply(*dense_pair(a, b))
+  elif (isinstance(a, numeric.NumericMatrix)):
+    return numeric.n_multiply(a, b)
+
   equations = []
   augumented = a.augumented
   num_type = a.num_type
+  answer = 0
 
-  for i in range(len(a.equations)):
-    temp_coeff = []
-    answer = 0
+  if (min(a.rows, a.cols, b.cols) >= mult.MIN_ENGINE_SIZE):
+    product = mult.exact_multiply([e.coefficients for e in a.equations],
+                                  [e.coefficients for e in b.equations], num_type)
+    equations = [LinearEquation(temp_coeff, answer, num_type) for temp_coeff in product]
+    return Matrix(equations, num_type, augumented)
 
-    for j in range(len(b.equations[0].coefficients)):
-      temp_a = a.equations[i].coefficients
-      temp_b = b.get_column(j)
-      dp_result = vect.dot_product(temp_a, temp_b, num_type, False)
-      temp_coeff.append(dp_result)
+  # the columns of 'b' are only gathered once
+  b_columns = [b.get_column(j) for j in range(b.cols)]
 
+  for e in a.equations:
+    temp_a = e.coefficients
+    temp_coeff = [vect.dot_product(temp_a, temp_b, num_type, False) for temp_b in b_columns]
     equations.append(LinearEquation(temp_coeff, answer, num_type))
 
   return Matrix(equations, num_type, augumented)
 
 
+# m_chain_multiply(lo_matrices, verbose) Computes the product of all the matrices in
+#   'lo_matrices', in order
+# requires: 'lo_matrices' is not empty
+# effects: may raise an 'errors.CalculatorError'
+#          prints output if 'verbose' is True
+# note: the products are done in the order that needs the fewest multiplications
+#         of entries, as found by 'multiply.chain_order'
+#       the order is printed if there are more than 2 matrices
+def m_chain_multiply(lo_matrices: list, verbose: bool = False) -> Union[Matrix, dense.DenseMatrix]:
+  for i in range(len(lo_matrices) - 1):
+    check(lo_matrices[i], lo_matrices[i + 1], "col-row")
+
+  dims = [lo_matrices[0].rows] + [m.cols for m in lo_matrices]
+  splits = mult.chain_order(dims)[0]
+
+  if (verbose and len(lo_matrices) > 2):
+    print(f"Order of Multiplication: {mult.chain_str(splits, 0, len(lo_matrices) - 1)}\n")
+
+  return chain_product(lo_matrices, splits, 0, len(lo_matrices) - 1)
+
+
+# chain_product(lo_matrices, splits, i, j) Computes the product of the matrices
+#   'i' to 'j' from 'lo_matrices' in the order given by 'multiply.chain_order'
+def chain_product(lo_matrices: list, splits: List[List[int]], i: int, j: int) -> Union[Matrix, dense.DenseMatrix]:
+  if (i == j):
+    return lo_matrices[i]
+
+  k = splits[i][j]
+  return m_multiply(chain_product(lo_matrices, splits, i, k), chain_product(lo_matrices, splits, k + 1, j))
+
+
 # m_smultiply(a, c) Performs scalar matrix multiplication of ca
 def m_smultiply(a: Matrix, c: Union[frac.RealFraction, frac.ComplexFraction]) -> Matrix:
+  if (isinstance(a, numeric.NumericMatrix)):
+    numeric.n_smultiply(a, c)
+    return
+
   for i in range(len(a.equations)):
     kwargs = {"index": i, "factor": c, "verbose": False}
     a.do_ero(2, **kwargs)
 
 
-# sub_sq_matrix(a, i, j) Finds the M_ij matrix of a
-# requires: 0 <= i_row < len(a.equations)
-#           0 <= j_col < len(a.equations[0].coefficients)
-# effects: may end the program
-def sub_sq_matrix(a: Matrix, i_row: int, j_col: int) -> Matrix:
-  is_square = a.is_square()
-
-  if (is_square and not a.augumented):
-    equations = [];
+# from_dense(d) Makes a Matrix with the same entries as the dense matrix 'd'
+def from_dense(d: dense.DenseMatrix) -> Matrix:
+  equations = []
 
-    for i in range(len(a.equations)):
-      if (i != i_row):
+  for i in range(d.rows):
+    coefficients = list(d.get_row(i))
+    equations.append(LinearEquation(coefficients, d.entry(i, d.cols), d.num_type))
 
-        temp_coeff = [];
-        for j in range(len(a.equations[0].coefficients)):
-          if (j != j_col):
-            temp_coeff.append(a.equations[i].coefficients[j]);
+  result = Matrix(equations, d.num_type, d.augumented)
+  result.pivots = d.pivots
+  result.pivot_vects = d.pivot_vects
+  return result
 
-        equations.append(LinearEquation(temp_coeff, 0, a.num_type))
 
-    return Matrix(equations, a.num_type, a.augumented)
+# from_sparse(s) Makes a Matrix with the same entries as the sparse matrix 's'
+def from_sparse(s: sparse.SparseMatrix) -> Matrix:
+  equations = []
 
-  elif (not is_square):
-    a.matrix_err(2);
+  for i in range(s.rows):
+    equations.append(LinearEquation(s.get_row(i), s.entry(i, s.cols), s.num_type))
 
-  else:
-    a.matrix_err(4);
+  result = Matrix(equations, s.num_type, s.augumented)
+  result.pivots = s.pivots
+  result.pivot_vects = s.pivot_vects
+  return result
 
 
-# cofactor(a, i_row, j_col) Gets the cofactor of a
-# requires: 0 <= i_row < len(a.equations)
-#           0 <= j_col < len(a.equations[0].coefficients)
-def cofactor(a: Matrix, i_row: int, j_col: int) -> Matrix:
-  if (not (((i_row + 1) + (j_col + 1)) % 2)):
-    is_one = True
+# from_rows(rows, num_type, augumented) Makes a Matrix whose coefficients are 'rows'
+# requires: 'rows' is not empty
+# note: every answer is 0
+def from_rows(rows: Union[List[List[frac.RealFraction]], List[List[frac.ComplexFraction]]],
+              num_type: frac.NumberType, augumented: bool = False) -> Matrix:
+  if (num_type == frac.NumberType.RealNum.value):
+    answer = frac.r_get_zero()
   else:
-    is_one = False
-
-  sign = None
-  if (a.num_type == frac.NumberType.RealNum.value):
-    sign = frac.r_get_one()
-    entry = a.equations[i_row].coefficients[j_col]
+    answer = frac.c_get_zero()
 
-    if (not is_one):
-      zero = frac.r_get_zero()
-      sign = frac.rf_add(zero, sign, "-")
+  equations = [LinearEquation(r, answer, num_type) for r in rows]
+  return Matrix(equations, num_type, augumented)
 
-    result = frac.rf_multiply(sign, entry)
-    sub_m = sub_sq_matrix(a, i_row, j_col)
-    determinant = det(sub_m)
 
-    result = frac.rf_multiply(result, determinant)
-    return result
-  
-  elif (a.num_type == frac.NumberType.ComplexNum.value):
-    sign = frac.c_get_one()
-    
-    if (not is_one):
-      zero = frac.c_get_zero()
-      sign = frac.cf_add(zero, sign, "-")
+# minor_table(a, max_size) Makes the table of the minors of a, which keeps
+#   at most 'max_size' minors
+# requires: 'a' is not a 'numeric.NumericMatrix'
+# effects: may raise an 'errors.CalculatorError'
+def minor_table(a: Matrix, max_size: int = minors.MINOR_CACHE_SIZE) -> minors.MinorTable:
+  if (not a.is_square()):
+    a.matrix_err(2)
+  elif (a.augumented):
+    a.matrix_err(4)
 
-    result = frac.cf_multiply(sign, entry)
-    sub_m = sub_sq_matrix(a, i_row, j_col)
-    determinant = det(sub_m)
+  return minors.MinorTable([e.coefficients for e in a.equations], a.num_type, max_size)
 
-    result = frac.cf_multiply(result, determinant)
-    return result
 
+# cofactor(a, i_row, j_col) Gets the cofactor of a
+# requires: 0 <= i_row < len(a.equations)
+#           0 <= j_col < len(a.equations[0].coefficients)
+#           'a' is not a 'numeric.NumericMatrix'
+# effects: may raise an 'errors.CalculatorError'
+def cofactor(a: Matrix, i_row: int, j_col: int) -> Union[frac.RealFraction, frac.ComplexFraction]:
+  return minor_table(a).cofactor(i_row, j_col)
+
+
+# cofactor_matrix(a, max_size) Gets the matrix of the cofactors of a
+# requires: 'a' is not a 'numeric.NumericMatrix'
+# effects: may raise an 'errors.CalculatorError'
+# note: every cofactor is found from the same table of minors, which keeps
+#         at most 'max_size' minors
+def cofactor_matrix(a: Matrix, max_size: int = minors.MINOR_CACHE_SIZE) -> Matrix:
+  return from_rows(minor_table(a, max_size).cofactor_rows(), a.num_type)
+
+
+# adjugate(a, max_size) Gets the adjugate of a, which is the transpose of its
+#   cofactor matrix
+# requires: 'a' is not a 'numeric.NumericMatrix'
+# effects: may raise an 'errors.CalculatorError'
+# note: every cofactor is found from the same table of minors, which keeps
+#         at most 'max_size' minors
+def adjugate(a: Matrix, max_size: int = minors.MINOR_CACHE_SIZE) -> Matrix:
+  return from_rows(minor_table(a, max_size).adjugate_rows(), a.num_type)
+
+
+# det(a, method) Finds the determinant of a
+# requires: 'method' is one of the values in the enum 'determinant.DetMethod'
+# effects: may raise an 'errors.CalculatorError'
+# note: the modular method reconstructs the determinant from its values modulo
+#         several primes, which avoids large intermediate numerators
+#       the cofactor expansion keeps each minor it finds in a 'minors.MinorTable',
+#         so it runs in O(2^n * n) instead of O(n!), and is kept as a reference
+#         for checking the results of the bareiss algorithm
+def det(a: Matrix, method: str = determ.DetMethod.Bareiss.value) -> Union[frac.RealFraction, frac.ComplexFraction]:
+  if (isinstance(a, numeric.NumericMatrix)):
+    return numeric.n_det(a)
 
-# det(a) Finds the determinant of a
-def det(a: Matrix) -> Union[frac.RealFraction, frac.ComplexFraction]:
   is_square = a.is_square()
 
   if (is_square and not a.augumented):
-    size = len(a.equations)
-    row = 0
-
-    if (size == 1):
-      return a.equations[0].coefficients[0]
-    elif (size == 2):
-      w = a.equations[0].coefficients[0]
-      x = a.equations[0].coefficients[1]
-      y = a.equations[1].coefficients[0]
-      z = a.equations[1].coefficients[1]
-      result = None
-
-      if (a.num_type == frac.NumberType.RealNum.value):
-        result = frac.rf_add(frac.rf_multiply(w, z), 
-                             frac.rf_multiply(x, y), "-")
-      elif (a.num_type == frac.NumberType.ComplexNum.value):
-        result = frac.cf_add(frac.cf_multiply(w, z), 
-                             frac.cf_multiply(x, y), "-")
-
-      return result
+    if (method == determ.DetMethod.Bareiss.value):
+      return determ.bareiss_det([e.coefficients for e in a.equations], a.num_type)
 
-    else:
-      if (a.num_type == frac.NumberType.RealNum.value):
-        sum = frac.r_get_zero()
-      elif (a.num_type == frac.NumberType.ComplexNum.value):
-        sum = frac.c_get_zero()
+    elif (method == determ.DetMethod.Modular.value):
+      return modular.modular_det([e.coefficients for e in a.equations], a.num_type)
 
-      for j in range(size):
-        temp_cofact = cofactor(a, row, j)
-        
-        if (a.num_type == frac.NumberType.RealNum.value):
-          sum = frac.rf_add(sum, temp_cofact, "+")
-        elif (a.num_type == frac.NumberType.ComplexNum.value):
-          sum = frac.cf_add(sum, temp_cofact, "+")
+    elif (method == determ.DetMethod.Sparse.value):
+      return a.to_sparse().det()
+
+    else:
+      return minor_table(a).det()
 
-      return sum
   elif (not is_square):
     a.matrix_err(2);
 
@@ -820,149 +957,244 @@ def print_original_vect_set(m: Matrix):
   m.print_matrix()
       
 
-# get_lin_indep(m, no_vects, result) gets all the linear independent vectors with 'no_vects' of vectors
-#   from the matrix 'm'
+# get_lin_indep(m, no_vects, result, workers, start, stop, verbose) gets all the linear independent vectors
+#   with 'no_vects' of vectors from the matrix 'm'
 # requires: 0 <= no_vects <= len(m.equations[0].coefficients)
-def get_lin_indep(m: Matrix, no_vects: int, result: List[List[int]]) -> List[List[int]]:
-  current_combo = []
-  available_vects = []
-  num_type = m.num_type
-  for i in range(m.cols):
-    current_combo.append(i)
-    temp_col = copy.deepcopy(m.get_column(i)) 
-    available_vects.append(temp_col)
-
-
-  vect_combos = count.combination(current_combo, m.cols, no_vects)
-
-  for i in range(len(vect_combos)):
-    temp_vects = []
-    print(f"Set of Vectors: {vect_combos[i]}")
-    print("Matrix:")
-
-    for j in range(no_vects):
-      current_vect = copy.deepcopy(available_vects[vect_combos[i][j]])
-      temp_vects.append(current_vect)
-
-    temp_matrix = matrix_from_vects(temp_vects, num_type)
-    temp_matrix.print_matrix()
-    print()
-    temp_matrix.gauss_jordan(verbose = False)
-
-    print("Conclusion: ", end = "")
-    if (temp_matrix.pivots == temp_matrix.cols):
-      for j in range(no_vects):
-        vect_combos[i][j] += 1
-      result.append(vect_combos[i])
-      print("Independent")
-    else:
-      print("Dependent")
-    print()
-  
+# effects: prints output if 'verbose' is True
+# note: the search is split between 'workers' processes if 'workers' is bigger than 1
+#       only the sets of vectors whose position in lexicographic order, as given by
+#         'counting.rank_combination', is in between 'start' and 'stop' - 1 are checked
+def get_lin_indep(m: Matrix, no_vects: int, result: List[List[int]], workers: int = 1,
+                  start: int = 0, stop: Optional[int] = None, verbose: bool = True) -> List[List[int]]:
+  columns = [m.get_column(i) for i in range(m.cols)]
+  found = indep.independent_sets(columns, m.num_type, no_vects, no_vects, workers, start, stop)[no_vects]
+
+  if (verbose):
+    print(f"Number of Independent Sets with {no_vects} Vectors: {len(found)}")
+  for s in found:
+    result.append([i + 1 for i in s])
+
   return result
 
 
-# get_lin_indep_combo(m, result) Get all linear independent vector
+# get_lin_indep_combo(m, result, workers, verbose) Get all linear independent vector
 #    combinations for matrix 'm'
-# effects: prints output
-def get_lin_indep_combo(m: Matrix, result: List[List[int]]) -> List[List[int]]:
-  print_original_vect_set(m)
+# effects: prints output if 'verbose' is True
+# note: the search is split between 'workers' processes if 'workers' is bigger than 1
+def get_lin_indep_combo(m: Matrix, result: List[List[int]], workers: int = 1,
+                        verbose: bool = True) -> List[List[int]]:
+  if (verbose):
+    print_original_vect_set(m)
+
+  columns = [m.get_column(i) for i in range(m.cols)]
+  found = indep.independent_sets(columns, m.num_type, 1, m.rows, workers)
 
   for i in range (m.rows, 0, -1):
-    print(f"\nNo. of Vectors in Matrix: {i}\n")
-    result = get_lin_indep(m, i, result)
+    if (verbose):
+      print(f"\nNo. of Vectors in Matrix: {i}\n")
+      print(f"Number of Independent Sets: {len(found[i])}")
+    for s in found[i]:
+      result.append([j + 1 for j in s])
 
   result.append([])
   return result
 
 
-# get_cob_matrix(m_1, m_2) Gets the Change of Basis Matrix from 'm_1'
-#   to 'm_2'
-# effects: prints output
-def get_cob_matrix(m_1: Matrix, m_2: Matrix) -> Matrix:
-  if (not m_1.is_square()):
-    m_1.matrix_err(2)
+# iter_lin_indep(m, no_vects, limit) Lazily gets the linear independent vectors with
+#   'no_vects' of vectors from the matrix 'm'
+# requires: 0 <= no_vects <= len(m.equations[0].coefficients)
+# note: each set is given as soon as it is found, in lexicographic order
+#       at most 'limit' sets are given, if 'limit' is given
+def iter_lin_indep(m: Matrix, no_vects: int, limit: Optional[int] = None) -> Iterator[List[int]]:
+  columns = [m.get_column(i) for i in range(m.cols)]
+  found = indep.iter_independent_sets(columns, m.num_type, no_vects, no_vects)
+
+  for s in itertools.islice(found, limit):
+    yield [i + 1 for i in s]
+
+
+# iter_lin_indep_combo(m, limit, maximal_only) Lazily gets all linear independent
+#   vector combinations for matrix 'm'
+# note: each set is given as soon as it is found, with the empty set given last
+#       the sets with the same number of vectors are given in lexicographic order,
+#         but sets with different numbers of vectors are mixed together
+#       at most 'limit' sets are given, if 'limit' is given
+#       if 'maximal_only' is True, only the sets that are not part of a bigger
+#         independent set are given
+def iter_lin_indep_combo(m: Matrix, limit: Optional[int] = None,
+                         maximal_only: bool = False) -> Iterator[List[int]]:
+  columns = [m.get_column(i) for i in range(m.cols)]
+  found = indep.iter_independent_sets(columns, m.num_type, 1, m.rows, maximal_only)
+  given = 0
+
+  for s in found:
+    if (limit is not None and given >= limit):
+      return
+
+    yield [i + 1 for i in s]
+    given += 1
+
+  # the empty set is always independent, but it is only maximal if there
+  #   are no other independent sets
+  if ((not maximal_only or not given) and (limit is None or given < limit)):
+    yield []
+
+
+# BASIS_CACHE_SIZE: the number of bases whose factorizations are kept by a
+#   BasisRegistry
+BASIS_CACHE_SIZE = 64
+
+
+# matrix_key(m) Gets a key made from the coefficients of 'm', so that matrices
+#   with the same coefficients have the same key
+def matrix_key(m: Matrix) -> tuple:
+  if (m.num_type == frac.NumberType.RealNum.value):
+    rows = tuple(tuple((x.num, x.denom) for x in e.coefficients) for e in m.equations)
+  else:
+    rows = tuple(tuple((x.re_num, x.im_num, x.denom) for x in e.coefficients) for e in m.equations)
+
+  return (m.num_type, rows)
+
+
+# BasisRegistry: Keeps the LU factorization of each basis it is given, so that the
+#   change of basis matrices between bases are found without eliminating the same
+#   basis more than once
+# note: the bases are looked up by their coefficients, so a copy of a basis uses
+#         the factorization of the original
+#       only the 'max_size' bases used most recently are kept
+class BasisRegistry:
+  def __init__(self, max_size: int = BASIS_CACHE_SIZE):
+    self.max_size = max_size
+    self.factors = {}
+
+
+  # factor(basis) Gets the LU factorization of 'basis'
+  # effects: may raise an 'errors.CalculatorError'
+  #          may modify 'self.factors'
+  def factor(self, basis: Matrix) -> lu.LUFactorization:
+    key = matrix_key(basis)
+    factors = self.factors.pop(key, None)
+
+    if (factors is None):
+      factors = basis.lu_factor()
+      if (factors.is_singular()):
+        basis.matrix_err(3)
+
+    # the most recently used bases are kept at the end
+    self.factors[key] = factors
+    if (len(self.factors) > self.max_size):
+      del self.factors[next(iter(self.factors))]
+
+    return factors
+
 
-  if (not m_2.is_square()):
-    m_2.matrix_err(2)
+  # cob_matrix(m_1, m_2) Gets the Change of Basis Matrix from 'm_1' to 'm_2'
+  # effects: may raise an 'errors.CalculatorError'
+  #          may modify 'self.factors'
+  # note: solves the factorization of 'm_2' against each column of 'm_1',
+  #         without changing 'm_1' or 'm_2'
+  def cob_matrix(self, m_1: Matrix, m_2: Matrix) -> Matrix:
+    if (not m_1.is_square()):
+      m_1.matrix_err(2)
 
-  m_1_equations = copy.deepcopy(m_1.equations)
-  m_2.inv_equations = m_1_equations
-  m_2.gauss_jordan(True, False)
+    cob_rows = self.factor(m_2).solve_many([e.coefficients for e in m_1.equations])
+    return from_rows(cob_rows, m_2.num_type)
 
-  cob_equations = copy.deepcopy(m_2.inv_equations)
-  cob_num_type = m_2.num_type
-  cob_augumented = False
 
-  return Matrix(cob_equations, cob_num_type, cob_augumented)
+  # cob_pair(basis_1, basis_2) Gets the Change of Basis Matrices from 'basis_1'
+  #   to 'basis_2' and from 'basis_2' to 'basis_1'
+  # effects: may raise an 'errors.CalculatorError'
+  #          may modify 'self.factors'
+  def cob_pair(self, basis_1: Matrix, basis_2: Matrix) -> Tuple[Matrix, Matrix]:
+    return (self.cob_matrix(basis_1, basis_2), self.cob_matrix(basis_2, basis_1))
 
 
-# basis_convert(m_1, basis_1, basis_2) Converts 'm_1' of 'basis_1' to 
+  # clear() Removes all the factorizations kept
+  # effects: modifies 'self.factors'
+  def clear(self):
+    self.factors = {}
+
+
+# BASIS_REGISTRY: the bases factored by the change of basis operations
+BASIS_REGISTRY = BasisRegistry()
+
+
+# get_cob_matrix(m_1, m_2) Gets the Change of Basis Matrix from 'm_1'
+#   to 'm_2'
+# effects: may raise an 'errors.CalculatorError'
+# note: the factorization of 'm_2' is kept in 'BASIS_REGISTRY'
+def get_cob_matrix(m_1: Matrix, m_2: Matrix) -> Matrix:
+  if (isinstance(m_2, numeric.NumericMatrix)):
+    return numeric.n_cob_matrix(m_1, m_2)
+
+  return BASIS_REGISTRY.cob_matrix(m_1, m_2)
+
+
+# basis_convert(m_1, basis_1, basis_2, verbose) Converts 'm_1' of 'basis_1' to 
 #   'basis_2'
-# effects: may end the program
-#          prints output
-def basis_convert(m_1: Matrix, basis_1: Matrix, basis_2: Matrix) -> Matrix:
+# effects: may raise an 'errors.CalculatorError'
+#          prints output if 'verbose' is True
+def basis_convert(m_1: Matrix, basis_1: Matrix, basis_2: Matrix, verbose: bool = True) -> Matrix:
   if ((basis_1.cols != basis_2.cols) or 
       (basis_1.rows != basis_2.rows)):
     m_error(5)
 
-  cob_m = get_cob_matrix(copy.deepcopy(basis_1), 
-                         copy.deepcopy(basis_2))
+  cob_m = get_cob_matrix(basis_1, basis_2)
 
-  print("Change of Basis from old basis A to new basis B (B_[I]_A):")
-  cob_m.print_matrix()
+  if (verbose):
+    print("Change of Basis from old basis A to new basis B (B_[I]_A):")
+    cob_m.print_matrix()
 
   result = m_multiply(cob_m, m_1)
   return result
 
 
-# t_basis_convert(t, basis_1, basis_2) Converts matrix representation 
+# t_basis_convert(t, basis_1, basis_2, verbose) Converts matrix representation 
 #   of transformation 't' of 'basis_1' to 'basis_2' 
-# effects: may end the program
-#          prints output
-def t_basis_convert(t: Matrix, basis_1: Matrix, basis_2: Matrix) -> Matrix:
+# effects: may raise an 'errors.CalculatorError'
+#          prints output if 'verbose' is True
+def t_basis_convert(t: Matrix, basis_1: Matrix, basis_2: Matrix, verbose: bool = True) -> Matrix:
   if ((basis_1.cols != basis_2.cols) or 
       (basis_1.rows != basis_2.rows)):
     m_error(5)
 
-  cob_m = get_cob_matrix(copy.deepcopy(basis_2), 
-                         copy.deepcopy(basis_1))
-  print("Change of Basis from new basis B to old basis A (A_[I]_B):")
-  cob_m.print_matrix()
-  inv_cob_m = get_cob_matrix(copy.deepcopy(basis_1), 
-                             copy.deepcopy(basis_2))
+  if (isinstance(basis_1, numeric.NumericMatrix)):
+    inv_cob_m = get_cob_matrix(basis_1, basis_2)
+    cob_m = get_cob_matrix(basis_2, basis_1)
+  else:
+    inv_cob_m, cob_m = BASIS_REGISTRY.cob_pair(basis_1, basis_2)
 
-  print("\nChange of Basis from old basis A to new basis B (B_[I]_A):")
-  inv_cob_m.print_matrix()
+  if (verbose):
+    print("Change of Basis from new basis B to old basis A (A_[I]_B):")
+    cob_m.print_matrix()
 
-  result = m_multiply(inv_cob_m, t)
-  result = m_multiply(result, cob_m)
-  return result
+    print("\nChange of Basis from old basis A to new basis B (B_[I]_A):")
+    inv_cob_m.print_matrix()
 
+  return m_chain_multiply([inv_cob_m, t, cob_m])
 
-# gen_t_basis_convert(t, basis_1, basis_2, basis_3, basis_4) Converts matrix representation 
+
+# gen_t_basis_convert(t, basis_1, basis_2, basis_3, basis_4, verbose) Converts matrix representation 
 #   of transformation 't' that maps from basis_1 to basis_2 to the matrix representation
 #   of the transformation that maps from basis_3 to basis_4
-# effects: may end the program
-#          prints output
+# effects: may raise an 'errors.CalculatorError'
+#          prints output if 'verbose' is True
 def gen_t_basis_convert(t: Matrix, basis_1: Matrix, basis_2: Matrix, basis_3: Matrix, 
-                        basis_4: Matrix) -> Matrix:
+                        basis_4: Matrix, verbose: bool = True) -> Matrix:
   if ((basis_1.cols != basis_3.cols) or 
       (basis_1.rows != basis_3.rows) or
       (basis_2.cols != basis_4.cols) or 
       (basis_2.rows != basis_4.rows)):
     m_error(5)
 
-  cob_m = get_cob_matrix(copy.deepcopy(basis_3), 
-                         copy.deepcopy(basis_1))
-  print("Change of Basis from basis C to basis A (A_[I]_C):")
-  cob_m.print_matrix()
-  inv_cob_m = get_cob_matrix(copy.deepcopy(basis_2), 
-                             copy.deepcopy(basis_4))
+  cob_m = get_cob_matrix(basis_3, basis_1)
+  inv_cob_m = get_cob_matrix(basis_2, basis_4)
 
-  print("\nChange of Basis from basis B to basis D (D_[I]_B):")
-  inv_cob_m.print_matrix()
+  if (verbose):
+    print("Change of Basis from basis C to basis A (A_[I]_C):")
+    cob_m.print_matrix()
 
-  result = m_multiply(inv_cob_m, t)
-  result = m_multiply(result, cob_m)
-  return result
+    print("\nChange of Basis from basis B to basis D (D_[I]_B):")
+    inv_cob_m.print_matrix()
+
+  return m_chain_multiply([inv_cob_m, t, cob_m])
@@ -0,0 +1,130 @@
+import errors
+import fraction as frac
+from typing import List, Union
+
+Entry = Union[frac.RealFraction, frac.ComplexFraction]
+
+
+# MINOR_CACHE_SIZE: the number of minors kept by a MinorTable
+# note: the determinant of an n by n matrix needs about 2^n minors, so every
+#         minor fits for matrices with up to about 20 rows
+MINOR_CACHE_SIZE = 1 << 20
+
+
+# MinorTable: The minors of a square matrix, found by cofactor expansion,
+#   where each minor is computed once and kept under its (row set, column set)
+# requires: 'rows' is not empty and every row has len(rows) entries
+#           1 <= max_size
+# note: a set of rows or columns is kept as a bitmask, where bit i is set if
+#         row or column i is in the set
+#       each minor is expanded along the last row in its row set, so the minors
+#         of the determinant only use the first k rows, and there are at most
+#         2^n of them, each found in O(n) operations, for O(2^n * n) in total
+#       the cofactors use the same table, so the whole cofactor matrix is
+#         found in O(2^n * n^2) operations instead of O(2^n * n^3)
+#       only the 'max_size' minors used most recently are kept, and a minor
+#         that was removed is computed again if it is needed later
+class MinorTable:
+  def __init__(self, rows: List[List[Entry]], num_type: frac.NumberType, max_size: int = MINOR_CACHE_SIZE):
+    self.size = len(rows)
+    self.num_type = num_type
+    self.max_size = max_size
+    self.rows = rows
+    self.full_mask = (1 << self.size) - 1
+    self.minors = {}
+    self.evictions = 0
+
+    if (any(len(r) != self.size for r in rows)):
+      raise errors.NotSquareError("ERROR: The Expanded Matrix is not a square matrix", 2)
+
+    if (num_type == frac.NumberType.RealNum.value):
+      self.add = frac.rf_add
+      self.multiply = frac.rf_multiply
+      self.get_zero = frac.r_get_zero
+      self.get_one = frac.r_get_one
+    else:
+      self.add = frac.cf_add
+      self.multiply = frac.cf_multiply
+      self.get_zero = frac.c_get_zero
+      self.get_one = frac.c_get_one
+
+
+  # minor(row_mask, col_mask) Gets the determinant of the matrix left with only
+  #   the rows in 'row_mask' and the columns in 'col_mask'
+  # requires: 'row_mask' and 'col_mask' have the same number of bits set
+  # effects: may modify 'self.minors' and 'self.evictions'
+  # note: the minor of no rows and no columns is 1
+  def minor(self, row_mask: int, col_mask: int) -> Entry:
+    if (not row_mask):
+      return self.get_one()
+    elif (not (row_mask & (row_mask - 1))):
+      return self.rows[row_mask.bit_length() - 1][col_mask.bit_length() - 1]
+
+    key = (row_mask, col_mask)
+    result = self.minors.pop(key, None)
+
+    if (result is None):
+      row = row_mask.bit_length() - 1
+      other_rows = row_mask & ~(1 << row)
+      entries = self.rows[row]
+
+      # the expanded row is the last row of the minor, so the sign of each
+      #   term only depends on the position of its column
+      position = bin(row_mask).count("1") - 1
+      result = self.get_zero()
+      col_mask_left = col_mask
+      while (col_mask_left):
+        bit = col_mask_left & -col_mask_left
+        col_mask_left ^= bit
+
+        entry = entries[bit.bit_length() - 1]
+        if (not entry.is_zero()):
+          term = self.multiply(entry, self.minor(other_rows, col_mask ^ bit))
+          result = self.add(result, term, "-" if (position % 2) else "+")
+
+        position += 1
+
+    # the most recently used minors are kept at the end
+    self.minors[key] = result
+    if (len(self.minors) > self.max_size):
+      del self.minors[next(iter(self.minors))]
+      self.evictions += 1
+
+    return result
+
+
+  # det() Gets the determinant of the matrix
+  # effects: may modify 'self.minors' and 'self.evictions'
+  def det(self) -> Entry:
+    return self.minor(self.full_mask, self.full_mask)
+
+
+  # cofactor(i_row, j_col) Gets the (i_row, j_col) cofactor of the matrix
+  # requires: 0 <= i_row < self.size
+  #           0 <= j_col < self.size
+  # effects: may modify 'self.minors' and 'self.evictions'
+  def cofactor(self, i_row: int, j_col: int) -> Entry:
+    result = self.minor(self.full_mask ^ (1 << i_row), self.full_mask ^ (1 << j_col))
+    if ((i_row + j_col) % 2):
+      result = self.add(self.get_zero(), result, "-")
+
+    return result
+
+
+  # cofactor_rows() Gets the rows of the cofactor matrix
+  # effects: may modify 'self.minors' and 'self.evictions'
+  def cofactor_rows(self) -> List[List[Entry]]:
+    return [[self.cofactor(i, j) for j in range(self.size)] for i in range(self.size)]
+
+
+  # adjugate_rows() Gets the rows of the adjugate matrix, which is the transpose
+  #   of the cofactor matrix
+  # effects: may modify 'self.minors' and 'self.evictions'
+  def adjugate_rows(self) -> List[List[Entry]]:
+    return [[self.cofactor(j, i) for j in range(self.size)] for i in range(self.size)]
+
+
+  # clear() Removes all the minors kept
+  # effects: modifies 'self.minors'
+  def clear(self):
+    self.minors = {}
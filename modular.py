@@ -0,0 +1,278 @@
+import math
+import number_theory as nt
+import fraction as frac
+import determinant as determ
+import dense
+from typing import List, Tuple, Union
+
+# FIRST_PRIME: the largest prime used, every other prime used is the next
+#   smaller prime so all residues fit in a machine word
+FIRST_PRIME = 2 ** 31 - 1
+
+# word_primes: word sized primes that have been found so far, in decreasing
+#   order
+word_primes = []
+
+# gaussian_primes: word sized primes that are 1 (mod 4) with a square root
+#   of -1 (mod p), in decreasing order
+gaussian_primes = []
+
+
+# get_prime(index) Gets the 'index'th largest word sized prime
+# effects: may modify 'word_primes'
+def get_prime(index: int) -> int:
+  candidate = word_primes[-1] - 1 if word_primes else FIRST_PRIME
+
+  while (len(word_primes) <= index):
+    if (nt.is_prime(candidate)):
+      word_primes.append(candidate)
+    candidate -= 1
+
+  return word_primes[index]
+
+
+# get_gaussian_prime(index) Gets the 'index'th largest word sized prime p,
+#   where p = 1 (mod 4), together with a square root of -1 (mod p)
+# effects: may modify 'word_primes' and 'gaussian_primes'
+def get_gaussian_prime(index: int) -> Tuple[int, int]:
+  i = 0
+  while (len(gaussian_primes) <= index):
+    p = get_prime(i)
+    i += 1
+
+    if (p % 4 != 1 or (gaussian_primes and p >= gaussian_primes[-1][0])):
+      continue
+
+    # any quadratic non-residue c gives c^((p - 1) / 4) as a root of -1
+    for c in range(2, p):
+      if (pow(c, (p - 1) // 2, p) == p - 1):
+        gaussian_primes.append((p, pow(c, (p - 1) // 4, p)))
+        break
+
+  return gaussian_primes[index]
+
+
+# det_mod_p(rows, p) Computes the determinant of the square integer matrix
+#   'rows' modulo the prime 'p'
+def det_mod_p(rows: List[List[int]], p: int) -> int:
+  work = [[x % p for x in r] for r in rows]
+  size = len(work)
+  result = 1
+
+  for k in range(size):
+    pivot_row = None
+    for i in range(k, size):
+      if (work[i][k]):
+        pivot_row = i
+        break
+
+    if (pivot_row is None):
+      return 0
+    elif (pivot_row != k):
+      work[k], work[pivot_row] = work[pivot_row], work[k]
+      result = -result
+
+    pivot = work[k][k]
+    result = (result * pivot) % p
+    pivot_inv = pow(pivot, -1, p)
+    current_row = work[k]
+
+    pivot_tail = current_row[k + 1:]
+
+    for i in range(k + 1, size):
+      factor = (work[i][k] * pivot_inv) % p
+      if (factor):
+        target = work[i]
+        target[k + 1:] = [(t - factor * c) % p for t, c in zip(target[k + 1:], pivot_tail)]
+
+  return result % p
+
+
+# rank_mod_p(rows, p) Computes the rank of the integer matrix 'rows'
+#   modulo the prime 'p'
+def rank_mod_p(rows: List[List[int]], p: int) -> int:
+  work = [[x % p for x in r] for r in rows]
+  row_count = len(work)
+  col_count = len(work[0])
+  rank = 0
+
+  for col in range(col_count):
+    if (rank == row_count):
+      break
+
+    pivot_row = None
+    for i in range(rank, row_count):
+      if (work[i][col]):
+        pivot_row = i
+        break
+
+    if (pivot_row is None):
+      continue
+
+    work[rank], work[pivot_row] = work[pivot_row], work[rank]
+    pivot_inv = pow(work[rank][col], -1, p)
+    current_row = work[rank]
+
+    pivot_tail = current_row[col + 1:]
+
+    for i in range(rank + 1, row_count):
+      factor = (work[i][col] * pivot_inv) % p
+      if (factor):
+        target = work[i]
+        target[col + 1:] = [(t - factor * c) % p for t, c in zip(target[col + 1:], pivot_tail)]
+
+    rank += 1
+
+  return rank
+
+
+# crt(residue, modulus, new_residue, new_modulus) Combines x = residue (mod modulus)
+#   and x = new_residue (mod new_modulus) into x (mod modulus * new_modulus)
+# requires: 'modulus' and 'new_modulus' are coprime
+def crt(residue: int, modulus: int, new_residue: int, new_modulus: int) -> int:
+  diff = ((new_residue - residue) * pow(modulus, -1, new_modulus)) % new_modulus
+  return residue + modulus * diff
+
+
+# symmetric(residue, modulus) Gets the representative of 'residue' that is
+#   in between -modulus / 2 and modulus / 2
+def symmetric(residue: int, modulus: int) -> int:
+  residue %= modulus
+  if (residue > modulus // 2):
+    residue -= modulus
+
+  return residue
+
+
+# hadamard_bound(norms) Computes an upper bound for the absolute value of the
+#   determinant of the matrix whose rows have the squared lengths 'norms'
+def hadamard_bound(norms: List[int]) -> int:
+  return math.isqrt(math.prod(norms)) + 1
+
+
+# modular_det_int(rows) Computes the determinant of the square integer
+#   matrix 'rows' from its determinants modulo several primes
+def modular_det_int(rows: List[List[int]]) -> int:
+  bound = hadamard_bound([sum(x * x for x in r) for r in rows])
+  residue = 0
+  modulus = 1
+  i = 0
+
+  while (modulus <= 2 * bound):
+    p = get_prime(i)
+    residue = crt(residue, modulus, det_mod_p(rows, p), p)
+    modulus *= p
+    i += 1
+
+  return symmetric(residue, modulus)
+
+
+# modular_det_gi(rows) Computes the determinant of the square gaussian integer
+#   matrix 'rows' from its determinants modulo several primes
+# note: for each prime p = 1 (mod 4) with s^2 = -1 (mod p), a + bi is sent to
+#         a + bs and to a - bs, which gives the real and imaginary parts of the
+#         determinant modulo p
+def modular_det_gi(rows: List[List[Tuple[int, int]]]) -> Tuple[int, int]:
+  bound = hadamard_bound([sum(x[0] * x[0] + x[1] * x[1] for x in r) for r in rows])
+  real_residue = 0
+  im_residue = 0
+  modulus = 1
+  i = 0
+
+  while (modulus <= 2 * bound):
+    p, root = get_gaussian_prime(i)
+    det_1 = det_mod_p([[x[0] + x[1] * root for x in r] for r in rows], p)
+    det_2 = det_mod_p([[x[0] - x[1] * root for x in r] for r in rows], p)
+
+    half = pow(2, -1, p)
+    real_part = ((det_1 + det_2) * half) % p
+    im_part = ((det_1 - det_2) * half * pow(root, -1, p)) % p
+
+    real_residue = crt(real_residue, modulus, real_part, p)
+    im_residue = crt(im_residue, modulus, im_part, p)
+    modulus *= p
+    i += 1
+
+  return (symmetric(real_residue, modulus), symmetric(im_residue, modulus))
+
+
+# modular_det(rows, num_type, verify) Computes the determinant of the square
+#   matrix whose rows are 'rows' using modular arithmetic and the chinese
+#   remainder theorem
+# requires: 'rows' is not empty and every row has len(rows) entries
+# note: if 'verify' is True, the result is checked against the bareiss algorithm
+#         and the bareiss result is returned if they do not agree
+def modular_det(rows: Union[List[List[frac.RealFraction]], List[List[frac.ComplexFraction]]],
+                num_type: frac.NumberType, verify: bool = False) -> Union[frac.RealFraction, frac.ComplexFraction]:
+  if (num_type == frac.NumberType.RealNum.value):
+    int_rows, scale = determ.real_int_rows(rows)
+    result = frac.reduce_real(modular_det_int(int_rows), scale)
+
+  elif (num_type == frac.NumberType.ComplexNum.value):
+    int_rows, scale = determ.complex_int_rows(rows)
+    det_gi = modular_det_gi(int_rows)
+    result = frac.reduce_complex(det_gi[0], det_gi[1], scale)
+
+  if (verify):
+    exact = determ.bareiss_det(rows, num_type)
+    if (result != exact):
+      return exact
+
+  return result
+
+
+# minor_bound(norms) Computes an upper bound for the absolute value of every
+#   minor of the matrix whose rows have the squared lengths 'norms'
+# note: a minor with a row of 0s is 0, and every other row has a squared length
+#         of at least 1, so the hadamard bound of the rows that are not 0 bounds
+#         the minors of every size
+def minor_bound(norms: List[int]) -> int:
+  return hadamard_bound([n for n in norms if n])
+
+
+# modular_rank(rows, num_type, verify) Computes the rank of the matrix whose rows are
+#   'rows' using modular arithmetic
+# requires: 'rows' is not empty and every row has the same number of entries
+# note: the rank modulo a prime is never bigger than the actual rank, and is only
+#         smaller if the prime divides every minor of the size of the actual rank,
+#         so the largest rank found is taken over enough primes that their product
+#         is bigger than 'minor_bound', which no minor that is not 0 can be a
+#         multiple of
+#       for complex entries, a + bi is sent to a + bs modulo each prime p, where
+#         s^2 = -1 (mod p), and only divides a minor if p divides its norm, so the
+#         product of the primes needs to be bigger than the square of 'minor_bound'
+#       if 'verify' is True, the result is also checked against the exact
+#         gauss-jordan algorithm and the exact rank is returned if they do not agree
+def modular_rank(rows: Union[List[List[frac.RealFraction]], List[List[frac.ComplexFraction]]],
+                 num_type: frac.NumberType, verify: bool = False) -> int:
+  max_rank = min(len(rows), len(rows[0]))
+  rank = 0
+  modulus = 1
+  i = 0
+
+  if (num_type == frac.NumberType.RealNum.value):
+    int_rows = determ.real_int_rows(rows)[0]
+    bound = minor_bound([sum(x * x for x in r) for r in int_rows])
+
+    while (modulus <= bound and rank < max_rank):
+      p = get_prime(i)
+      rank = max(rank, rank_mod_p(int_rows, p))
+      modulus *= p
+      i += 1
+
+  elif (num_type == frac.NumberType.ComplexNum.value):
+    int_rows = determ.complex_int_rows(rows)[0]
+    bound = minor_bound([sum(x[0] * x[0] + x[1] * x[1] for x in r) for r in int_rows]) ** 2
+
+    while (modulus <= bound and rank < max_rank):
+      p, root = get_gaussian_prime(i)
+      rank = max(rank, rank_mod_p([[x[0] + x[1] * root for x in r] for r in int_rows], p))
+      modulus *= p
+      i += 1
+
+  if (verify and rank != max_rank):
+    exact = dense.from_rows(rows, [], num_type, False)
+    exact.gauss_jordan(False, False)
+    rank = exact.pivots
+
+  return rank
@@ -0,0 +1,247 @@
+import operator
+import number_theory as nt
+import fraction as frac
+from typing import List, Tuple, Union
+
+# BLOCK_SIZE: the length of the pieces each dot product is split into by
+#   the blocked multiplication
+BLOCK_SIZE = 64
+
+# STRASSEN_THRESHOLD: products where every dimension is at least this size
+#   are split with the Strassen-Winograd recursion
+STRASSEN_THRESHOLD = 128
+
+# MIN_ENGINE_SIZE: products where every dimension is at least this size are
+#   computed on integers by 'exact_multiply' instead of one dot product of
+#   fractions at a time
+MIN_ENGINE_SIZE = 8
+
+IntMatrix = List[List[int]]
+
+
+# int_add(a, b) Computes a + b for the integer matrices 'a' and 'b'
+def int_add(a: IntMatrix, b: IntMatrix) -> IntMatrix:
+  return [list(map(operator.add, x, y)) for x, y in zip(a, b)]
+
+
+# int_sub(a, b) Computes a - b for the integer matrices 'a' and 'b'
+def int_sub(a: IntMatrix, b: IntMatrix) -> IntMatrix:
+  return [list(map(operator.sub, x, y)) for x, y in zip(a, b)]
+
+
+# transpose(a) Gets the transpose of the matrix 'a'
+# requires: 'a' is not empty
+def transpose(a: list) -> list:
+  return [list(col) for col in zip(*a)]
+
+
+# blocked_multiply(a, b, block_size) Computes ab for the integer matrices 'a' and 'b'
+# requires: len(a[0]) = len(b)
+# note: the inner dimension is split into pieces of 'block_size', so each piece of
+#         the columns of 'b' is reused for every row of 'a' while it is still in cache
+def blocked_multiply(a: IntMatrix, b: IntMatrix, block_size: int = BLOCK_SIZE) -> IntMatrix:
+  rows = len(a)
+  inner = len(b)
+  b_columns = transpose(b)
+  result = [[0] * len(b_columns) for _ in range(rows)]
+
+  for start in range(0, inner, block_size):
+    stop = min(start + block_size, inner)
+    column_blocks = [col[start:stop] for col in b_columns]
+
+    for i in range(rows):
+      a_block = a[i][start:stop]
+      result_row = result[i]
+      for j in range(len(column_blocks)):
+        result_row[j] += sum(map(operator.mul, a_block, column_blocks[j]))
+
+  return result
+
+
+# pad(a, rows, cols) Adds rows and columns of 0 to the bottom and the right of 'a'
+#   until it has 'rows' rows and 'cols' columns
+def pad(a: IntMatrix, rows: int, cols: int) -> IntMatrix:
+  extra = [0] * (cols - len(a[0]))
+  return [r + extra for r in a] + [[0] * cols for _ in range(rows - len(a))]
+
+
+# split(a) Splits the integer matrix 'a', with an even number of rows and columns,
+#   into its 4 quadrants
+def split(a: IntMatrix) -> Tuple[IntMatrix, IntMatrix, IntMatrix, IntMatrix]:
+  half_rows = len(a) // 2
+  half_cols = len(a[0]) // 2
+  top = a[:half_rows]
+  bottom = a[half_rows:]
+
+  return ([r[:half_cols] for r in top], [r[half_cols:] for r in top],
+          [r[:half_cols] for r in bottom], [r[half_cols:] for r in bottom])
+
+
+# strassen_multiply(a, b, threshold, block_size) Computes ab for the integer matrices
+#   'a' and 'b' using the Strassen-Winograd recursion
+# requires: len(a[0]) = len(b)
+# note: uses 7 products of half the size instead of 8, down to products that have a
+#         dimension smaller than 'threshold', which use 'blocked_multiply'
+#       odd dimensions are padded with 0 at each step
+def strassen_multiply(a: IntMatrix, b: IntMatrix, threshold: int = STRASSEN_THRESHOLD,
+                      block_size: int = BLOCK_SIZE) -> IntMatrix:
+  rows = len(a)
+  inner = len(b)
+  cols = len(b[0])
+
+  if (min(rows, inner, cols) < max(threshold, 2)):
+    return blocked_multiply(a, b, block_size)
+
+  padded_rows = rows + (rows % 2)
+  padded_inner = inner + (inner % 2)
+  padded_cols = cols + (cols % 2)
+  a_11, a_12, a_21, a_22 = split(pad(a, padded_rows, padded_inner))
+  b_11, b_12, b_21, b_22 = split(pad(b, padded_inner, padded_cols))
+
+  s_1 = int_add(a_21, a_22)
+  s_2 = int_sub(s_1, a_11)
+  s_3 = int_sub(a_11, a_21)
+  s_4 = int_sub(a_12, s_2)
+  t_1 = int_sub(b_12, b_11)
+  t_2 = int_sub(b_22, t_1)
+  t_3 = int_sub(b_22, b_12)
+  t_4 = int_sub(t_2, b_21)
+
+  m_1 = strassen_multiply(a_11, b_11, threshold, block_size)
+  m_2 = strassen_multiply(a_12, b_21, threshold, block_size)
+  m_3 = strassen_multiply(s_4, b_22, threshold, block_size)
+  m_4 = strassen_multiply(a_22, t_4, threshold, block_size)
+  m_5 = strassen_multiply(s_1, t_1, threshold, block_size)
+  m_6 = strassen_multiply(s_2, t_2, threshold, block_size)
+  m_7 = strassen_multiply(s_3, t_3, threshold, block_size)
+
+  u_2 = int_add(m_1, m_6)
+  u_3 = int_add(u_2, m_7)
+  u_4 = int_add(u_2, m_5)
+  c_11 = int_add(m_1, m_2)
+  c_12 = int_add(u_4, m_3)
+  c_21 = int_sub(u_3, m_4)
+  c_22 = int_add(u_3, m_5)
+
+  result = [x + y for x, y in zip(c_11, c_12)] + [x + y for x, y in zip(c_21, c_22)]
+  return [r[:cols] for r in result[:rows]]
+
+
+# int_multiply(a, b, threshold, block_size) Computes ab for the integer matrices
+#   'a' and 'b'
+# requires: len(a[0]) = len(b)
+def int_multiply(a: IntMatrix, b: IntMatrix, threshold: int = STRASSEN_THRESHOLD,
+                 block_size: int = BLOCK_SIZE) -> IntMatrix:
+  return strassen_multiply(a, b, threshold, block_size)
+
+
+# real_parts(rows) Clears the denominators of each row in 'rows'
+# note: returns the integer rows and the factor each row was scaled by
+def real_parts(rows: List[List[frac.RealFraction]]) -> Tuple[IntMatrix, List[int]]:
+  int_rows = []
+  scales = []
+
+  for r in rows:
+    row_lcm = nt.lcm_all(entry.denom for entry in r)
+    int_rows.append([entry.num * (row_lcm // entry.denom) for entry in r])
+    scales.append(row_lcm)
+
+  return (int_rows, scales)
+
+
+# complex_parts(rows) Clears the denominators of each row in 'rows'
+# note: returns the integer rows of the real parts, the integer rows of the
+#         imaginary parts and the factor each row was scaled by
+def complex_parts(rows: List[List[frac.ComplexFraction]]) -> Tuple[IntMatrix, IntMatrix, List[int]]:
+  real_rows = []
+  im_rows = []
+  scales = []
+
+  for r in rows:
+    row_lcm = nt.lcm_all(entry.denom for entry in r)
+    real_rows.append([entry.re_num * (row_lcm // entry.denom) for entry in r])
+    im_rows.append([entry.im_num * (row_lcm // entry.denom) for entry in r])
+    scales.append(row_lcm)
+
+  return (real_rows, im_rows, scales)
+
+
+# exact_multiply(a, b, num_type, threshold, block_size) Computes ab for the matrices
+#   of fractions whose rows are 'a' and 'b'
+# requires: len(a[0]) = len(b)
+# note: each row of 'a' and each column of 'b' is scaled to integers, the integer
+#         matrices are multiplied and each entry is divided by its 2 scales and
+#         reduced once at the end
+#       complex products use 3 integer products, with
+#         (a_r + a_i i)(b_r + b_i i) = (p_1 - p_2) + (p_3 - p_1 - p_2) i
+#         for p_1 = a_r b_r, p_2 = a_i b_i and p_3 = (a_r + a_i)(b_r + b_i)
+def exact_multiply(a: Union[List[List[frac.RealFraction]], List[List[frac.ComplexFraction]]],
+                   b: Union[List[List[frac.RealFraction]], List[List[frac.ComplexFraction]]],
+                   num_type: frac.NumberType, threshold: int = STRASSEN_THRESHOLD,
+                   block_size: int = BLOCK_SIZE) -> Union[List[List[frac.RealFraction]], List[List[frac.ComplexFraction]]]:
+  if (num_type == frac.NumberType.RealNum.value):
+    a_ints, row_scales = real_parts(a)
+    b_ints, col_scales = real_parts(transpose(b))
+    product = int_multiply(a_ints, transpose(b_ints), threshold, block_size)
+
+    return [[frac.reduce_real(product[i][j], row_scales[i] * col_scales[j]) for j in range(len(col_scales))]
+            for i in range(len(row_scales))]
+
+  a_real, a_im, row_scales = complex_parts(a)
+  b_real, b_im, col_scales = complex_parts(transpose(b))
+  b_real = transpose(b_real)
+  b_im = transpose(b_im)
+
+  p_1 = int_multiply(a_real, b_real, threshold, block_size)
+  p_2 = int_multiply(a_im, b_im, threshold, block_size)
+  p_3 = int_multiply(int_add(a_real, a_im), int_add(b_real, b_im), threshold, block_size)
+
+  result = []
+  for i in range(len(row_scales)):
+    temp_row = []
+    for j in range(len(col_scales)):
+      temp_row.append(frac.reduce_complex(p_1[i][j] - p_2[i][j], p_3[i][j] - p_1[i][j] - p_2[i][j],
+                                          row_scales[i] * col_scales[j]))
+    result.append(temp_row)
+
+  return result
+
+
+# chain_order(dims) Finds the order to multiply a chain of matrices in that uses
+#   the fewest multiplications of entries, where the 'i'th matrix has dims[i]
+#   rows and dims[i + 1] columns
+# requires: len(dims) >= 2
+# note: returns the table of splits, where splits[i][j] is the position the
+#         product of matrices 'i' to 'j' is split at, and the number of
+#         multiplications needed
+#       computed by dynamic programming over all the sub-chains, in O(n^3) steps
+#         for a chain of n matrices
+def chain_order(dims: List[int]) -> Tuple[List[List[int]], int]:
+  n = len(dims) - 1
+  costs = [[0] * n for _ in range(n)]
+  splits = [[0] * n for _ in range(n)]
+
+  for length in range(2, n + 1):
+    for i in range(n - length + 1):
+      j = i + length - 1
+      best = None
+
+      for k in range(i, j):
+        cost = costs[i][k] + costs[k + 1][j] + dims[i] * dims[k + 1] * dims[j + 1]
+        if (best is None or cost < best):
+          best = cost
+          splits[i][j] = k
+
+      costs[i][j] = best
+
+  return (splits, costs[0][n - 1])
+
+
+# chain_str(splits, i, j) Formats the order from 'chain_order' to multiply the
+#   matrices 'i' to 'j' in, where the matrices are numbered from 1
+def chain_str(splits: List[List[int]], i: int, j: int) -> str:
+  if (i == j):
+    return str(i + 1)
+
+  k = splits[i][j]
+  return f"({chain_str(splits, i, k)} {chain_str(splits, k + 1, j)})"
@@ -0,0 +1,218 @@
+import math
+import functools
+from typing import Iterable, List
+
+SIEVE_START_SIZE = 1024
+
+# SIEVE_MAX_SIZE: the most numbers that are sieved, so that the sieve stays
+#   small for big inputs
+SIEVE_MAX_SIZE = 1 << 20
+
+# MILLER_RABIN_BASES: the bases used by 'miller_rabin', which give the right
+#   answer for every number smaller than 3.3 * 10^24
+MILLER_RABIN_BASES = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41]
+
+# sieve: sieve[n] is True when 'n' is prime, for every 'n' that has
+#   already been sieved
+sieve = []
+
+# primes: all the primes that are smaller than len(sieve), in order
+primes = []
+
+
+# gcd(a, b) Computes the gcd of 'a' and 'b'
+# note: the result is never negative and gcd(a, 0) = |a|
+def gcd(a: int, b: int) -> int:
+  return math.gcd(a, b)
+
+
+# lcm(a, b) Computes the lcm of 'a' and 'b'
+# note: the result is never negative and lcm(a, 0) = 0
+def lcm(a: int, b: int) -> int:
+  if ((not a) or (not b)):
+    return 0
+
+  return abs(a * b) // math.gcd(a, b)
+
+
+# gcd_all(values) Computes the gcd of every integer in 'values' in a
+#   single pass
+# note: stops early once the gcd reaches 1
+#       the gcd of no values is 0
+def gcd_all(values: Iterable[int]) -> int:
+  result = 0
+
+  for v in values:
+    result = math.gcd(result, v)
+    if (result == 1):
+      break
+
+  return result
+
+
+# lcm_all(values) Computes the lcm of every integer in 'values' in a
+#   single pass
+# note: the lcm of no values is 1
+def lcm_all(values: Iterable[int]) -> int:
+  result = 1
+
+  for v in values:
+    if (not v):
+      return 0
+    elif (result % v):
+      result = abs(result * v) // math.gcd(result, v)
+
+  return result
+
+
+# extend_sieve(limit) Sieves every number up to and including 'limit'
+# effects: modifies 'sieve' and 'primes'
+# note: only the numbers smaller than SIEVE_MAX_SIZE are ever sieved
+def extend_sieve(limit: int):
+  old_size = len(sieve)
+  limit = min(limit, SIEVE_MAX_SIZE - 1)
+  if (limit < old_size):
+    return
+
+  new_size = min(max(limit + 1, 2 * old_size, SIEVE_START_SIZE), SIEVE_MAX_SIZE)
+  sieve.extend([True] * (new_size - old_size))
+  if (not old_size):
+    sieve[0] = False
+    sieve[1] = False
+
+  for p in range(2, math.isqrt(new_size - 1) + 1):
+    if (sieve[p]):
+      first = max(p * p, ((old_size + p - 1) // p) * p)
+      sieve[first::p] = [False] * len(range(first, new_size, p))
+
+  primes.extend(n for n in range(max(old_size, 2), new_size) if sieve[n])
+
+
+# miller_rabin(n) Determines whether 'n' is a prime number with the
+#   Miller-Rabin test on the bases in MILLER_RABIN_BASES
+# requires: n > MILLER_RABIN_BASES[-1]
+# note: the answer is always right for n < 3.3 * 10^24, and a bigger 'n'
+#         that is said to be prime is a strong probable prime to every base
+def miller_rabin(n: int) -> bool:
+  if (not (n % 2)):
+    return False
+
+  d = n - 1
+  shifts = 0
+  while (not (d % 2)):
+    d //= 2
+    shifts += 1
+
+  for a in MILLER_RABIN_BASES:
+    x = pow(a, d, n)
+    if (x == 1 or x == n - 1):
+      continue
+
+    for _ in range(shifts - 1):
+      x = x * x % n
+      if (x == n - 1):
+        break
+    else:
+      return False
+
+  return True
+
+
+# is_prime(n) Determines whether 'n' is a prime number
+# note: numbers smaller than the sieve are looked up directly, numbers up to
+#         SIEVE_MAX_SIZE^2 are checked against the sieved primes up to sqrt(n),
+#         and bigger numbers are checked with 'miller_rabin'
+def is_prime(n: int) -> bool:
+  if (n < 2):
+    return False
+  elif (n < len(sieve)):
+    return sieve[n]
+
+  root = math.isqrt(n)
+  if (root >= SIEVE_MAX_SIZE):
+    return miller_rabin(n)
+
+  extend_sieve(root)
+
+  for p in primes:
+    if (p > root):
+      break
+    elif (not (n % p)):
+      return False
+
+  return True
+
+
+# pollard_rho(n) Finds a factor of 'n' that is neither 1 nor 'n', with
+#   Pollard's rho algorithm and Brent's cycle detection
+# requires: 'n' is odd and is not a prime
+def pollard_rho(n: int) -> int:
+  for c in range(1, n):
+    x = 2
+    y = 2
+    power = 1
+    length = 0
+    factor = 1
+
+    while (factor == 1):
+      if (length == power):
+        x = y
+        power *= 2
+        length = 0
+
+      y = (y * y + c) % n
+      length += 1
+      factor = math.gcd(abs(x - y), n)
+
+    if (factor != n):
+      return factor
+
+  return n
+
+
+# split_factors(n, prime_factors) Adds the prime factors of 'n' to 'prime_factors'
+# requires: 'n' is odd
+# effects: modifies 'prime_factors'
+def split_factors(n: int, prime_factors: List[int]):
+  if (n == 1):
+    return
+  elif (is_prime(n)):
+    prime_factors.append(n)
+    return
+
+  factor = pollard_rho(n)
+  split_factors(factor, prime_factors)
+  split_factors(n // factor, prime_factors)
+
+
+# factorize(n) Computes the prime factorization of 'n' as a tuple
+# requires: n >= 1
+# note: the factors smaller than SIEVE_MAX_SIZE are found by dividing by the
+#         sieved primes, and the factors of what is left by 'pollard_rho'
+@functools.lru_cache(maxsize = 4096)
+def factorize(n: int) -> tuple:
+  prime_factors = []
+  extend_sieve(math.isqrt(n))
+
+  for p in primes:
+    if (p * p > n):
+      break
+
+    while (not (n % p)):
+      n //= p
+      prime_factors.append(p)
+
+  if (n > 1):
+    if (math.isqrt(n) < len(sieve)):
+      prime_factors.append(n)
+    else:
+      split_factors(n, prime_factors)
+
+  return tuple(sorted(prime_factors))
+
+
+# prime_factorization(n) Computes the prime factorization of 'n', listing
+#   every prime as many times as it divides 'n', in increasing order
+# requires: n >= 1
+def prime_factorization(n: int) -> List[int]:
+  return list(factorize(n))
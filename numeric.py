@@ -0,0 +1,295 @@
+import enum
+import validate
+import errors
+from typing import Union
+
+try:
+  import numpy as np
+except ImportError:
+  np = None
+
+
+NUMPY_ERR = 4
+
+# DEFAULT_TOL: entries whose absolute value is at most this tolerance
+#   are treated as 0
+DEFAULT_TOL = 1e-10
+
+
+# NumericType: Sets of floating point numbers
+class NumericType(enum.Enum):
+  RealFloat = "nr"
+  ComplexFloat = "nc"
+
+
+# is_numeric(num_type) Determines if 'num_type' is one of the floating point fields
+def is_numeric(num_type: str) -> bool:
+  return num_type in [e.value for e in NumericType]
+
+
+# require_numpy() Checks that NumPy can be used
+# effects: raises an 'errors.MissingDependencyError' if NumPy is not installed
+def require_numpy():
+  if (np is None):
+    validate.validation_error(NUMPY_ERR)
+
+
+# get_dtype(num_type) Gets the NumPy type used to store entries of 'num_type'
+def get_dtype(num_type: str):
+  require_numpy()
+  if (num_type == NumericType.ComplexFloat.value):
+    return np.complex128
+  else:
+    return np.float64
+
+
+# num_str(n) Formats the floating point number 'n'
+def num_str(n: Union[float, complex]) -> str:
+  if (isinstance(n, (complex, np.complexfloating)) and n.imag):
+    return f"({n.real:g} + {n.imag:g}i)"
+  else:
+    return f"({n.real:g})"
+
+
+# print_num(n) Prints the floating point number 'n'
+# effects: prints output
+def print_num(n: Union[float, complex]):
+  print(num_str(n), end="")
+
+
+
+# NumericMatrix: A matrix whose entries are stored as NumPy float64 or
+#   complex128 arrays
+# requires: 'values' is a 2 dimensional array or list of lists
+#           'answers' has one entry for each row if given
+class NumericMatrix:
+  def __init__(self, values, num_type: str, augumented: bool = True, answers = None, tol: float = DEFAULT_TOL):
+    dtype = get_dtype(num_type)
+    self.values = np.array(values, dtype = dtype)
+    self.num_type = num_type
+    self.augumented = augumented
+    self.tol = tol
+    self.pivots = 0
+    self.pivot_vects = []
+
+    self.rows, self.cols = self.values.shape
+
+    if (answers is None):
+      self.answers = np.zeros(self.rows, dtype = dtype)
+    else:
+      self.answers = np.array(answers, dtype = dtype)
+
+    self.inverse = None
+
+
+  # is_square() Determines if the matrix is a square matrix
+  def is_square(self) -> bool:
+    return (self.rows == self.cols)
+
+
+  # is_zero(n) Determines if 'n' is 0 within the tolerance of the matrix
+  def is_zero(self, n: Union[float, complex]) -> bool:
+    return abs(n) <= self.tol
+
+
+  # get_column(col) Gets a view of all the entries from column 'col'
+  # requires: 0 <= col < self.cols
+  def get_column(self, col: int):
+    return self.values[:, col]
+
+
+  # get_rank() Gets the rank of the matrix within the tolerance of the matrix
+  def get_rank(self) -> int:
+    return len(reduce_rows(self.values.copy(), self.cols, self.tol)[1])
+
+
+  # numeric_err(err_code, row) error message about a specific matrix
+  # requires: 1 <= err_code <= 4
+  # effects: raises an 'errors.MatrixError'
+  def numeric_err(self, err_code: int, row: int = 0):
+    message = "ERROR: "
+    if (err_code == 1):
+      message += f"Equation {row + 1} of the Following Matrix is not consistent"
+    elif (err_code == 2):
+      message += "The Following Matrix is not a square matrix"
+    elif (err_code == 3):
+      message += "The Following Matrix is Singular (Not Invertible)"
+    elif (err_code == 4):
+      message += "The Following Matrix is an Augumented Matrix"
+
+    raise errors.MATRIX_ERRORS[err_code](f"{message}\n{errors.printed(self.print_matrix)}", err_code)
+
+
+  # gauss_jordan(get_inv, verbose, companion) computes the gauss-jordan algorithm
+  #   with partial pivoting
+  # requires: 'companion' has one row for each row in the matrix
+  # effects: may print output
+  #          modifies 'self.values', 'self.answers' and 'self.inverse'
+  # note: every row operation is also applied to 'companion', which starts as
+  #         the identity matrix when 'get_inv' is True and none is given
+  def gauss_jordan(self, get_inv: bool = False, verbose: bool = True, companion = None):
+    if (get_inv):
+      if (not self.is_square()):
+        self.numeric_err(2)
+      elif (self.augumented):
+        self.numeric_err(4)
+
+      if (companion is None):
+        companion = np.eye(self.rows, dtype = self.values.dtype)
+
+    if (verbose):
+      print("\n------- Gauss-Jordan (Numeric) ---------\n")
+      self.print_matrix()
+
+    if (companion is None):
+      right = self.answers.reshape(self.rows, 1)
+    else:
+      right = np.array(companion, dtype = np.result_type(self.values, companion))
+
+    work = np.hstack([self.values.astype(right.dtype), right])
+    work, self.pivot_vects = reduce_rows(work, self.cols, self.tol)
+    self.pivots = len(self.pivot_vects)
+
+    self.values = work[:, :self.cols]
+    right = work[:, self.cols:]
+
+    for i in range(self.pivots, self.rows):
+      if (np.any(np.abs(right[i]) > self.tol) and companion is None):
+        self.numeric_err(1, i)
+
+    if (companion is None):
+      self.answers = right[:, 0]
+    else:
+      self.inverse = right
+
+    if (get_inv and self.pivots != self.rows):
+      self.numeric_err(3)
+
+    if (verbose):
+      print()
+      if (get_inv):
+        self.print_inverse()
+      else:
+        self.print_matrix()
+
+    return self.inverse
+
+
+  # print_matrix() Prints out the matrix
+  # effects: prints output
+  def print_matrix(self):
+    for i in range(self.rows):
+      print(" , ".join(num_str(n) for n in self.values[i]), end="")
+      if (self.augumented):
+        print("\t|\t", end="")
+        print_num(self.answers[i])
+      print("")
+
+
+  # print_inverse() Prints a matrix and its inverse
+  # effects: prints output
+  def print_inverse(self):
+    for i in range(self.rows):
+      print(" , ".join(num_str(n) for n in self.values[i]), end="")
+      if (self.inverse is not None):
+        print(" | ", end="")
+        print(" , ".join(num_str(n) for n in self.inverse[i]), end="")
+      print("")
+
+
+
+# reduce_rows(work, cols, tol) Reduces the first 'cols' columns of 'work' to
+#   their reduced row echelon form using partial pivoting
+# effects: modifies 'work'
+# note: returns the reduced array and the columns of the pivots
+def reduce_rows(work, cols: int, tol: float):
+  rows = work.shape[0]
+  pivot_vects = []
+  pivot_row = 0
+
+  for col in range(cols):
+    if (pivot_row >= rows):
+      break
+
+    max_row = pivot_row + int(np.argmax(np.abs(work[pivot_row:, col])))
+    if (abs(work[max_row, col]) <= tol):
+      work[pivot_row:, col] = 0
+      continue
+
+    if (max_row != pivot_row):
+      work[[pivot_row, max_row]] = work[[max_row, pivot_row]]
+
+    work[pivot_row] /= work[pivot_row, col]
+
+    factors = work[:, col].copy()
+    factors[pivot_row] = 0
+    work -= np.outer(factors, work[pivot_row])
+
+    pivot_vects.append(col)
+    pivot_row += 1
+
+  work[np.abs(work) <= tol] = 0
+  return (work, pivot_vects)
+
+
+# n_add(a, b, op) Adds or subtracts 2 numeric matrices
+# requires: 'op' is either "+" or "-"
+def n_add(a: NumericMatrix, b: NumericMatrix, op: str) -> NumericMatrix:
+  if (op == "-"):
+    return NumericMatrix(a.values - b.values, a.num_type, a.augumented, a.answers - b.answers, a.tol)
+  else:
+    return NumericMatrix(a.values + b.values, a.num_type, a.augumented, a.answers + b.answers, a.tol)
+
+
+# n_multiply(a, b) Computes matrix multiplication of ab for numeric matrices
+def n_multiply(a: NumericMatrix, b: NumericMatrix) -> NumericMatrix:
+  return NumericMatrix(a.values @ b.values, a.num_type, a.augumented, None, a.tol)
+
+
+# n_smultiply(a, c) Performs scalar matrix multiplication of ca
+# effects: modifies 'a'
+def n_smultiply(a: NumericMatrix, c: Union[float, complex]):
+  a.values = a.values * c
+  a.answers = a.answers * c
+
+
+# n_det(a) Finds the determinant of 'a' by elimination with partial pivoting
+# effects: may raise an 'errors.CalculatorError'
+def n_det(a: NumericMatrix) -> Union[float, complex]:
+  if (not a.is_square()):
+    a.numeric_err(2)
+  elif (a.augumented):
+    a.numeric_err(4)
+
+  work = a.values.copy()
+  size = a.rows
+  result = 1
+
+  for k in range(size):
+    max_row = k + int(np.argmax(np.abs(work[k:, k])))
+    if (abs(work[max_row, k]) <= a.tol):
+      return work.dtype.type(0)
+
+    if (max_row != k):
+      work[[k, max_row]] = work[[max_row, k]]
+      result = -result
+
+    result *= work[k, k]
+    work[k + 1:, k:] -= np.outer(work[k + 1:, k] / work[k, k], work[k, k:])
+
+  return result
+
+
+# n_cob_matrix(m_1, m_2) Gets the Change of Basis Matrix from 'm_1'
+#   to 'm_2'
+# effects: may raise an 'errors.CalculatorError'
+def n_cob_matrix(m_1: NumericMatrix, m_2: NumericMatrix) -> NumericMatrix:
+  if (not m_1.is_square()):
+    m_1.numeric_err(2)
+
+  if (not m_2.is_square()):
+    m_2.numeric_err(2)
+
+  reduced = NumericMatrix(m_2.values, m_2.num_type, False, None, m_2.tol)
+  cob_values = reduced.gauss_jordan(True, False, m_1.values)
+  return NumericMatrix(cob_values, m_2.num_type, False, None, m_2.tol)
@@ -0,0 +1,186 @@
+import matrix
+import numeric
+import determinant as determ
+from typing import Any, List
+
+
+# ALL_OPERATIONS: the symbols of every available operation
+ALL_OPERATIONS = [e.value for e in matrix.OperationSym]
+
+SINGLE_MATRIX_OPERATIONS = [matrix.OperationSym.GaussJordan.value,
+                            matrix.OperationSym.ScalarMultiply.value, matrix.OperationSym.Inverse.value, matrix.OperationSym.Determinant.value,
+                            matrix.OperationSym.Basis.value,
+                            matrix.OperationSym.Independent.value]
+
+DUO_MATRIX_OPERATIONS = [matrix.OperationSym.ChangeOfBasis.value]
+TRIP_MATRIX_OPERATIONS = [matrix.OperationSym.BasisConvert.value,
+                          matrix.OperationSym.TransBasisConvert.value]
+
+NON_AUGUMENTED_OPERATIONS = [matrix.OperationSym.Multiply.value,
+                             matrix.OperationSym.Determinant.value]
+QUINT_MATRIX_OPERATIONS = [matrix.OperationSym.GenTransBasisConvert.value]
+EXACT_OPERATIONS = [matrix.OperationSym.Basis.value,
+                    matrix.OperationSym.Independent.value]
+
+
+# get_valid_operations(num_of_matrices, augumented, field) Gets the symbols of all the
+#   operations that can be done on 'num_of_matrices' matrices from 'field'
+def get_valid_operations(num_of_matrices: int, augumented: bool, field: str) -> List[str]:
+  valid_operations = []
+  for operation in ALL_OPERATIONS:
+    single_operation = (operation in SINGLE_MATRIX_OPERATIONS)
+    non_aug_operation = (operation in NON_AUGUMENTED_OPERATIONS)
+    duo_operation = (operation in DUO_MATRIX_OPERATIONS)
+    trip_operation = (operation in TRIP_MATRIX_OPERATIONS)
+    quint_operation = (operation in QUINT_MATRIX_OPERATIONS)
+
+    if ((num_of_matrices == 1) and not single_operation):
+      continue
+    elif (num_of_matrices > 1 and single_operation):
+      continue
+    elif (num_of_matrices != 2 and duo_operation):
+      continue
+    elif (num_of_matrices != 3 and trip_operation):
+      continue
+    elif (num_of_matrices != 5 and quint_operation):
+      continue
+    elif (augumented and non_aug_operation):
+      continue
+    elif (numeric.is_numeric(field) and operation in EXACT_OPERATIONS):
+      continue
+
+    valid_operations.append(operation)
+
+  return valid_operations
+
+
+# run_operation(operation, lo_matrices, constant, verbose, workers, stream) Performs
+#   'operation' on the matrices in 'lo_matrices'
+# requires: 'operation' is valid for 'lo_matrices'
+#           'constant' is given for scalar multiplication
+# effects: prints output if 'verbose' is True
+#          may modify the matrices in 'lo_matrices'
+#          may raise an 'errors.CalculatorError'
+# note: the gauss-jordan, inverse and scalar multiplication operations work
+#         on the first matrix itself, so the first matrix is returned
+#       the searches for bases and independent sets are split between
+#         'workers' processes
+#       if 'stream' is True, the bases and independent sets are given lazily
+#         instead, as soon as each one is found
+def run_operation(operation: str, lo_matrices: list, constant: Any = None, verbose: bool = True,
+                  workers: int = 1, stream: bool = False) -> Any:
+  result = None
+
+  if (operation == matrix.OperationSym.GaussJordan.value):
+    lo_matrices[0].gauss_jordan(False, verbose)
+    result = lo_matrices[0]
+
+  elif (operation == matrix.OperationSym.ScalarMultiply.value):
+    matrix.m_smultiply(lo_matrices[0], constant)
+    result = lo_matrices[0]
+
+  elif (operation == matrix.OperationSym.Inverse.value):
+    lo_matrices[0].gauss_jordan(True, verbose)
+    result = lo_matrices[0]
+
+  elif (operation == matrix.OperationSym.Determinant.value):
+    result = matrix.det(lo_matrices[0], determ.DetMethod.Bareiss.value)
+
+  elif (operation == matrix.OperationSym.Basis.value and stream):
+    result = matrix.iter_lin_indep(lo_matrices[0], lo_matrices[0].rows)
+
+  elif (operation == matrix.OperationSym.Independent.value and stream):
+    result = matrix.iter_lin_indep_combo(lo_matrices[0])
+
+  elif (operation == matrix.OperationSym.Basis.value):
+    if (verbose):
+      matrix.print_original_vect_set(lo_matrices[0])
+      print("\n\n")
+    result = matrix.get_lin_indep(lo_matrices[0], lo_matrices[0].rows, [], workers, verbose = verbose)
+
+  elif (operation == matrix.OperationSym.Independent.value):
+    result = matrix.get_lin_indep_combo(lo_matrices[0], [], workers, verbose)
+
+  elif (operation == matrix.OperationSym.BasisConvert.value):
+    result = matrix.basis_convert(lo_matrices[0], lo_matrices[1], lo_matrices[2], verbose)
+
+  elif (operation == matrix.OperationSym.ChangeOfBasis.value):
+    result = matrix.get_cob_matrix(lo_matrices[0], lo_matrices[1])
+
+  elif (operation == matrix.OperationSym.TransBasisConvert.value):
+    result = matrix.t_basis_convert(lo_matrices[0], lo_matrices[1], lo_matrices[2], verbose)
+
+  elif (operation == matrix.OperationSym.GenTransBasisConvert.value):
+    result = matrix.gen_t_basis_convert(lo_matrices[0], lo_matrices[1], lo_matrices[2], lo_matrices[3],
+                                        lo_matrices[4], verbose)
+
+  elif (operation == matrix.OperationSym.Multiply.value):
+    result = matrix.m_chain_multiply(lo_matrices, verbose)
+
+  else:
+    for i in range(len(lo_matrices) - 1):
+      if (not i):
+        m_a = lo_matrices[0]
+        m_b = lo_matrices[1]
+      else:
+        m_a = result
+        m_b = lo_matrices[i + 1]
+
+      if (operation == matrix.OperationSym.Add.value):
+        result = matrix.m_arith(matrix.m_add, m_a, m_b, "size", True)
+      elif (operation == matrix.OperationSym.Subtract.value):
+        result = matrix.m_arith(matrix.m_add, m_a, m_b, "size", True, "-")
+
+  return result
+
+
+# print_result(operation, lo_matrices, result, field) Prints the result of
+#   'operation' given by 'run_operation'
+# effects: prints output
+# note: bases and independent sets that are given lazily are printed as soon
+#         as each one is found
+def print_result(operation: str, lo_matrices: list, result: Any, field: str):
+  if (operation == matrix.OperationSym.GaussJordan.value):
+    return
+
+  print("\n------ Answer -------\n\n")
+
+  if (operation == matrix.OperationSym.ScalarMultiply.value):
+    lo_matrices[0].print_matrix()
+  elif (operation == matrix.OperationSym.Inverse.value):
+    lo_matrices[0].print_inverse()
+  elif (operation == matrix.OperationSym.Determinant.value):
+    if (numeric.is_numeric(field)):
+      numeric.print_num(result)
+    else:
+      result.print_frac()
+  elif (operation == matrix.OperationSym.Basis.value or
+        operation == matrix.OperationSym.Independent.value):
+
+    result_txt = "Number of Bases: {count}\n"
+    result_no_txt = "The vectors for each basis are:\n"
+
+    if (operation == matrix.OperationSym.Independent.value):
+      result_txt = result_txt.replace("Bases", "Sets")
+      result_no_txt = result_no_txt.replace("basis", "set")
+
+    matrix.print_original_vect_set(lo_matrices[0])
+
+    if (isinstance(result, list)):
+      print(f"\n\n{result_txt.format(count = len(result))}")
+
+      if (result):
+        print(result_no_txt)
+        for c in result:
+          print(c)
+    else:
+      print(f"\n\n{result_no_txt}")
+
+      count = 0
+      for c in result:
+        print(c, flush = True)
+        count += 1
+
+      print(f"\n{result_txt.format(count = count)}")
+  else:
+    result.print_matrix()
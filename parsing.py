@@ -0,0 +1,165 @@
+import matrix
+import validate
+import complex
+import fraction as frac
+import numeric
+from typing import List, Optional, Union
+
+FRACTION_ERR_CODE = 1
+MATRIX_COL_ERR_CODE = 3
+
+FIELD_VALS = ["r", "c"] + [e.value for e in numeric.NumericType]
+YES_NO_VALS = ["y", "n"]
+
+FRAC_PT_ONE = {frac.NumberType.RealNum.value: 1,
+               frac.NumberType.ComplexNum.value: "1 + 0i"}
+
+
+# fraction_input(input, field) Organizes the input for a fraction
+# required: 'field' is either "R", "r", "C" or "c"
+# effects: may raise an 'errors.CalculatorError' if there is an invalid input
+def fraction_input(input: str, field: str) -> Union[frac.RealFraction, frac.ComplexFraction]:
+  temp_frac_pt = input.split("/")
+  temp_frac_pt_len = len(temp_frac_pt)
+  field = field.lower()
+
+  if(temp_frac_pt_len > 2 or temp_frac_pt_len <= 0):
+    validate.validation_error(FRACTION_ERR_CODE, input = input, type_article = "a", 
+                              type = "valid fraction input")
+  elif (temp_frac_pt_len == 1):
+    temp_frac_pt.append(FRAC_PT_ONE[field])
+
+  if (field.lower() == frac.NumberType.RealNum.value):
+    temp_frac_pt = validate.validate_lst(temp_frac_pt, validate.DataTypes.Integer)
+    temp_frac = frac.RealFraction(temp_frac_pt[0], temp_frac_pt[1])
+
+  elif (field.lower() == frac.NumberType.ComplexNum.value):
+    temp_frac_pt[0] = temp_frac_pt[0].replace("i", "")
+    temp_frac_pt[0] = temp_frac_pt[0].split("+")
+    temp_frac_pt[1] = temp_frac_pt[1].replace("i", "")
+    temp_frac_pt[1] = temp_frac_pt[1].split("+")
+
+    if (len(temp_frac_pt[0]) != 2 or len(temp_frac_pt[1]) != 2):
+      validate.validation_error(FRACTION_ERR_CODE, input = input, type_article = "a",
+                                type = "complex number of the form a+bi")
+
+    temp_frac_pt[0] = validate.validate_lst(temp_frac_pt[0], validate.DataTypes.Integer)
+    temp_frac_pt[1] = validate.validate_lst(temp_frac_pt[1], validate.DataTypes.Integer)
+
+    temp_frac = frac.ComplexFraction(complex.Complex_Num(temp_frac_pt[0][0], temp_frac_pt[0][1]),
+                                     complex.Complex_Num(temp_frac_pt[1][0], temp_frac_pt[1][1]))
+
+  return temp_frac
+
+
+# numeric_input(input, field) Organizes the input for a floating point number
+# required: 'field' is one of the values in the enum 'numeric.NumericType'
+# effects: may raise an 'errors.CalculatorError' if there is an invalid input
+def numeric_input(input: str, field: str) -> Union[float, complex]:
+  temp_num_pt = input.split("/")
+  temp_num_pt_len = len(temp_num_pt)
+  field = field.lower()
+
+  if(temp_num_pt_len > 2 or temp_num_pt_len <= 0):
+    validate.validation_error(FRACTION_ERR_CODE, input = input, type_article = "a",
+                              type = "valid number input")
+
+  result = []
+  for pt in temp_num_pt:
+    if (field == numeric.NumericType.RealFloat.value):
+      result.append(validate.validate_float(pt))
+    else:
+      is_imaginary = pt.strip().endswith("i")
+      pt = pt.replace("i", "").split("+")
+      if (len(pt) == 1 and is_imaginary):
+        pt.insert(0, 0)
+      elif (len(pt) == 1):
+        pt.append(0)
+      pt = validate.validate_lst(pt, validate.DataTypes.Float)
+      result.append(pt[0] + pt[1] * 1j)
+
+  if (temp_num_pt_len == 2):
+    if (not result[1]):
+      validate.validation_error(FRACTION_ERR_CODE, input = input, type_article = "a",
+                                type = "number with a non-zero denominator")
+    return result[0] / result[1]
+
+  return result[0]
+
+
+# entry_input(input, field) Organizes the input for a single entry of a
+#   matrix from 'field'
+# required: 'field' is one of the values in 'FIELD_VALS'
+# effects: may raise an 'errors.CalculatorError' if there is an invalid input
+def entry_input(input: str, field: str) -> Union[frac.RealFraction, frac.ComplexFraction, float, complex]:
+  if (numeric.is_numeric(field.lower())):
+    return numeric_input(input, field)
+  else:
+    return fraction_input(input, field)
+
+
+# zero_entry(field) Gets the entry 0 from 'field'
+# required: 'field' is one of the values in 'FIELD_VALS'
+def zero_entry(field: str) -> Union[frac.RealFraction, frac.ComplexFraction, float, complex]:
+  field = field.lower()
+
+  if (numeric.is_numeric(field)):
+    return 0
+  elif (field == frac.NumberType.RealNum.value):
+    return frac.r_get_zero()
+  elif (field == frac.NumberType.ComplexNum.value):
+    return frac.c_get_zero()
+
+
+# parse_row(lo_coefficients, answer, field, is_augumented) Organizes the text
+#   entries of a single row/equation
+# required: 'field' is one of the values in 'FIELD_VALS'
+# effects: may raise an 'errors.CalculatorError' if there is an invalid input
+# note: returns the coefficients and the answer of the row
+def parse_row(lo_coefficients: List[str], answer: Optional[str], field: str, is_augumented: bool) -> tuple:
+  temp_co = [entry_input(c, field) for c in lo_coefficients]
+
+  if (is_augumented):
+    temp_ans = entry_input(answer, field)
+  else:
+    temp_ans = zero_entry(field)
+
+  return (temp_co, temp_ans)
+
+
+# build_matrix(lo_rows, field, is_augumented) Makes a matrix from the rows given
+#   by 'parse_row'
+# required: 'lo_rows' is not empty
+#           'field' is one of the values in 'FIELD_VALS'
+def build_matrix(lo_rows: list, field: str, is_augumented: bool) -> Union[matrix.Matrix, numeric.NumericMatrix]:
+  field = field.lower()
+
+  if (numeric.is_numeric(field)):
+    return numeric.NumericMatrix([r[0] for r in lo_rows], field, is_augumented,
+                                 [r[1] for r in lo_rows])
+  else:
+    matrix_eq = [matrix.LinearEquation(r[0], r[1], field) for r in lo_rows]
+    return matrix.Matrix(matrix_eq, field, is_augumented)
+
+
+# make_matrix(lo_coefficients, lo_answers, field, is_augumented, col) Makes a
+#   matrix from the text entries in 'lo_coefficients' and 'lo_answers'
+# required: 'lo_coefficients' is not empty
+#           'field' is one of the values in 'FIELD_VALS'
+#           'lo_answers' has an answer for each row if 'is_augumented' is True
+# effects: may raise an 'errors.CalculatorError' if there is an invalid input or if a row
+#            does not have 'col' coefficients
+def make_matrix(lo_coefficients: List[List[str]], lo_answers: Optional[List[str]], field: str,
+                is_augumented: bool, col: Optional[int] = None) -> Union[matrix.Matrix, numeric.NumericMatrix]:
+  if (col is None):
+    col = len(lo_coefficients[0])
+
+  lo_rows = []
+  for i in range(len(lo_coefficients)):
+    if (len(lo_coefficients[i]) != col):
+      validate.validation_error(MATRIX_COL_ERR_CODE)
+
+    answer = lo_answers[i] if is_augumented else None
+    lo_rows.append(parse_row(lo_coefficients[i], answer, field, is_augumented))
+
+  return build_matrix(lo_rows, field, is_augumented)
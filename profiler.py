@@ -0,0 +1,181 @@
+import time
+import functools
+import contextlib
+import fraction as frac
+import matrix
+import minors
+import operations
+from typing import Any, Callable, Dict
+
+# KERNELS: the scalar kernels from 'fraction' whose calls are counted
+KERNELS = ["rf_add", "cf_add", "rf_multiply", "cf_multiply", "rf_divide", "cf_divide",
+           "rf_sub_product", "cf_sub_product", "cf_conjugate", "make_real", "make_complex",
+           "reduce_real", "reduce_complex", "r_get_zero", "r_get_one", "c_get_zero", "c_get_one"]
+
+# FRACTION_METHODS: the methods of the fraction types whose calls are counted
+FRACTION_METHODS = [(frac.RealFraction, "__new__"), (frac.ComplexFraction, "__new__")]
+
+# PHASES: the functions that are timed, with the module or class they are in
+#   and the name of their phase
+PHASES = [(matrix.Matrix, "gaussian_elimination", "gaussian_elimination"),
+          (matrix.Matrix, "jordan_algo", "jordan_algo"),
+          (matrix, "get_cob_matrix", "get_cob_matrix"),
+          (matrix.BasisRegistry, "factor", "basis_factor"),
+          (minors.MinorTable, "minor", "cofactor"),
+          (operations, "print_result", "print_result")]
+
+# ERO_NAMES: the name of each type of elementary row operation
+ERO_NAMES = {1: "swap", 2: "scale", 3: "difference"}
+
+# the counters and timers, which are only changed while the profiler is enabled
+counters = {}
+phases = {}
+
+# the original functions replaced while the profiler is enabled, as
+#   (owner, name, original)
+patched = []
+
+# the number of calls of each phase that have not returned yet, so that
+#   recursive calls, such as in the cofactor expansion, are only timed once
+depths = {}
+
+
+# count(name, amount) Adds 'amount' to the counter 'name'
+# effects: modifies 'counters'
+def count(name: str, amount: int = 1):
+  counters[name] = counters.get(name, 0) + amount
+
+
+# counted(name, fn) Makes a version of 'fn' that counts its calls under 'name'
+def counted(name: str, fn: Callable) -> Callable:
+  @functools.wraps(fn)
+  def wrapper(*args, **kwargs):
+    counters[name] = counters.get(name, 0) + 1
+    return fn(*args, **kwargs)
+
+  return wrapper
+
+
+# timed(name, fn) Makes a version of 'fn' that adds its wall time to the phase 'name'
+# note: a call made while the phase is already running is counted, but its
+#         time is already part of the outer call
+def timed(name: str, fn: Callable) -> Callable:
+  @functools.wraps(fn)
+  def wrapper(*args, **kwargs):
+    phase = phases.setdefault(name, {"calls": 0, "seconds": 0.0})
+    phase["calls"] += 1
+
+    depth = depths.get(name, 0)
+    depths[name] = depth + 1
+    start = time.perf_counter()
+    try:
+      return fn(*args, **kwargs)
+    finally:
+      depths[name] = depth
+      if (not depth):
+        phase["seconds"] += time.perf_counter() - start
+
+  return wrapper
+
+
+# counted_ero(fn) Makes a version of 'Matrix.do_ero' that counts each type of
+#   elementary row operation
+def counted_ero(fn: Callable) -> Callable:
+  @functools.wraps(fn)
+  def wrapper(self, ero_type: int, **kwargs):
+    count(f"ero.{ERO_NAMES.get(ero_type, ero_type)}")
+    return fn(self, ero_type, **kwargs)
+
+  return wrapper
+
+
+# patch(owner, name, wrapper) Replaces 'name' in 'owner' with a wrapped version
+# effects: modifies 'owner' and 'patched'
+# note: a static method, such as '__new__', is wrapped as the function
+#         inside of it
+def patch(owner: Any, name: str, wrapper: Callable[[Callable], Callable]):
+  original = owner.__dict__[name] if isinstance(owner, type) else getattr(owner, name)
+  patched.append((owner, name, original))
+
+  fn = original.__func__ if isinstance(original, staticmethod) else original
+  setattr(owner, name, wrapper(fn))
+
+
+# is_enabled() Determines if the profiler is recording
+def is_enabled() -> bool:
+  return bool(patched)
+
+
+# enable() Starts recording the counters and the phases
+# effects: modifies the functions being recorded
+# note: the functions are only wrapped while the profiler is enabled, so
+#         nothing is recorded, and nothing slows down, when it is disabled
+#       only the calls made in this process are recorded, not the calls made
+#         by the worker processes used with more than 1 worker
+#       functions saved before the profiler was enabled, such as the kernels
+#         kept by a 'lu.LUFactorization', are not counted
+def enable():
+  if (is_enabled()):
+    return
+
+  for name in KERNELS:
+    patch(frac, name, functools.partial(counted, f"fraction.{name}"))
+
+  for cls, name in FRACTION_METHODS:
+    patch(cls, name, functools.partial(counted, f"fraction.{cls.__name__}.{name}"))
+
+  patch(matrix.Matrix, "__init__", functools.partial(counted, "matrix.allocations"))
+  patch(matrix.Matrix, "do_ero", counted_ero)
+
+  for owner, name, phase in PHASES:
+    patch(owner, name, functools.partial(timed, phase))
+
+
+# disable() Stops recording the counters and the phases
+# effects: restores the functions being recorded
+# note: the results recorded so far are kept
+def disable():
+  while (patched):
+    owner, name, original = patched.pop()
+    setattr(owner, name, original)
+
+
+# reset() Clears all the results recorded
+# effects: modifies 'counters' and 'phases'
+def reset():
+  counters.clear()
+  phases.clear()
+  depths.clear()
+
+
+# report() Gets the results recorded as
+#   {"counters": {name: calls}, "phases": {name: {"calls": calls, "seconds": time}}}
+def report() -> Dict[str, Any]:
+  return {"counters": dict(sorted(counters.items())),
+          "phases": {name: dict(p) for name, p in sorted(phases.items())}}
+
+
+# report_str(result) Formats a report from 'report' as a table
+def report_str(result: Dict[str, Any]) -> str:
+  lines = ["------- Profile -------", "", f"{'phase':<30} {'calls':>10} {'seconds':>12}"]
+  for name, p in result["phases"].items():
+    lines.append(f"{name:<30} {p['calls']:>10} {p['seconds']:>12.6f}")
+
+  lines += ["", f"{'counter':<43} {'calls':>10}"]
+  for name, calls in sorted(result["counters"].items(), key = lambda c: -c[1]):
+    lines.append(f"{name:<43} {calls:>10}")
+
+  return "\n".join(lines)
+
+
+# profiling() Records the counters and the phases of the code run inside of it
+# note: the results are cleared at the start, and can be read with 'report'
+#         afterwards
+@contextlib.contextmanager
+def profiling():
+  reset()
+  enable()
+  try:
+    yield
+  finally:
+    disable()
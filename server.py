@@ -0,0 +1,474 @@
+import os
+import sys
+import json
+import stat
+import asyncio
+import argparse
+import concurrent.futures
+import concurrent.futures.process
+import matrix
+import validate
+import calculator
+import errors
+from typing import Any, Dict, Optional
+
+# the codes of the JSON-RPC errors
+PARSE_ERR = -32700
+INVALID_REQUEST_ERR = -32600
+METHOD_ERR = -32601
+PARAMS_ERR = -32602
+INTERNAL_ERR = -32603
+CALCULATION_ERR = -32000
+TIMEOUT_ERR = -32001
+CANCELLED_ERR = -32002
+BUSY_ERR = -32003
+
+JSONRPC_VERSION = "2.0"
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+# DEFAULT_TIMEOUT: the number of seconds a request may take, unless it gives
+#   its own "timeout"
+DEFAULT_TIMEOUT = 30.0
+
+# DEFAULT_MAX_QUEUE: the number of requests that may wait for a worker process
+#   before new requests are refused
+DEFAULT_MAX_QUEUE = 64
+
+# LINE_LIMIT: the longest message, in bytes, that can be read
+LINE_LIMIT = 16 * 1024 * 1024
+
+# OPERATIONS: the methods that do a calculation, which are the symbols of
+#   the operations in 'matrix.OperationSym'
+OPERATIONS = [e.value for e in matrix.OperationSym]
+
+# DEFAULT_LIGHT_WORKERS: the number of worker processes for the operations
+#   that are not in 'POOL_OPERATIONS'
+DEFAULT_LIGHT_WORKERS = 2
+
+# POOL_OPERATIONS: the operations that can take long, which are done by their
+#   own worker processes, so that they do not hold up the other operations
+POOL_OPERATIONS = [matrix.OperationSym.GaussJordan.value, matrix.OperationSym.Inverse.value,
+                   matrix.OperationSym.Determinant.value, matrix.OperationSym.Basis.value,
+                   matrix.OperationSym.Independent.value]
+
+# the calculator kept by each worker process
+worker_calc = None
+
+
+# init_worker() Starts the calculator of a worker process
+# effects: modifies 'worker_calc'
+def init_worker():
+  global worker_calc
+  worker_calc = calculator.Calculator()
+
+
+# run_job(job) Does the calculation of 'job' in a worker process, as in
+#   'calculator.Calculator.handle'
+def run_job(job: Dict[str, Any]) -> Dict[str, Any]:
+  return worker_calc.handle(job)
+
+
+# rpc_result(req_id, result) Makes the response to the request 'req_id' that succeeded
+def rpc_result(req_id: Any, result: Any) -> Dict[str, Any]:
+  return {"jsonrpc": JSONRPC_VERSION, "id": req_id, "result": result}
+
+
+# rpc_error(req_id, code, message, data) Makes the response to the request 'req_id'
+#   that failed
+def rpc_error(req_id: Any, code: int, message: str, data: Any = None) -> Dict[str, Any]:
+  error = {"code": code, "message": message}
+  if (data is not None):
+    error["data"] = data
+
+  return {"jsonrpc": JSONRPC_VERSION, "id": req_id, "error": error}
+
+
+# RequestError: A request that cannot be done, with the code of its JSON-RPC error
+class RequestError(Exception):
+  def __init__(self, code: int, message: str, data: Any = None):
+    super().__init__(message)
+    self.code = code
+    self.message = message
+    self.data = data
+
+
+# Connection: The requests of a single client that have not been answered
+# note: 'pending' has the task of each request, by its id, and 'cancelled' has
+#         the ids of the requests that the client cancelled
+class Connection:
+  def __init__(self, writer: asyncio.StreamWriter):
+    self.writer = writer
+    self.lock = asyncio.Lock()
+    self.pending = {}
+    self.cancelled = set()
+    self.tasks = set()
+
+
+  # send(response) Writes 'response' as a single line of JSON
+  # effects: writes to the client
+  async def send(self, response: Dict[str, Any]):
+    async with self.lock:
+      self.writer.write(json.dumps(response).encode() + b"\n")
+      await self.writer.drain()
+
+
+# WorkerPool: The worker processes that do the calculations, where at most
+#   'workers' calculations are done at once and at most 'max_queue' more wait
+#   for a worker process
+# note: a calculation cannot be stopped once it started, so a request that is
+#         stopped first still keeps its worker process until the calculation ends
+#       if a worker process dies, the requests it was doing fail and new worker
+#         processes are started for the requests after them
+class WorkerPool:
+  def __init__(self, workers: int, max_queue: int):
+    self.workers = workers
+    self.max_queue = max_queue
+    self.executor = None
+    self.slots = None
+    self.waiting = 0
+    self.running = 0
+
+
+  # start() Starts the worker processes
+  # effects: starts processes
+  def start(self):
+    self.executor = concurrent.futures.ProcessPoolExecutor(max_workers = self.workers, initializer = init_worker)
+    self.slots = asyncio.Semaphore(self.workers)
+
+
+  # restart(executor) Replaces the worker processes of 'executor', which can no
+  #   longer do calculations since one of its processes died
+  # effects: stops and starts processes
+  # note: nothing is done if the worker processes were already replaced
+  def restart(self, executor: concurrent.futures.ProcessPoolExecutor):
+    if (self.executor is not executor):
+      return
+
+    executor.shutdown(wait = False, cancel_futures = True)
+    self.executor = concurrent.futures.ProcessPoolExecutor(max_workers = self.workers, initializer = init_worker)
+
+
+  # close() Stops the worker processes
+  # effects: stops processes
+  def close(self):
+    if (self.executor is not None):
+      self.executor.shutdown(wait = False, cancel_futures = True)
+      self.executor = None
+
+
+  # run(job) Does the calculation of 'job' in a worker process, as in
+  #   'calculator.Calculator.handle'
+  # effects: may raise a 'RequestError' if too many requests are waiting or if
+  #            the worker process died
+  async def run(self, job: Dict[str, Any]) -> Dict[str, Any]:
+    if (self.waiting >= self.max_queue):
+      raise RequestError(BUSY_ERR, "The server is busy, too many requests are waiting")
+
+    self.waiting += 1
+    try:
+      await self.slots.acquire()
+    finally:
+      self.waiting -= 1
+
+    loop = asyncio.get_running_loop()
+    executor = self.executor
+    self.running += 1
+    try:
+      future = executor.submit(run_job, job)
+    except BaseException as e:
+      self.running -= 1
+      self.slots.release()
+      if (isinstance(e, concurrent.futures.process.BrokenProcessPool)):
+        self.restart(executor)
+        raise RequestError(INTERNAL_ERR, "The worker processes stopped, please send the request again")
+      raise
+
+    future.add_done_callback(lambda f: loop.call_soon_threadsafe(self.job_done))
+    try:
+      return await asyncio.wrap_future(future)
+    except concurrent.futures.process.BrokenProcessPool:
+      self.restart(executor)
+      raise RequestError(INTERNAL_ERR, "The worker process doing the request stopped")
+
+
+  # job_done() Frees the worker process of a calculation that ended
+  # effects: modifies 'self.running' and 'self.slots'
+  def job_done(self):
+    self.running -= 1
+    self.slots.release()
+
+
+# CalculatorServer: A JSON-RPC server for the calculator
+# note: each request is a single line of JSON, such as
+#
+#         {"jsonrpc": "2.0", "id": 1, "method": "det",
+#          "params": {"field": "r", "matrices": [["1, 2", "3, 4"]], "timeout": 5}}
+#
+#         where the method is an operation from 'OPERATIONS' and the params are
+#         a job, as in 'calculator.Calculator', without its "operation"
+#       each response is a single line of JSON, and the responses of a single
+#         client are written as soon as each request is done, which may be in
+#         a different order than the requests
+#       the "cancel" method, with the "id" of an earlier request, stops that
+#         request, and the "stats" method gets the counters of the server
+#       every calculation is done by a worker process, so that the server keeps
+#         answering other clients, and its timeout and cancelling always apply
+#       at most 'workers' of the operations from 'POOL_OPERATIONS', and at most
+#         'light_workers' of the other operations, are done at once, and at most
+#         'max_queue' more of each wait for a worker process
+class CalculatorServer:
+  def __init__(self, workers: int = 1, max_queue: int = DEFAULT_MAX_QUEUE,
+               timeout: float = DEFAULT_TIMEOUT, light_workers: int = DEFAULT_LIGHT_WORKERS):
+    self.workers = workers
+    self.light_workers = light_workers
+    self.timeout = timeout
+    self.pool = WorkerPool(workers, max_queue)
+    self.light_pool = WorkerPool(light_workers, max_queue)
+    self.stats = {"requests": 0, "completed": 0, "failed": 0, "timed_out": 0,
+                  "cancelled": 0, "refused": 0}
+
+
+  # start(host, port, unix_path) Starts the worker processes and listens for
+  #   clients on 'unix_path', if it is given, or on 'host' and 'port'
+  # effects: starts processes
+  #          may remove an old socket at 'unix_path'
+  async def start(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                  unix_path: Optional[str] = None) -> asyncio.AbstractServer:
+    self.pool.start()
+    self.light_pool.start()
+
+    if (unix_path is not None):
+      if (os.path.exists(unix_path) and stat.S_ISSOCK(os.stat(unix_path).st_mode)):
+        os.unlink(unix_path)
+      return await asyncio.start_unix_server(self.handle_client, path = unix_path, limit = LINE_LIMIT)
+
+    return await asyncio.start_server(self.handle_client, host, port, limit = LINE_LIMIT)
+
+
+  # close() Stops the worker processes
+  # effects: stops processes
+  def close(self):
+    self.pool.close()
+    self.light_pool.close()
+
+
+  # handle_client(reader, writer) Answers every request from a single client
+  # effects: reads from and writes to the client
+  # note: once the client stops sending, the requests it already sent are still
+  #         answered, but they are stopped if the connection is lost
+  async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    conn = Connection(writer)
+
+    try:
+      while (True):
+        try:
+          line = await reader.readline()
+        except (asyncio.LimitOverrunError, ValueError):
+          await conn.send(rpc_error(None, INVALID_REQUEST_ERR, "The request is too long"))
+          break
+
+        if (not line):
+          break
+        elif (not line.strip()):
+          continue
+
+        task = asyncio.create_task(self.respond(line, conn))
+        conn.tasks.add(task)
+        task.add_done_callback(conn.tasks.discard)
+
+      if (conn.tasks):
+        await asyncio.gather(*conn.tasks, return_exceptions = True)
+
+    except ConnectionError:
+      pass
+
+    finally:
+      for task in list(conn.tasks):
+        task.cancel()
+      if (conn.tasks):
+        await asyncio.gather(*conn.tasks, return_exceptions = True)
+
+      writer.close()
+      try:
+        await writer.wait_closed()
+      except ConnectionError:
+        pass
+
+
+  # respond(line, conn) Answers the request in 'line'
+  # effects: writes to the client
+  # note: notifications, which are requests without an id, are not answered
+  async def respond(self, line: bytes, conn: Connection):
+    response = await self.dispatch(line, conn)
+    if (response is not None):
+      try:
+        await conn.send(response)
+      except ConnectionError:
+        pass
+
+
+  # dispatch(line, conn) Does the request in 'line' and gets its response
+  async def dispatch(self, line: bytes, conn: Connection) -> Optional[Dict[str, Any]]:
+    try:
+      request = json.loads(line)
+    except ValueError as e:
+      return rpc_error(None, PARSE_ERR, f"The request is not valid JSON: {e}")
+
+    if ((not isinstance(request, dict)) or request.get("jsonrpc") != JSONRPC_VERSION or
+        not isinstance(request.get("method"), str)):
+      return rpc_error(request.get("id") if isinstance(request, dict) else None, INVALID_REQUEST_ERR,
+                       "The request is not a JSON-RPC 2.0 request object")
+
+    req_id = request.get("id")
+    is_notification = ("id" not in request)
+    self.stats["requests"] += 1
+
+    try:
+      result = await self.call(request["method"], request.get("params", {}), req_id, is_notification, conn)
+    except RequestError as e:
+      response = rpc_error(req_id, e.code, e.message, e.data)
+    except Exception as e:
+      self.stats["failed"] += 1
+      response = rpc_error(req_id, INTERNAL_ERR, f"{type(e).__name__}: {e}")
+    else:
+      response = rpc_result(req_id, result)
+
+    return None if is_notification else response
+
+
+  # call(method, params, req_id, is_notification, conn) Does the method of a request
+  # effects: may raise a 'RequestError'
+  async def call(self, method: str, params: Any, req_id: Any, is_notification: bool,
+                 conn: Connection) -> Any:
+    if (not isinstance(params, dict)):
+      raise RequestError(PARAMS_ERR, "The params need to be an object")
+
+    if (method == "cancel"):
+      return self.cancel(params.get("id"), conn)
+    elif (method == "stats"):
+      return dict(self.stats, waiting = self.pool.waiting + self.light_pool.waiting,
+                  running = self.pool.running + self.light_pool.running, workers = self.workers,
+                  light_workers = self.light_workers)
+    elif (method not in OPERATIONS):
+      raise RequestError(METHOD_ERR, f"The method ({method}) does not exist")
+
+    timeout = params.get("timeout", self.timeout)
+    if ((not isinstance(timeout, (int, float))) or isinstance(timeout, bool) or timeout <= 0):
+      raise RequestError(PARAMS_ERR, "The timeout needs to be a positive number of seconds")
+
+    job = {k: v for k, v in params.items() if k != "timeout"}
+    job["operation"] = method
+    if (not is_notification):
+      job["id"] = req_id
+
+    if (not is_notification):
+      if (req_id in conn.pending):
+        raise RequestError(INVALID_REQUEST_ERR, f"The id ({req_id}) is already used by a request that is not done")
+      conn.pending[req_id] = asyncio.current_task()
+
+    try:
+      outcome = await asyncio.wait_for(self.calculate(job), timeout)
+
+    except asyncio.TimeoutError:
+      self.stats["timed_out"] += 1
+      raise RequestError(TIMEOUT_ERR, f"The request took longer than {timeout} seconds")
+
+    except asyncio.CancelledError:
+      # only the requests cancelled by the client are answered, since the
+      #   others are stopped because the client left
+      if (req_id not in conn.cancelled):
+        raise
+      self.stats["cancelled"] += 1
+      raise RequestError(CANCELLED_ERR, "The request was cancelled")
+
+    finally:
+      if (not is_notification):
+        conn.pending.pop(req_id, None)
+        conn.cancelled.discard(req_id)
+
+    if (outcome["status"] != "ok"):
+      self.stats["failed"] += 1
+      raise RequestError(CALCULATION_ERR, outcome["error"], {"type": outcome["type"]})
+
+    self.stats["completed"] += 1
+    return outcome["result"]
+
+
+  # cancel(req_id, conn) Stops the request 'req_id' of the client
+  # note: returns whether the request was stopped, which is False if it was
+  #         already done
+  def cancel(self, req_id: Any, conn: Connection) -> bool:
+    task = conn.pending.get(req_id)
+    if (task is None or task.done()):
+      return False
+
+    conn.cancelled.add(req_id)
+    task.cancel()
+    return True
+
+
+  # calculate(job) Does the calculation of 'job', as in 'calculator.Calculator.handle'
+  # effects: may raise a 'RequestError' if too many requests are waiting
+  # note: the operations from 'POOL_OPERATIONS' are done by 'self.pool', and
+  #         the other operations by 'self.light_pool'
+  async def calculate(self, job: Dict[str, Any]) -> Dict[str, Any]:
+    pool = self.pool if (str(job["operation"]) in POOL_OPERATIONS) else self.light_pool
+
+    try:
+      return await pool.run(job)
+    except RequestError as e:
+      if (e.code == BUSY_ERR):
+        self.stats["refused"] += 1
+      else:
+        self.stats["failed"] += 1
+      raise
+
+
+# serve(host, port, unix_path, workers, max_queue, timeout, light_workers) Runs a
+#   CalculatorServer until it is stopped
+# effects: prints output
+async def serve(host: str, port: int, unix_path: Optional[str], workers: int, max_queue: int,
+                timeout: float, light_workers: int = DEFAULT_LIGHT_WORKERS):
+  calc_server = CalculatorServer(workers, max_queue, timeout, light_workers)
+  server = await calc_server.start(host, port, unix_path)
+
+  where = unix_path if unix_path is not None else f"{host}:{port}"
+  print(f"Calculator server listening on {where} with {workers} + {light_workers} workers", file = sys.stderr, flush = True)
+
+  try:
+    async with server:
+      await server.serve_forever()
+  finally:
+    calc_server.close()
+
+
+
+if __name__ == "__main__":
+  parser = argparse.ArgumentParser(description = "A JSON-RPC server for the matrix calculator")
+  parser.add_argument("--host", default = DEFAULT_HOST, help = f"address to listen on (default: {DEFAULT_HOST})")
+  parser.add_argument("--port", type = int, default = DEFAULT_PORT, help = f"port to listen on (default: {DEFAULT_PORT})")
+  parser.add_argument("--unix", metavar = "PATH", help = "listen on the Unix socket PATH instead of a port")
+  parser.add_argument("--workers", metavar = "N", type = int, default = os.cpu_count() or 1,
+                      help = "number of worker processes for gj, inv, det, bas and ind (default: the number of CPUs)")
+  parser.add_argument("--light-workers", metavar = "N", type = int, default = DEFAULT_LIGHT_WORKERS,
+                      help = f"number of worker processes for the other operations (default: {DEFAULT_LIGHT_WORKERS})")
+  parser.add_argument("--max-queue", metavar = "N", type = int, default = DEFAULT_MAX_QUEUE,
+                      help = f"number of requests of each kind that may wait for a worker (default: {DEFAULT_MAX_QUEUE})")
+  parser.add_argument("--timeout", metavar = "SECONDS", type = float, default = DEFAULT_TIMEOUT,
+                      help = f"seconds a request may take, unless it gives its own (default: {DEFAULT_TIMEOUT})")
+  args = parser.parse_args()
+
+  try:
+    workers = validate.validate_nat(args.workers)
+    light_workers = validate.validate_nat(args.light_workers)
+    max_queue = validate.validate_nat(args.max_queue)
+  except errors.CalculatorError as e:
+    print(e.message.strip(), file = sys.stderr)
+    sys.exit(1)
+
+  try:
+    asyncio.run(serve(args.host, args.port, args.unix, workers, max_queue, args.timeout, light_workers))
+  except KeyboardInterrupt:
+    pass
@@ -0,0 +1,503 @@
+import dense
+import fraction as frac
+import errors
+from typing import List, Optional, Set, Tuple, Union
+
+# Entry: an entry stored as integers, as in 'dense.DenseMatrix.tuple_at'
+Entry = Tuple[int, ...]
+
+
+# t_is_zero(a) Determines if the entry 'a' is 0
+def t_is_zero(a: Entry) -> bool:
+  return (not a[0]) and (len(a) == 2 or not a[2])
+
+
+# t_multiply(a, b) Computes a * b for the entries 'a' and 'b'
+def t_multiply(a: Entry, b: Entry) -> Entry:
+  if (len(a) == 2):
+    return dense.r_multiply(a[0], a[1], b[0], b[1])
+  else:
+    return dense.c_multiply(a, b)
+
+
+# t_sub_product(a, factor, b) Computes a - factor * b for the entries 'a',
+#   'factor' and 'b'
+def t_sub_product(a: Entry, factor: Entry, b: Entry) -> Entry:
+  if (len(a) == 2):
+    return dense.r_sub_product(a[0], a[1], factor[0], factor[1], b[0], b[1])
+
+  product = dense.c_multiply(factor, b)
+  return dense.r_add(a[0], a[1], -product[0], product[1]) + dense.r_add(a[2], a[3], -product[2], product[3])
+
+
+# t_reciprocal(a) Computes 1 / a for the entry 'a'
+# requires: 'a' is not 0
+def t_reciprocal(a: Entry) -> Entry:
+  if (len(a) == 2):
+    return dense.r_reduce(a[1], a[0])
+  else:
+    return dense.c_reciprocal(a)
+
+
+# t_negate(a) Computes -a for the entry 'a'
+def t_negate(a: Entry) -> Entry:
+  if (len(a) == 2):
+    return (-a[0], a[1])
+  else:
+    return (-a[0], a[1], -a[2], a[3])
+
+
+# permutation_sign(perm) Gets 1 if the permutation 'perm' of 0 to len(perm) - 1
+#   is even and -1 if it is odd
+def permutation_sign(perm: List[int]) -> int:
+  sign = 1
+  seen = [False] * len(perm)
+
+  for start in range(len(perm)):
+    if (seen[start]):
+      continue
+
+    # a cycle of length k is made of k - 1 swaps
+    length = 0
+    i = start
+    while (not seen[i]):
+      seen[i] = True
+      i = perm[i]
+      length += 1
+
+    if (length % 2 == 0):
+      sign = -sign
+
+  return sign
+
+
+
+# SparseMatrix: A matrix that only stores its non-zero entries, as integer
+#   numerators and denominators in a dictionary for each row
+# note: 'col_rows[j]' is the set of rows with a non-zero entry in column 'j',
+#         so the rows that a pivot needs to be eliminated from are found
+#         without visiting the 0s of its column
+#       the answers are stored apart from the coefficients
+class SparseMatrix:
+  def __init__(self, rows: int, cols: int, num_type: frac.NumberType, augumented: bool = True):
+    self.rows = rows
+    self.cols = cols
+    self.num_type = num_type
+    self.augumented = augumented
+    self.pivots = 0
+    self.pivot_vects = []
+
+    self.entries = [{} for _ in range(rows)]
+    self.answers = [self.zero()] * rows
+    self.col_rows = [set() for _ in range(cols)]
+
+
+  # is_square() Determines if the matrix is a square matrix
+  def is_square(self) -> bool:
+    return (self.rows == self.cols)
+
+
+  # is_complex() Determines if the entries of the matrix are complex fractions
+  def is_complex(self) -> bool:
+    return (self.num_type == frac.NumberType.ComplexNum.value)
+
+
+  # zero() Gets 0 stored as an entry of the matrix
+  def zero(self) -> Entry:
+    return (0, 1, 0, 1) if self.is_complex() else (0, 1)
+
+
+  # one() Gets 1 stored as an entry of the matrix
+  def one(self) -> Entry:
+    return (1, 1, 0, 1) if self.is_complex() else (1, 1)
+
+
+  # nnz() Gets the number of non-zero coefficients
+  def nnz(self) -> int:
+    return sum(len(r) for r in self.entries)
+
+
+  # copy() Makes a copy of the matrix
+  def copy(self) -> "SparseMatrix":
+    result = SparseMatrix(self.rows, self.cols, self.num_type, self.augumented)
+    result.entries = [r.copy() for r in self.entries]
+    result.answers = self.answers.copy()
+    result.col_rows = [s.copy() for s in self.col_rows]
+    return result
+
+
+  # get_tuple(row, col) Gets the entry at 'row' and 'col' as integers
+  # requires: 0 <= row < self.rows
+  #           0 <= col <= self.cols, where col = self.cols is the answer
+  def get_tuple(self, row: int, col: int) -> Entry:
+    if (col == self.cols):
+      return self.answers[row]
+
+    return self.entries[row].get(col, self.zero())
+
+
+  # set_tuple(row, col, value) Stores the entry 'value' at 'row' and 'col'
+  # requires: 0 <= row < self.rows
+  #           0 <= col <= self.cols, where col = self.cols is the answer
+  # effects: modifies the storage of the matrix
+  def set_tuple(self, row: int, col: int, value: Entry):
+    if (col == self.cols):
+      self.answers[row] = value
+    elif (t_is_zero(value)):
+      self.entries[row].pop(col, None)
+      self.col_rows[col].discard(row)
+    else:
+      self.entries[row][col] = value
+      self.col_rows[col].add(row)
+
+
+  # entry(row, col) Gets the entry at 'row' and 'col'
+  # requires: 0 <= row < self.rows
+  #           0 <= col <= self.cols, where col = self.cols is the answer
+  def entry(self, row: int, col: int) -> Union[frac.RealFraction, frac.ComplexFraction]:
+    return from_tuple(self.get_tuple(row, col))
+
+
+  # set_entry(row, col, value) Stores 'value' at 'row' and 'col'
+  # requires: 0 <= row < self.rows
+  #           0 <= col <= self.cols, where col = self.cols is the answer
+  # effects: modifies the storage of the matrix
+  def set_entry(self, row: int, col: int, value: Union[frac.RealFraction, frac.ComplexFraction]):
+    self.set_tuple(row, col, to_tuple(value, self.is_complex()))
+
+
+  # get_row(row) Gets all the coefficients in 'row'
+  # requires: 0 <= row < self.rows
+  def get_row(self, row: int) -> Union[List[frac.RealFraction], List[frac.ComplexFraction]]:
+    return [self.entry(row, j) for j in range(self.cols)]
+
+
+  # scale_row(row, factor) Multiplies every entry in 'row' by 'factor'
+  # effects: modifies the storage of the matrix
+  def scale_row(self, row: int, factor: Entry):
+    current_row = self.entries[row]
+    for col in current_row:
+      current_row[col] = t_multiply(factor, current_row[col])
+
+    self.answers[row] = t_multiply(factor, self.answers[row])
+
+
+  # subtract_row(row, factor, pivot_row) Computes row - factor * pivot_row
+  #   and stores the result in 'row'
+  # effects: modifies the storage of the matrix
+  # note: only the non-zero entries of 'pivot_row' are visited
+  def subtract_row(self, row: int, factor: Entry, pivot_row: int):
+    target = self.entries[row]
+    zero = self.zero()
+
+    for col, value in list(self.entries[pivot_row].items()):
+      result = t_sub_product(target.get(col, zero), factor, value)
+      if (t_is_zero(result)):
+        if (col in target):
+          del target[col]
+          self.col_rows[col].discard(row)
+      else:
+        if (col not in target):
+          self.col_rows[col].add(row)
+        target[col] = result
+
+    if (not t_is_zero(self.answers[pivot_row])):
+      self.answers[row] = t_sub_product(self.answers[row], factor, self.answers[pivot_row])
+
+
+  # reorder(order) Moves the row 'order[i]' to row 'i' for each i
+  # requires: 'order' is a permutation of 0 to self.rows - 1
+  # effects: modifies the storage of the matrix
+  def reorder(self, order: List[int]):
+    self.entries = [self.entries[i] for i in order]
+    self.answers = [self.answers[i] for i in order]
+
+    self.col_rows = [set() for _ in range(self.cols)]
+    for i in range(self.rows):
+      for col in self.entries[i]:
+        self.col_rows[col].add(i)
+
+
+  # row_is_trivial(row, check_right) Determines whether all the coefficients
+  #   of 'row' are 0
+  def row_is_trivial(self, row: int, check_right: bool = False) -> bool:
+    if (self.entries[row]):
+      return False
+
+    return (not check_right) or t_is_zero(self.answers[row])
+
+
+  # sparse_err(err_code) error message about the sparse matrix
+  # requires: 1 <= err_code <= 3
+  # effects: raises an 'errors.MatrixError'
+  def sparse_err(self, err_code: int, row: int = 0):
+    message = "ERROR: "
+    if (err_code == 1):
+      message += f"Equation {row + 1} is not consistent"
+    elif (err_code == 2):
+      message += "The Following Matrix is not a square matrix"
+    elif (err_code == 3):
+      message += "The Following Matrix is Singular (Not Invertible)"
+
+    raise errors.MATRIX_ERRORS[err_code](f"{message}\n{errors.printed(self.print_matrix)}", err_code)
+
+
+  # markowitz_pivot(active_rows, active_cols, leftmost) Chooses the next pivot
+  #   among the rows in 'active_rows' and the columns in 'active_cols'
+  # note: picks the non-zero entry at row i and column j with the smallest
+  #         (r_i - 1)(c_j - 1), where r_i and c_j are the number of non-zero
+  #         entries left in row i and column j, which bounds the number of 0s
+  #         that become non-zero when the pivot is eliminated
+  #       if 'leftmost' is True, the pivot is taken from the leftmost column
+  #         that still has a non-zero entry, from the row with the fewest
+  #         non-zero entries
+  #       returns (row, col), or None if every entry left is 0
+  def markowitz_pivot(self, active_rows: Set[int], active_cols: Set[int],
+                      leftmost: bool = False) -> Optional[Tuple[int, int]]:
+    if (leftmost):
+      for col in sorted(active_cols):
+        candidates = [i for i in self.col_rows[col] if i in active_rows]
+        if (candidates):
+          return (min(candidates, key = lambda i: (len(self.entries[i]), i)), col)
+
+      return None
+
+    col_counts = {}
+    best = None
+    best_cost = None
+
+    for row in sorted(active_rows, key = lambda i: (len(self.entries[i]), i)):
+      row_count = len(self.entries[row])
+      if (not row_count):
+        continue
+
+      # every row left has at least as many entries
+      if (best_cost is not None and best_cost <= 0):
+        break
+
+      for col in sorted(self.entries[row]):
+        if (col not in col_counts):
+          col_counts[col] = sum(1 for i in self.col_rows[col] if i in active_rows)
+
+        cost = (row_count - 1) * (col_counts[col] - 1)
+        if (best_cost is None or cost < best_cost):
+          best = (row, col)
+          best_cost = cost
+
+    return best
+
+
+  # eliminate(companion, jordan, leftmost) Eliminates the matrix one pivot at
+  #   a time, with the pivots chosen by 'markowitz_pivot'
+  # effects: modifies the storage of the matrix and of 'companion'
+  # note: the rows are not swapped, each pivot stays in its own row
+  #       if 'jordan' is True, each pivot row is scaled so the pivot is 1 and
+  #         the pivot is eliminated from every other row, otherwise it is only
+  #         eliminated from the rows that have no pivot yet
+  #       every row operation is also applied to 'companion'
+  #       returns (row, col, pivot) for each pivot, in the order they were used
+  def eliminate(self, companion: Optional["SparseMatrix"] = None, jordan: bool = True,
+                leftmost: bool = False) -> List[Tuple[int, int, Entry]]:
+    active_rows = set(range(self.rows))
+    active_cols = set(range(self.cols))
+    pivots = []
+
+    while (active_rows and active_cols):
+      found = self.markowitz_pivot(active_rows, active_cols, leftmost)
+      if (found is None):
+        break
+
+      row, col = found
+      pivot = self.entries[row][col]
+      inverse_pivot = t_reciprocal(pivot)
+      active_rows.discard(row)
+      active_cols.discard(col)
+
+      if (jordan):
+        self.scale_row(row, inverse_pivot)
+        if (companion is not None):
+          companion.scale_row(row, inverse_pivot)
+        targets = sorted(self.col_rows[col] - {row})
+      else:
+        targets = sorted(i for i in self.col_rows[col] if i in active_rows)
+
+      for i in targets:
+        factor = self.entries[i][col]
+        if (not jordan):
+          factor = t_multiply(factor, inverse_pivot)
+
+        self.subtract_row(i, factor, row)
+        if (companion is not None):
+          companion.subtract_row(i, factor, row)
+
+      pivots.append((row, col, pivot))
+
+    return pivots
+
+
+  # gauss_jordan(get_inv, verbose, companion) Reduces the matrix to its reduced
+  #   row echelon form
+  # requires: 'companion' has the same number of rows as the matrix
+  # effects: modifies the storage of the matrix and of 'companion'
+  #          may print output
+  # note: every row operation is also applied to 'companion', which starts as
+  #         the identity matrix when 'get_inv' is True and none is given, so
+  #         that the inverse is returned
+  #       the inverse is found with the pivots chosen by 'markowitz_pivot',
+  #         otherwise the pivots are taken from left to right so that the
+  #         result is in reduced row echelon form
+  def gauss_jordan(self, get_inv: bool = False, verbose: bool = True,
+                   companion: "SparseMatrix" = None) -> "SparseMatrix":
+    inverse = companion
+    if (get_inv):
+      if (not self.is_square() or self.augumented):
+        self.sparse_err(2)
+      if (inverse is None):
+        inverse = identity(self.rows, self.num_type)
+
+    if (verbose):
+      print("\n------- Gauss-Jordan (Sparse) ---------\n")
+      self.print_matrix()
+
+    pivots = self.eliminate(inverse, True, not get_inv)
+    pivots.sort(key = lambda p: p[1])
+
+    # the pivot rows go on top, from the leftmost pivot to the rightmost
+    pivot_rows = [p[0] for p in pivots]
+    used = set(pivot_rows)
+    order = pivot_rows + [i for i in range(self.rows) if i not in used]
+    self.reorder(order)
+    if (inverse is not None):
+      inverse.reorder(order)
+
+    self.pivots = len(pivots)
+    self.pivot_vects = [p[1] for p in pivots]
+
+    for i in range(self.pivots, self.rows):
+      if (not self.row_is_trivial(i, True)):
+        self.sparse_err(1, i)
+
+    if (get_inv and self.pivots != self.rows):
+      self.sparse_err(3)
+
+    if (verbose):
+      print()
+      self.print_matrix()
+
+    return inverse
+
+
+  # rank() Computes the rank of the matrix
+  def rank(self) -> int:
+    return len(self.copy().eliminate(None, False))
+
+
+  # det() Computes the determinant of the matrix
+  # effects: may raise an 'errors.CalculatorError'
+  # note: the determinant is the product of the pivots, with the sign of
+  #         the permutations of the rows and the columns that the pivots
+  #         were taken in
+  def det(self) -> Union[frac.RealFraction, frac.ComplexFraction]:
+    if (not self.is_square() or self.augumented):
+      self.sparse_err(2)
+
+    pivots = self.copy().eliminate(None, False)
+    if (len(pivots) < self.rows):
+      return from_tuple(self.zero())
+
+    result = self.one()
+    for p in pivots:
+      result = t_multiply(result, p[2])
+
+    sign = permutation_sign([p[0] for p in pivots]) * permutation_sign([p[1] for p in pivots])
+    if (sign < 0):
+      result = t_negate(result)
+
+    return from_tuple(result)
+
+
+  # solve(b) Solves Ax = b for x, where A is the matrix
+  # requires: 'b' has an entry for each row of A
+  # effects: may raise an 'errors.CalculatorError'
+  # note: if no 'b' is given, the answers of the matrix are used
+  def solve(self, b: Optional[Union[List[frac.RealFraction], List[frac.ComplexFraction]]] = None) -> Union[List[frac.RealFraction], List[frac.ComplexFraction]]:
+    if (not self.is_square()):
+      self.sparse_err(2)
+
+    system = self.copy()
+    if (b is not None):
+      system.answers = [to_tuple(x, self.is_complex()) for x in b]
+
+    pivots = system.eliminate(None, True)
+    if (len(pivots) < self.rows):
+      self.sparse_err(3)
+
+    x = [None] * self.cols
+    for row, col, _ in pivots:
+      x[col] = from_tuple(system.answers[row])
+
+    return x
+
+
+  # print_matrix() Prints out the matrix
+  # effects: prints output
+  def print_matrix(self):
+    for i in range(self.rows):
+      for j in range(self.cols):
+        self.entry(i, j).print_frac()
+        if (j < self.cols - 1):
+          print(" , ", end="")
+
+      if (self.augumented):
+        print("\t|\t", end="")
+        self.entry(i, self.cols).print_frac()
+      print("")
+
+
+
+# to_tuple(value, is_complex) Stores the fraction 'value' as integers
+def to_tuple(value: Union[frac.RealFraction, frac.ComplexFraction], is_complex: bool) -> Entry:
+  if (is_complex):
+    return (value.r.num, value.r.denom, value.i.num, value.i.denom)
+  else:
+    return (value.num, value.denom)
+
+
+# from_tuple(value) Makes the fraction stored as the integers in 'value'
+def from_tuple(value: Entry) -> Union[frac.RealFraction, frac.ComplexFraction]:
+  real_part = frac.make_real(value[0], value[1])
+
+  if (len(value) == 4):
+    return frac.ComplexFraction(real_part, frac.make_real(value[2], value[3]), True)
+  else:
+    return real_part
+
+
+# identity(size, num_type) Makes the sparse identity matrix with 'size' rows
+def identity(size: int, num_type: frac.NumberType) -> SparseMatrix:
+  result = SparseMatrix(size, size, num_type, False)
+  for i in range(size):
+    result.set_tuple(i, i, result.one())
+
+  return result
+
+
+# from_rows(rows, answers, num_type, augumented) Makes a SparseMatrix from the
+#   lists of coefficients in 'rows' and the answers in 'answers'
+# requires: 'rows' is not empty and every row has the same length
+# note: only the non-zero coefficients are stored
+def from_rows(rows: Union[List[List[frac.RealFraction]], List[List[frac.ComplexFraction]]],
+              answers: List[Union[frac.RealFraction, frac.ComplexFraction]],
+              num_type: frac.NumberType, augumented: bool = True) -> SparseMatrix:
+  result = SparseMatrix(len(rows), len(rows[0]), num_type, augumented)
+  is_complex = result.is_complex()
+
+  for i in range(len(rows)):
+    for j in range(len(rows[i])):
+      if (not rows[i][j].is_zero()):
+        result.set_tuple(i, j, to_tuple(rows[i][j], is_complex))
+
+    if (augumented and answers):
+      result.set_tuple(i, result.cols, to_tuple(answers[i], is_complex))
+
+  return result
@@ -1,12 +1,18 @@
-import sys
 import enum
-import string as StringTools
+import errors
+import string_tools as StringTools
 from typing import Any, List, Optional
 
 ERRORS = {1: "The input ({input}) is not {type_article} {type}",
           10: "The input ({input}) is not in between {left} and {right}",
           2: "Denominator of {fraction_type} Fraction Cannot be 0",
-          3: "The Number of Coefficients Does not Match the Entered Number of Columns"}
+          3: "The Number of Coefficients Does not Match the Entered Number of Columns",
+          4: "NumPy needs to be installed to use the numeric fields (NR, NC)",
+          5: "The job ({job}) does not have {value}"}
+
+# ERROR_TYPES: the error raised for each code in ERRORS that is not
+#   an 'errors.InputError'
+ERROR_TYPES = {2: errors.ZeroDenominatorError, 4: errors.MissingDependencyError}
 
 
 # DataTypes: type for a parameter
@@ -16,9 +22,9 @@ class DataTypes(enum.Enum):
   Float = "Float"
 
 
-# validation_error(code) Displays an error
+# validation_error(code) Raises the error
 #   for the entered parameter
-# effects: ends the program once the error has been displayed
+# effects: raises an 'errors.CalculatorError'
 def validation_error(code: int, **kwargs):
   # creates the dictionary to replace all temporary values in the error message
   error_message = ERRORS[code]
@@ -29,15 +35,12 @@ def validation_error(code: int, **kwargs):
 
   error_message = StringTools.word_replace(error_message, kwargs)
 
-  # prints the error message
-  print(f"\nERROR:")
-  print(error_message)
-  sys.exit()
+  raise ERROR_TYPES.get(code, errors.InputError)(f"\nERROR:\n{error_message}", code)
 
 
 # validate_int(param) Checks whether 'param' is an
 #   integer
-# effects: ends the program if 'param' is not an integer
+# effects: raises an 'errors.InputError' if 'param' is not an integer
 def validate_int(param: Any) -> int:
   try:
     param = int(param)
@@ -49,7 +52,7 @@ def validate_int(param: Any) -> int:
 
 # validate_nat(param) Checks whether 'param' is a
 #   natural number
-# effects: ends the program if 'param' is not a natural number
+# effects: raises an 'errors.InputError' if 'param' is not a natural number
 # note: a natural number is an integer bigger or equal to 1
 def validate_nat(param: Any) -> int:
   param = validate_int(param)
@@ -62,7 +65,7 @@ def validate_nat(param: Any) -> int:
 
 # validate_nat(param) Checks whether 'param' is a
 #   floating decimal point
-# effects: ends the program if 'param' is not a float
+# effects: raises an 'errors.InputError' if 'param' is not a float
 def validate_float(param: Any) -> float:
   try:
     param = float(param)
@@ -93,7 +96,7 @@ def validate_inbetween(param: Any, left: Any, right: Any, inclusive: bool = True
     in_between = (param > left and param <  right)
 
   if (not in_between):
-    validation_error(2, input = str(param), left = str(left), right = str(right))
+    validation_error(10, input = str(param), left = str(left), right = str(right))
   else:
     return in_between
 
@@ -103,7 +106,7 @@ def validate_inbetween(param: Any, left: Any, right: Any, inclusive: bool = True
 # required: all elements in 'specific_vals' are in lowercase
 # note: a field is a string with either the letters, "r" or "c" 
 #        (Case does not matter)
-# effects: may end the program if 'param' is not a field
+# effects: may raise an 'errors.InputError' if 'param' is not a field
 def validate_str(param: Any, specific_vals = Optional[List[str]]) -> str:
   type_article = "a"
   type = "string"
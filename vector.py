@@ -1,35 +1,38 @@
 import fraction as frac
-import complex as comp
+import dense
 from typing import List, Union
 
 # dot_product(a, b, num_type) Computes the dot product of the vectors 
 #   'a' and 'b'
+# note: the products are summed over a running common denominator and the
+#         sum is only reduced once at the end
+#       if 'conj' is True, the conjugate of each entry of 'b' is used
+#         without changing 'b'
 def dot_product(a: Union[List[frac.RealFraction], List[frac.ComplexFraction]],
                 b: Union[List[frac.RealFraction], List[frac.ComplexFraction]], 
                 num_type: frac.NumberType, conj: bool = True) -> Union[frac.RealFraction, frac.ComplexFraction]:
-  real_num = frac.NumberType.RealNum.value
-  complex_num = frac.NumberType.ComplexNum.value
+  real_num, real_denom = 0, 1
 
-  if (num_type == real_num):
-    result = frac.RealFraction(0,1)
-  elif (num_type == complex_num):
-    result = frac.ComplexFraction(comp.Complex_Num(0,0), comp.Complex_Num(1, 0))
+  if (num_type == frac.NumberType.RealNum.value):
+    for x, y in zip(a, b):
+      if (x.num and y.num):
+        real_num, real_denom = dense.accumulate(real_num, real_denom, x.num * y.num, x.denom * y.denom)
 
-  for i in range(len(a)):
-    if (num_type == real_num):
-      temp_product = frac.rf_multiply(a[i], b[i])
-      result = frac.rf_add(result, temp_product, "+")
+    return frac.reduce_real(real_num, real_denom)
 
-    elif(num_type == complex_num):
-      if (conj):
-        temp_a = a[i]
-        temp_b = b[i]
-        temp_b.conjugate()
+  im_num, im_denom = 0, 1
+  sign = -1 if conj else 1
 
-        temp_product = frac.cf_multiply(temp_a, temp_b)
-        result = frac.cf_add(result, temp_product, "+")
-      else:
-        temp_product = frac.cf_multiply(a[i], b[i])
-        result = frac.cf_add(result, temp_product, "+")
+  for x, y in zip(a, b):
+    if (x.is_zero() or y.is_zero()):
+      continue
 
-  return result
+    # both parts of each product share the denominator x.denom * y.denom
+    #   (x_r + x_i i)(y_r + y_i i) = (x_r y_r - x_i y_i) + (x_r y_i + x_i y_r) i
+    product_denom = x.denom * y.denom
+    real_num, real_denom = dense.accumulate(real_num, real_denom,
+                                            x.re_num * y.re_num - sign * x.im_num * y.im_num, product_denom)
+    im_num, im_denom = dense.accumulate(im_num, im_denom,
+                                        sign * x.re_num * y.im_num + x.im_num * y.re_num, product_denom)
+
+  return frac.complex_from_parts(frac.reduce_real(real_num, real_denom), frac.reduce_real(im_num, im_denom))